@@ -0,0 +1,119 @@
+"""
+Controle de admissão por orçamento de memória para extrações simultâneas, e timeout
+adaptado ao tamanho do documento.
+
+O pdfplumber usa memória proporcional às páginas e à densidade de objetos do PDF; com
+vários PDFs enormes ao mesmo tempo a RAM pode acabar mesmo com a média pequena. Cada
+trabalho tem a memória estimada por páginas e bytes; só entra no pool se a soma do que
+está em execução (o maior entre o reservado e o RSS medido dos workers) mais a estimativa
+couber em ORCAMENTO_MEMORIA_MB. Um trabalho sozinho sempre é admitido (sem impasse).
+"""
+
+import os
+from typing import Iterable, Optional
+
+try:
+    import psutil
+    PSUTIL_DISPONIVEL = True
+except ImportError:
+    PSUTIL_DISPONIVEL = False
+
+# ============================================================================
+# CONFIGURAÇÕES
+# ============================================================================
+
+ORCAMENTO_MEMORIA_MB = None  # None = FRACAO_RAM_ORCAMENTO da RAM física
+FRACAO_RAM_ORCAMENTO = 0.6
+ORCAMENTO_MEMORIA_PADRAO_MB = 4096  # Se não der para descobrir a RAM física
+MEMORIA_BASE_MB = 60  # Por extração, além das páginas
+MEMORIA_MB_POR_PAGINA = 0.5
+MEMORIA_MB_POR_MB_ARQUIVO = 3.0  # PDFs densos (muitos objetos por página) pesam pelo tamanho
+
+TIMEOUT_MINIMO_SEGUNDOS = 120  # Piso padrão; analisar_pdfs.py usa TIMEOUT_PDF_SEGUNDOS (o adaptativo só aumenta o timeout fixo)
+TIMEOUT_MAXIMO_SEGUNDOS = 1800
+FOLGA_TIMEOUT = 10  # Timeout = FOLGA_TIMEOUT x tempo estimado pelo modelo de custo
+
+# ============================================================================
+# ESTIMATIVAS
+# ============================================================================
+
+def estimar_memoria_mb(paginas: Optional[int], tamanho_bytes: int) -> float:
+    """Memória estimada (MB) para extrair `paginas` páginas de um PDF de `tamanho_bytes`."""
+    mb_arquivo = tamanho_bytes / (1024 * 1024)
+    por_paginas = MEMORIA_MB_POR_PAGINA * paginas if paginas else 0.0
+    return MEMORIA_BASE_MB + max(por_paginas, MEMORIA_MB_POR_MB_ARQUIVO * mb_arquivo)
+
+def timeout_adaptativo(
+    custo_estimado_segundos: Optional[float],
+    minimo_segundos: Optional[float] = None
+) -> Optional[float]:
+    """
+    Timeout proporcional ao custo estimado, entre `minimo_segundos` (padrão
+    TIMEOUT_MINIMO_SEGUNDOS) e TIMEOUT_MAXIMO_SEGUNDOS (None sem estimativa).
+    """
+    if custo_estimado_segundos is None:
+        return None
+    minimo = minimo_segundos if minimo_segundos is not None else TIMEOUT_MINIMO_SEGUNDOS
+    return min(max(TIMEOUT_MAXIMO_SEGUNDOS, minimo), max(minimo, FOLGA_TIMEOUT * custo_estimado_segundos))
+
+def memoria_fisica_mb() -> Optional[float]:
+    """RAM física total em MB (None se não for possível descobrir)."""
+    if PSUTIL_DISPONIVEL:
+        return psutil.virtual_memory().total / (1024 * 1024)
+    try:
+        return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES") / (1024 * 1024)
+    except (AttributeError, ValueError, OSError):
+        return None
+
+def rss_processos_mb(pids: Iterable[int]) -> Optional[float]:
+    """Soma do RSS (MB) dos processos; None se não houver como medir (sem psutil nem /proc)."""
+    total = 0
+    medido = False
+    for pid in pids:
+        try:
+            if PSUTIL_DISPONIVEL:
+                total += psutil.Process(pid).memory_info().rss
+            else:
+                with open(f"/proc/{pid}/statm", "r") as f:
+                    total += int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+            medido = True
+        except Exception:
+            continue  # Processo terminou ou não há /proc (Windows sem psutil)
+    return total / (1024 * 1024) if medido else None
+
+# ============================================================================
+# CONTROLE DE ADMISSÃO
+# ============================================================================
+
+class ControleAdmissao:
+    """Reserva memória estimada por trabalho e decide se o próximo cabe no orçamento."""
+
+    def __init__(self, orcamento_mb: Optional[float] = None):
+        if orcamento_mb is None:
+            orcamento_mb = ORCAMENTO_MEMORIA_MB
+        if orcamento_mb is None:
+            fisica = memoria_fisica_mb()
+            orcamento_mb = FRACAO_RAM_ORCAMENTO * fisica if fisica else ORCAMENTO_MEMORIA_PADRAO_MB
+        self.orcamento_mb = orcamento_mb
+        self.reservado_mb = 0.0
+        self.em_execucao = 0
+        self.retencoes = 0  # Quantos trabalhos esperaram por memória (cada um conta uma vez)
+
+    def cabe(self, necessidade_mb: float, rss_workers_mb: Optional[float] = None) -> bool:
+        """True se o trabalho cabe agora (sempre True se nada estiver em execução)."""
+        if self.em_execucao == 0:
+            return True
+        em_uso = max(self.reservado_mb, rss_workers_mb or 0.0)
+        return em_uso + necessidade_mb <= self.orcamento_mb
+
+    def reter(self):
+        """Registra um trabalho que passou a esperar memória (não a cada nova consulta a cabe)."""
+        self.retencoes += 1
+
+    def reservar(self, necessidade_mb: float):
+        self.reservado_mb += necessidade_mb
+        self.em_execucao += 1
+
+    def liberar(self, necessidade_mb: float):
+        self.reservado_mb = max(0.0, self.reservado_mb - necessidade_mb)
+        self.em_execucao = max(0, self.em_execucao - 1)
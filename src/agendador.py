@@ -0,0 +1,142 @@
+"""
+Agendamento por custo: estima o custo de cada PDF (tamanho + páginas) e despacha
+na ordem LPT (longest-processing-time-first) para reduzir a cauda em execuções paralelas.
+O custo real de cada PDF é registrado em disco e melhora as estimativas seguintes.
+"""
+
+import os
+import json
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from inventario import SEGUNDOS_POR_PAGINA_ESTIMADO
+
+# ============================================================================
+# CONFIGURAÇÕES
+# ============================================================================
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+ARQUIVO_HISTORICO_CUSTOS = str(_PROJECT_ROOT / "data" / "cache" / "custos_pdfs.json")
+LIMIAR_PAGINAS_GIGANTE = 300  # PDFs com mais páginas que isso são despachados antes de todos
+LIMIAR_BYTES_GIGANTE = 40 * 1024 * 1024  # Idem para PDFs sem contagem de páginas
+PAGINAS_POR_BLOCO = 100  # PDFs gigantes são extraídos em blocos deste tamanho por workers diferentes
+MIN_AMOSTRAS_AJUSTE = 5  # Mínimo de PDFs medidos para ajustar o modelo
+
+# ============================================================================
+# MODELO DE CUSTO
+# ============================================================================
+
+class ModeloCusto:
+    """
+    Custo estimado (segundos) = a * páginas + b * MB, ajustado por mínimos quadrados
+    sobre o histórico. Se o PDF exato (mesmo tamanho e mtime) já foi medido, usa a medição.
+    """
+
+    def __init__(self, arquivo: Optional[str] = None):
+        self.arquivo = arquivo or ARQUIVO_HISTORICO_CUSTOS
+        self.historico: Dict[str, Dict] = self._carregar()
+        self.seg_por_pagina = SEGUNDOS_POR_PAGINA_ESTIMADO
+        self.seg_por_mb = 0.0
+        self.ajustado = False  # True se os coeficientes vêm do histórico (e não do padrão)
+        self._ajustar()
+
+    def _carregar(self) -> Dict[str, Dict]:
+        try:
+            with open(self.arquivo, "r", encoding="utf-8") as f:
+                historico = json.load(f)
+            return historico if isinstance(historico, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def _ajustar(self):
+        """Ajusta (a, b) pelas equações normais 2x2; cai para segundos/página se mal condicionado."""
+        amostras = [
+            (h["paginas"], h["tamanho_bytes"] / (1024 * 1024), h["segundos"])
+            for h in self.historico.values()
+            if h.get("paginas") and h.get("segundos") is not None
+        ]
+        if len(amostras) < MIN_AMOSTRAS_AJUSTE:
+            return
+        self.ajustado = True
+
+        spp = sum(p * p for p, _, _ in amostras)
+        spm = sum(p * m for p, m, _ in amostras)
+        smm = sum(m * m for _, m, _ in amostras)
+        sps = sum(p * s for p, _, s in amostras)
+        sms = sum(m * s for _, m, s in amostras)
+        det = spp * smm - spm * spm
+
+        if det > 1e-9:
+            a = (sps * smm - sms * spm) / det
+            b = (spp * sms - spm * sps) / det
+            if a > 0 and b >= 0:
+                self.seg_por_pagina, self.seg_por_mb = a, b
+                return
+
+        total_paginas = sum(p for p, _, _ in amostras)
+        self.seg_por_pagina = sum(s for _, _, s in amostras) / total_paginas
+        self.seg_por_mb = 0.0
+
+    def estimar(self, tarefa: Dict) -> float:
+        """Custo estimado em segundos para um registro do inventário."""
+        medido = self.historico.get(tarefa["caminho"])
+        if (
+            medido is not None
+            and medido.get("tamanho_bytes") == tarefa["tamanho_bytes"]
+            and medido.get("mtime_ns") == tarefa.get("mtime_ns")
+        ):
+            return medido["segundos"]
+
+        mb = tarefa["tamanho_bytes"] / (1024 * 1024)
+        paginas = tarefa.get("paginas")
+        if not paginas:
+            # Sem páginas: converter MB em páginas pela média do histórico (ou ~10 páginas/MB)
+            medidos = [h for h in self.historico.values() if h.get("paginas")]
+            total_mb = sum(h["tamanho_bytes"] for h in medidos) / (1024 * 1024)
+            paginas_por_mb = (sum(h["paginas"] for h in medidos) / total_mb) if total_mb else 10.0
+            paginas = mb * paginas_por_mb
+        return self.seg_por_pagina * paginas + self.seg_por_mb * mb
+
+    def registrar(self, tarefa: Dict, segundos: float):
+        """Registra o custo real de um PDF processado."""
+        self.historico[tarefa["caminho"]] = {
+            "tamanho_bytes": tarefa["tamanho_bytes"],
+            "mtime_ns": tarefa.get("mtime_ns"),
+            "paginas": tarefa.get("paginas"),
+            "segundos": round(segundos, 4),
+        }
+
+    def salvar(self):
+        """Salva o histórico de forma atômica."""
+        os.makedirs(os.path.dirname(self.arquivo), exist_ok=True)
+        tmp = self.arquivo + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.historico, f, ensure_ascii=False)
+        os.replace(tmp, self.arquivo)
+
+# ============================================================================
+# ORDENAÇÃO
+# ============================================================================
+
+def eh_gigante(tarefa: Dict) -> bool:
+    """PDF grande o bastante para ser separado e despachado antes dos demais."""
+    if tarefa.get("paginas"):
+        return tarefa["paginas"] >= LIMIAR_PAGINAS_GIGANTE
+    return tarefa["tamanho_bytes"] >= LIMIAR_BYTES_GIGANTE
+
+def ordenar_lpt(tarefas: List[Dict], modelo: ModeloCusto) -> List[Dict]:
+    """
+    Ordena tarefas em LPT: gigantes primeiro, depois custo estimado decrescente.
+    Preenche "custo_estimado" e "gigante" em cada tarefa.
+    """
+    for tarefa in tarefas:
+        tarefa["custo_estimado"] = modelo.estimar(tarefa)
+        tarefa["gigante"] = eh_gigante(tarefa)
+    return sorted(tarefas, key=lambda t: (not t["gigante"], -t["custo_estimado"]))
+
+def dividir_em_blocos(total_paginas: int, paginas_por_bloco: int) -> List[Tuple[int, int]]:
+    """Divide [0, total_paginas) em blocos (inicio, fim) com fim exclusivo."""
+    return [
+        (inicio, min(inicio + paginas_por_bloco, total_paginas))
+        for inicio in range(0, total_paginas, paginas_por_bloco)
+    ]
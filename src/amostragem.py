@@ -0,0 +1,203 @@
+"""
+Prévia por amostragem: processa uma amostra estratificada dos PDFs e extrapola os
+totais das abas resumo_empresas e evolucao, com intervalos de confiança por bootstrap.
+
+- Estratos: empresa x ano. Em cada estrato são sorteados ceil(fração x N) PDFs
+  (no mínimo MIN_PDFS_POR_ESTRATO), com probabilidade proporcional ao tamanho em bytes
+  (sorteio sem reposição de Efraimidis-Spirakis).
+- Estimador de Hansen-Hurwitz por estrato: total = bytes do estrato x média(ocorrências / bytes)
+  dos PDFs sorteados. Estratos sorteados por inteiro usam a soma exata.
+- IC: bootstrap reamostrando os PDFs dentro de cada estrato (percentis).
+- PDFs sorteados que falharam (erro, timeout) saem da estimativa: o estrato é estimado
+  pelos demais sorteados, em vez de contá-los como zero ocorrências.
+O mesmo `semente` reproduz a amostra e os intervalos.
+"""
+
+import math
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
+import pandas as pd
+
+from inventario import ANOS_VALIDOS
+
+# ============================================================================
+# CONFIGURAÇÕES
+# ============================================================================
+
+FRACAO_AMOSTRA_PADRAO = 0.1
+MIN_PDFS_POR_ESTRATO = 2  # Com 1 PDF por estrato o bootstrap não tem variabilidade
+REPLICAS_BOOTSTRAP = 1000
+NIVEL_CONFIANCA = 0.95
+SEMENTE_PADRAO = 42
+
+# ============================================================================
+# SORTEIO
+# ============================================================================
+
+def _estratos(tarefas: List[Dict]) -> Dict[Tuple[str, str], List[Dict]]:
+    """Agrupa tarefas por (empresa, ano), em ordem estável (para o sorteio ser reproduzível)."""
+    estratos: Dict[Tuple[str, str], List[Dict]] = {}
+    for tarefa in sorted(tarefas, key=lambda t: t["caminho"]):
+        estratos.setdefault((tarefa["empresa"], tarefa["ano"]), []).append(tarefa)
+    return dict(sorted(estratos.items()))
+
+def sortear_amostra(
+    tarefas: List[Dict],
+    fracao: float = FRACAO_AMOSTRA_PADRAO,
+    min_por_estrato: int = MIN_PDFS_POR_ESTRATO,
+    semente: Optional[int] = SEMENTE_PADRAO,
+) -> List[Dict]:
+    """
+    Sorteia PDFs por estrato empresa x ano, com probabilidade proporcional ao tamanho.
+    As tarefas precisam de "tamanho_bytes" (complementar_metadados). Retorna as sorteadas
+    na ordem original, cada uma com "estrato_pdfs" e "estrato_bytes" do seu estrato.
+    """
+    rng = np.random.default_rng(semente)
+    amostra = []
+    for membros in _estratos(tarefas).values():
+        total = len(membros)
+        n = min(total, max(min_por_estrato, math.ceil(fracao * total)))
+        pesos = np.array([max(t.get("tamanho_bytes") or 0, 1) for t in membros], dtype=float)
+        # Chave u^(1/w): os n maiores formam uma amostra ponderada sem reposição
+        chaves = np.log(rng.random(total)) / pesos
+        escolhidos = np.argsort(-chaves, kind="stable")[:n]
+        bytes_estrato = int(pesos.sum())
+        for i in escolhidos:
+            membros[i]["estrato_pdfs"] = total
+            membros[i]["estrato_bytes"] = bytes_estrato
+            amostra.append(membros[i])
+    return sorted(amostra, key=lambda t: t.get("indice", 0))
+
+# ============================================================================
+# EXTRAPOLAÇÃO COM BOOTSTRAP
+# ============================================================================
+
+def _ocorrencias_por_pdf(resultados: List[Dict], grupos: List[str]) -> Dict[str, np.ndarray]:
+    """caminho -> vetor de ocorrências por grupo (PDFs sem linha contam zero)."""
+    posicao = {g: i for i, g in enumerate(grupos)}
+    por_pdf: Dict[str, np.ndarray] = {}
+    for r in resultados:
+        vetor = por_pdf.setdefault(r["pdf_caminho"], np.zeros(len(grupos)))
+        if r["grupo"] in posicao:
+            vetor[posicao[r["grupo"]]] += r["ocorrencias_total_grupo"]
+    return por_pdf
+
+def estimar_estratos(
+    amostra: List[Dict],
+    resultados: List[Dict],
+    grupos: List[str],
+    replicas: int = REPLICAS_BOOTSTRAP,
+    semente: Optional[int] = SEMENTE_PADRAO,
+    falhas: Optional[Set[str]] = None,
+) -> Dict[Tuple[str, str], Dict]:
+    """
+    Para cada estrato (empresa, ano): {"pdfs", "amostrados", "falhas", "estimativa" (G,),
+    "bootstrap" (B, G)} com G = len(grupos) e B = replicas. PDFs da amostra cujo caminho
+    está em `falhas` ficam de fora (não contam como zero); um estrato com todos os sorteados
+    em falha não tem estimativa e fica fora do resultado.
+    """
+    rng = np.random.default_rng(semente)
+    por_pdf = _ocorrencias_por_pdf(resultados, grupos)
+    falhas = falhas or set()
+    zeros = np.zeros(len(grupos))
+
+    estimativas = {}
+    for chave, sorteados in _estratos(amostra).items():
+        total = sorteados[0]["estrato_pdfs"]
+        bytes_estrato = sorteados[0]["estrato_bytes"]
+        membros = [t for t in sorteados if t["caminho"] not in falhas]
+        if not membros:
+            continue
+        y = np.array([por_pdf.get(t["caminho"], zeros) for t in membros])
+        x = np.array([max(t.get("tamanho_bytes") or 0, 1) for t in membros], dtype=float)
+        n = len(membros)
+
+        if n == total:
+            estimativa = y.sum(axis=0)
+            bootstrap = np.tile(estimativa, (replicas, 1))
+        else:
+            razoes = y / x[:, None]
+            estimativa = bytes_estrato * razoes.mean(axis=0)
+            sorteio = rng.integers(0, n, size=(replicas, n))
+            bootstrap = bytes_estrato * razoes[sorteio].mean(axis=1)
+
+        estimativas[chave] = {
+            "pdfs": total,
+            "amostrados": n,
+            "falhas": len(sorteados) - n,
+            "estimativa": estimativa,
+            "bootstrap": bootstrap,
+        }
+    return estimativas
+
+def _intervalo(replicas: np.ndarray, nivel: float) -> Tuple[np.ndarray, np.ndarray]:
+    alfa = (1 - nivel) / 2
+    inferior, superior = np.percentile(replicas, [100 * alfa, 100 * (1 - alfa)], axis=0)
+    return inferior, superior
+
+def resumo_estimado(
+    estimativas: Dict[Tuple[str, str], Dict],
+    grupos: List[str],
+    nivel: float = NIVEL_CONFIANCA,
+) -> pd.DataFrame:
+    """Equivalente extrapolado da aba resumo_empresas, com IC por empresa x ano x grupo."""
+    linhas = []
+    for (empresa, ano), e in estimativas.items():
+        inferior, superior = _intervalo(e["bootstrap"], nivel)
+        for g, grupo in enumerate(grupos):
+            linhas.append({
+                "empresa": empresa,
+                "ano": ano,
+                "grupo": grupo,
+                "pdfs_no_estrato": e["pdfs"],
+                "pdfs_amostrados": e["amostrados"],
+                "ocorrencias_estimadas": round(float(e["estimativa"][g]), 1),
+                "ic_inferior": round(float(inferior[g]), 1),
+                "ic_superior": round(float(superior[g]), 1),
+            })
+    return pd.DataFrame(linhas)
+
+def evolucao_estimada(
+    estimativas: Dict[Tuple[str, str], Dict],
+    grupos: List[str],
+    nivel: float = NIVEL_CONFIANCA,
+    anos: Optional[List[str]] = None,
+) -> pd.DataFrame:
+    """
+    Equivalente extrapolado da aba evolucao (ocorrências por ano, deltas e percentuais),
+    com IC dos deltas e percentuais calculados sobre as mesmas réplicas do bootstrap.
+    """
+    anos = anos or ANOS_VALIDOS
+    empresas = sorted({empresa for empresa, _ in estimativas})
+    linhas = []
+    for empresa in empresas:
+        for g, grupo in enumerate(grupos):
+            pontos, replicas = {}, {}
+            for ano in anos:
+                e = estimativas.get((empresa, ano))
+                pontos[ano] = float(e["estimativa"][g]) if e else 0.0
+                replicas[ano] = e["bootstrap"][:, g] if e else None
+            linha = {"empresa": empresa, "grupo": grupo}
+            for ano in anos:
+                linha[f"ocorr_{ano}"] = round(pontos[ano], 1)
+            for anterior, atual in zip(anos, anos[1:]):
+                sufixo = f"{atual[-2:]}_{anterior[-2:]}"
+                n_rep = next((len(r) for r in replicas.values() if r is not None), 1)
+                rep_ant = replicas[anterior] if replicas[anterior] is not None else np.zeros(n_rep)
+                rep_atu = replicas[atual] if replicas[atual] is not None else np.zeros(n_rep)
+
+                delta = rep_atu - rep_ant
+                inferior, superior = _intervalo(delta, nivel)
+                linha[f"delta_{sufixo}"] = round(pontos[atual] - pontos[anterior], 1)
+                linha[f"delta_{sufixo}_ic_inferior"] = round(float(inferior), 1)
+                linha[f"delta_{sufixo}_ic_superior"] = round(float(superior), 1)
+
+                # Mesmo percentual da aba evolucao: atual / anterior x 100 (0 se anterior = 0)
+                pct = np.divide(rep_atu * 100, rep_ant, out=np.zeros_like(rep_atu, dtype=float), where=rep_ant > 0)
+                inferior, superior = _intervalo(pct, nivel)
+                linha[f"pct_{sufixo}"] = round(pontos[atual] / pontos[anterior] * 100, 2) if pontos[anterior] > 0 else 0
+                linha[f"pct_{sufixo}_ic_inferior"] = round(float(inferior), 2)
+                linha[f"pct_{sufixo}_ic_superior"] = round(float(superior), 2)
+            linhas.append(linha)
+    return pd.DataFrame(linhas)
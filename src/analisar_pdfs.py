@@ -2,19 +2,64 @@
 Script para varrer PDFs, contar termos por grupos (IA vs Dados/BI) e gerar Excel com análises.
 """
 
+import io
 import os
 import re
 import json
+import argparse
+import time
+import multiprocessing
+import signal
 import threading
-from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
+from itertools import islice
+from concurrent.futures import (
+    ThreadPoolExecutor, ProcessPoolExecutor, FIRST_COMPLETED, wait, TimeoutError as FuturesTimeoutError
+)
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional, Callable
+from typing import Dict, List, Tuple, Optional, Callable, Union
 
 import pdfplumber
 import pandas as pd
 from tqdm import tqdm
 import unicodedata
 
+from amostragem import (
+    FRACAO_AMOSTRA_PADRAO, NIVEL_CONFIANCA, REPLICAS_BOOTSTRAP, SEMENTE_PADRAO,
+    estimar_estratos, evolucao_estimada, resumo_estimado, sortear_amostra
+)
+from admissao import ControleAdmissao, estimar_memoria_mb, rss_processos_mb, timeout_adaptativo
+from agendador import PAGINAS_POR_BLOCO, ModeloCusto, dividir_em_blocos, ordenar_lpt
+from cancelamento import (
+    INTERVALO_VERIFICACAO_SEGUNDOS, ControleExecucao, ExecucaoCancelada, configurar_controle, ponto_de_parada,
+    segundos_em_pausa,
+)
+from checkpoint import (
+    ARQUIVO_DIARIO, CONFIGURACOES_SAIDA, DiarioResultados, configuracao_saida, hash_configuracao,
+    registro_falhou_para, registro_vale_para,
+)
+from coocorrencia import COLUNAS_COOCORRENCIA, calcular_coocorrencia
+from dicionario import (
+    ARQUIVO_DICIONARIO, VERSAO_COMPILADOR, carregar_dicionario, carregar_matcher, compilar_dicionario,
+    hash_dicionario, resolver_verificacoes,
+)
+from idioma import IDIOMA_INDETERMINADO, detectar_idioma
+from indice import calcular_indice_documentos, calcular_indice_empresa_ano
+from inventario import complementar_metadados, identificar_empresa_ano
+from ocr import (
+    IDIOMAS_OCR, OCR_DISPONIVEL, MAX_OCR_SIMULTANEOS, PAGINA_IMAGEM, PAGINA_VAZIA,
+    classificar_pagina, configurar_semaforo_ocr, ocr_paginas,
+)
+from metricas import MetricasExecucao, ServidorMetricas
+from observador import ObservadorPasta
+from paginas import contar_por_pagina, gerar_aba_top_paginas, tabela_paginas
+from perfil import ARQUIVO_PERFIL_CSV, TERMO_VARREDURA, PerfilMatcher, carregar_perfis, limpar_perfis
+from prefetch import PrefetcherPDF
+from recorrencia import (
+    MemoriaParagrafos, classificar_recorrencia, dividir_paragrafos, gerar_aba_recorrencia, hash_paragrafo,
+)
+from resultados import TabelaResultados
+from taxonomia import Taxonomia
+
 # Tela de carregamento (tkinter vem com Python no Windows)
 try:
     import tkinter as tk
@@ -33,103 +78,30 @@ ARQUIVO_EXCEL_SAIDA = str(_PROJECT_ROOT / "data" / "analise_termos3.xlsx")
 INCLUIR_PDFS_SEM_OCORRENCIAS = False  # Se True, inclui PDFs com zero ocorrências
 EMPRESA_FILTRO = None  # None = processa todas as empresas, ou nome da empresa (ex: "AMERICANAS")
 TIMEOUT_PDF_SEGUNDOS = 120  # Timeout por PDF (evita travar em arquivos muito grandes ou corrompidos)
+TIMEOUT_ADAPTATIVO = True  # Se True, o timeout acompanha o custo estimado do PDF (ver admissao.py); TIMEOUT_PDF_SEGUNDOS vale sem estimativa
 USAR_TELA_CARREGAMENTO = True  # Se True, mostra janela tkinter com progresso
+DETECTAR_PAGINAS_IMAGEM = True  # Pula o layout em páginas só-imagem (escaneadas), detectadas pelo content stream
+OCR_HABILITADO = False  # Se True, roda OCR (tesseract) nas páginas só-imagem; requer pytesseract
+CALCULAR_COOCORRENCIA = False  # Se True, guarda coocorrências de termos (janela de tokens e mesma página)
+JANELA_COOCORRENCIA_TOKENS = 50  # Distância máxima (em tokens) para contar dois termos como próximos
+MODO_SOMENTE_CONTAGEM = False  # Se True, não monta exemplos de contexto; guarda só posições (ver renderizar_exemplos_pdf)
+CONTAGEM_POR_PAGINA = False  # Se True, guarda as ocorrências por página de cada termo (coluna ocorrencias_por_pagina e aba top_paginas; ver paginas.py)
+MAX_EXEMPLOS_POR_TERMO = 3  # Exemplos de contexto (ou posições, no modo só contagem) guardados por termo
+ARQUIVO_EXCEL_PREVIA = str(_PROJECT_ROOT / "data" / "previa_amostra.xlsx")  # Saída do modo --previa
+ARQUIVO_DIARIO_PREVIA = str(_PROJECT_ROOT / "data" / "diario_previa.jsonl")
+DETECTAR_TEXTO_RECORRENTE = False  # Se True, só parágrafos novos passam pelo matcher e as menções saem como novas x recorrentes (ver recorrencia.py); não combina com coocorrência/modo só contagem/contagem por página
+PERFIL_MATCHER = False  # Se True, mede custo e seletividade de cada termo/sigla (aba perfil_termos e data/perfil_termos.csv; ver perfil.py)
+DETECTAR_IDIOMA = False  # Se True, detecta o idioma de cada documento e só procura os termos neutros e os desse idioma (seção idiomas do dicionário; ver idioma.py)
+PORTA_METRICAS = None  # Ex.: 9464 serve métricas Prometheus em http://127.0.0.1:9464/metrics durante a varredura (ver metricas.py)
+NUM_WORKERS_PDF = 1  # > 1 processa PDFs em paralelo (processos), despachando os mais caros primeiro
 
 # ============================================================================
 # DICIONÁRIOS DE TERMOS
 # ============================================================================
 
-TERMOS_IA_LLM = {
-    "IA_LLM": [
-        # Guarda-chuva
-        "inteligencia artificial", "artificial intelligence",
-        "ia generativa", "generative ai", "genai",
-        "modelo generativo", "modelos generativos",
-        
-        # Machine Learning / Deep Learning
-        "machine learning", "aprendizado de maquina", "aprendizagem de maquina",
-        "deep learning", "aprendizado profundo",
-        "rede neural", "redes neurais", "neural network", "neural networks",
-        
-        # NLP / Linguagem
-        "processamento de linguagem natural", "nlp", "natural language processing",
-        "modelo de linguagem", "modelos de linguagem",
-        "modelo de linguagem grande", "modelos de linguagem grandes",
-        "large language model", "large language models",
-        "llm", "llms",
-        
-        # Transformers e técnicas modernas
-        "transformer", "transformers", "attention mechanism", "self attention",
-        "embeddings", "vetor de embeddings", "vector embedding",
-        "fine tuning", "finetuning", "ajuste fino",
-        "instruction tuning", "rlhf", "reinforcement learning from human feedback",
-        "prompt engineering", "engenharia de prompt", "prompting",
-        "rag", "retrieval augmented generation", "retrieval-augmented generation",
-        "vector database", "banco de vetores", "base vetorial",
-        
-        # Agentes / Copilotos / Chatbots
-        "agentes de ia", "ai agents", "agentes autonomos", "autonomous agents",
-        "chatbot", "chatbots", "assistente virtual", "assistentes virtuais",
-        "copilot", "copiloto",
-        
-        # Visão / fala
-        "computer vision", "visao computacional", "visão computacional",
-        "reconhecimento de fala", "speech recognition",
-        "reconhecimento de imagem", "image recognition",
-        
-        # Modelos/Plataformas
-        "gpt", "chatgpt", "openai",
-        "gemini", "claude", "llama", "mistral"
-    ],
-    "SIGLAS_SENSIVEIS": ["IA", "AI", "LLM"]
-}
-
-TERMOS_DADOS_BI = {
-    "DADOS_BI": [
-        # Conceitos gerais de dados
-        # "dados" e "data" isolados passam por verificação de contexto (ver VERIFICACOES_CONTEXTO)
-        # Apenas são contados se estiverem em contexto de Big Data, Data Science, etc.
-        "dados", "data", "data driven", "data-driven", "orientado a dados",
-        "analise de dados", "análise de dados", "data analytics", "analytics",
-        "cientista de dados", "data scientist", "data science", "ciencia de dados", "ciência de dados",
-        
-        # BI e visualização
-        # "bi" NÃO está aqui: contamos só via SIGLAS_SENSIVEIS + verificar_bi_bilhoes
-        # (evita contar "R$ 22,8 bi" = bilhões como Business Intelligence)
-        "business intelligence", "inteligencia de negocios", "inteligência de negócios",
-        "dashboard", "dashboards", "painel",
-        "visualizacao de dados", "visualização de dados", "data visualization",
-        
-        # Engenharia de dados / pipelines
-        "engenharia de dados", "data engineering",
-        "etl", "elt", "pipeline de dados", "data pipeline", "integracao de dados", "integração de dados",
-        "orquestracao de dados", "orquestração de dados", "airflow",
-        
-        # Armazenamento / arquiteturas
-        "data warehouse", "dw", "warehouse",
-        "data lake", "datalake", "lakehouse", "datamart",
-        "big data", "hadoop", "spark",
-        
-        # Banco de dados / linguagens
-        "banco de dados", "database", "db", "dbms", "sgbd",
-        "sql", "nosql", "query", "consultas sql",
-        "modelagem de dados", "data modeling",
-        
-        # Plataformas e ferramentas
-        "power bi", "tableau", "qlik", "looker",
-        "snowflake", "bigquery", "redshift", "databricks",
-        "postgresql", "mysql", "oracle", "sql server", "mongodb",
-        
-        # Governança / qualidade / segurança
-        "governanca de dados", "governança de dados",
-        "qualidade de dados", "data quality",
-        "catalogo de dados", "catálogo de dados", "data catalog",
-        "linhagem de dados", "data lineage",
-        "metadados", "metadata",
-        "lgpd", "privacidade de dados", "data privacy"
-    ],
-    "SIGLAS_SENSIVEIS": ["BI", "DW", "ETL", "ELT", "SQL", "KPI"]
-}
+# Grupos de termos, siglas e regras de contexto ficam em config/dicionario_termos.yaml
+# (ARQUIVO_DICIONARIO em dicionario.py). Cada grupo vira uma linha por PDF no Excel;
+# novos grupos (cloud, automação, cibersegurança, ...) entram só no arquivo.
 
 # ============================================================================
 # FUNÇÕES AUXILIARES
@@ -258,14 +230,14 @@ def verificar_data_eh_data(pos_inicio: int, pos_fim: int, texto_norm: str) -> bo
         return True
     
     # Segundo: ACEITAR apenas se está em contexto de Big Data, Data Science, etc.
-    # Termos que indicam contexto de dados/ciência de dados
+    # Termos que indicam contexto de dados/ciência de dados (comparados com o texto normalizado, sem acentos)
     termos_contexto_dados = [
-        "big", "science", "scientist", "analytics", "analise", "análise",
+        "big", "science", "scientist", "analytics", "analise",
         "engineering", "engenharia", "warehouse", "lake", "pipeline",
-        "driven", "driven", "quality", "qualidade", "governance", "governanca",
-        "governança", "catalog", "catalogo", "catálogo", "lineage", "linhagem",
-        "visualization", "visualizacao", "visualização", "modeling", "modelagem",
-        "privacy", "privacidade", "integration", "integracao", "integração"
+        "driven", "quality", "qualidade", "governance", "governanca",
+        "catalog", "catalogo", "lineage", "linhagem",
+        "visualization", "visualizacao", "modeling", "modelagem",
+        "privacy", "privacidade", "integration", "integracao"
     ]
     
     # Verificar se há algum termo de contexto nos 10 caracteres antes ou depois
@@ -289,16 +261,16 @@ def verificar_dados_em_contexto(pos_inicio: int, pos_fim: int, texto_norm: str)
     ctx_antes = texto_norm[max(0, pos_inicio - 10):pos_inicio]
     ctx_depois = texto_norm[pos_fim:min(tam, pos_fim + 10)]
     
-    # Termos que indicam contexto de dados/BI
+    # Termos que indicam contexto de dados/BI (comparados com o texto normalizado, sem acentos)
     termos_contexto_dados = [
-        "big", "science", "scientist", "analytics", "analise", "análise",
+        "big", "science", "scientist", "analytics", "analise",
         "engineering", "engenharia", "warehouse", "lake", "pipeline",
         "driven", "quality", "qualidade", "governance", "governanca",
-        "governança", "catalog", "catalogo", "catálogo", "lineage", "linhagem",
-        "visualization", "visualizacao", "visualização", "modeling", "modelagem",
-        "privacy", "privacidade", "integration", "integracao", "integração",
-        "business intelligence", "inteligencia", "inteligência", "bi ",
-        "cientista", "cientistas"
+        "catalog", "catalogo", "lineage", "linhagem",
+        "visualization", "visualizacao", "modeling", "modelagem",
+        "privacy", "privacidade", "integration", "integracao",
+        "business intelligence", "inteligencia", "bi ",
+        "cientista"
     ]
     
     # Verificar se há algum termo de contexto nos 10 caracteres antes ou depois
@@ -311,18 +283,120 @@ def verificar_dados_em_contexto(pos_inicio: int, pos_fim: int, texto_norm: str)
     
     return False  # Aceitar: está em contexto de dados/BI
 
-# Termos que passam por verificação de contexto (evitar falsos positivos em relatórios)
+# Regras de verificação de contexto (evitar falsos positivos em relatórios), referenciadas
+# pelo nome na seção "verificacoes" do dicionário de termos.
 # Função recebe (pos_inicio, pos_fim, texto_normalizado) e retorna True para REJEITAR o match.
 # Ex.: "data" = date (data do balanço) vs data analytics.
 # "dados" e "data" isolados só são aceitos se estiverem em contexto de Big Data, Data Science, etc.
-VERIFICACOES_CONTEXTO = {
-    "data": verificar_data_eh_data,
-    "dados": verificar_dados_em_contexto,
+REGRAS_CONTEXTO = {
+    "verificar_data_eh_data": verificar_data_eh_data,
+    "verificar_dados_em_contexto": verificar_dados_em_contexto,
 }
 
-def buscar_sigla_no_texto_original(texto_original: str, sigla: str) -> Tuple[int, List[str]]:
+_dicionario_carregado: Optional[Tuple[Dict, str]] = None
+_avisos_dicionario: List[Dict] = []
+_taxonomia_compilada: Optional[Taxonomia] = None
+_taxonomias_idioma: Dict[str, Taxonomia] = {}
+_perfil_processo: Optional[PerfilMatcher] = None
+
+def obter_dicionario() -> Tuple[Dict, str]:
+    """
+    Dicionário de termos (ARQUIVO_DICIONARIO) compilado (termos normalizados como o texto,
+    sem duplicatas) e o hash do arquivo, lidos uma vez por processo.
+    """
+    global _dicionario_carregado, _avisos_dicionario
+    if _dicionario_carregado is None:
+        dicionario = carregar_dicionario(ARQUIVO_DICIONARIO)
+        compilado, _avisos_dicionario = compilar_dicionario(dicionario, normalizar_texto)
+        _dicionario_carregado = (compilado, hash_dicionario(dicionario))
+    return _dicionario_carregado
+
+def avisos_dicionario() -> List[Dict]:
+    """Avisos da compilação do dicionário (normalizações, duplicatas, sobreposições)."""
+    obter_dicionario()
+    return _avisos_dicionario
+
+def obter_taxonomia() -> Taxonomia:
+    """Matcher compilado do dicionário (do cache em disco, se houver), uma vez por processo."""
+    global _taxonomia_compilada
+    if _taxonomia_compilada is None:
+        dicionario, hash_dic = obter_dicionario()
+        verificacoes = resolver_verificacoes(dicionario, REGRAS_CONTEXTO)
+        _taxonomia_compilada = carregar_matcher(dicionario, hash_dic, criar_regex_termo, verificacoes)
+    return _taxonomia_compilada
+
+def obter_taxonomia_idioma(idioma: str) -> Taxonomia:
+    """
+    Matcher só com os termos neutros e os exclusivos de `idioma` (sem os termos listados
+    para os outros idiomas do dicionário); siglas valem em todos. Idioma indeterminado ou
+    dicionário sem a seção idiomas: o matcher completo.
+    """
+    dicionario, hash_dic = obter_dicionario()
+    outros = {t for outro, termos in dicionario["idiomas"].items() if outro != idioma for t in termos}
+    if idioma == IDIOMA_INDETERMINADO or not outros:
+        return obter_taxonomia()
+    if idioma not in _taxonomias_idioma:
+        subconjunto = {
+            "grupos": {
+                nome: {"termos": [t for t in g["termos"] if t not in outros], "siglas": g["siglas"]}
+                for nome, g in dicionario["grupos"].items()
+            },
+            "verificacoes": {t: r for t, r in dicionario["verificacoes"].items() if t not in outros},
+        }
+        verificacoes = resolver_verificacoes(subconjunto, REGRAS_CONTEXTO)
+        hash_idioma = hash_dicionario({"dicionario": hash_dic, "idioma": idioma})
+        _taxonomias_idioma[idioma] = carregar_matcher(subconjunto, hash_idioma, criar_regex_termo, verificacoes)
+    return _taxonomias_idioma[idioma]
+
+def configuracao_atual() -> Dict:
+    """Configuração de saída desta execução (ver checkpoint.configuracao_saida)."""
+    valores = {nome: globals()[nome] for nome in CONFIGURACOES_SAIDA if nome != "IDIOMAS_OCR"}
+    valores["IDIOMAS_OCR"] = IDIOMAS_OCR
+    return configuracao_saida(valores, OCR_DISPONIVEL)
+
+def obter_perfil() -> Optional[PerfilMatcher]:
+    """Perfil do matcher acumulado neste processo (None se PERFIL_MATCHER estiver desligado)."""
+    global _perfil_processo
+    if not PERFIL_MATCHER:
+        return None
+    if _perfil_processo is None:
+        _perfil_processo = PerfilMatcher()
+    return _perfil_processo
+
+def reiniciar_perfil():
+    """Descarta os perfis de execuções anteriores (deste processo e os gravados em disco)."""
+    global _perfil_processo
+    _perfil_processo = None
+    limpar_perfis()
+
+def exportar_perfil() -> Optional[pd.DataFrame]:
+    """Junta os perfis dos processos, grava ARQUIVO_PERFIL_CSV e mostra os termos mais caros."""
+    perfil = carregar_perfis()
+    if not perfil.termos:
+        return None
+    df_perfil = perfil.para_dataframe()
+    try:
+        os.makedirs(os.path.dirname(ARQUIVO_PERFIL_CSV) or ".", exist_ok=True)
+        df_perfil.to_csv(ARQUIVO_PERFIL_CSV, index=False, encoding="utf-8-sig")
+    except OSError as e:
+        print(f"\nAVISO: não foi possível gravar {ARQUIVO_PERFIL_CSV}: {e}")
+    print(f"\nPerfil do matcher ({perfil.documentos} PDFs) salvo em {ARQUIVO_PERFIL_CSV}. Termos mais caros:")
+    for linha in df_perfil.head(5).itertuples(index=False):
+        print(f"  - {linha.termo}: {linha.segundos:.2f}s, {linha.candidatos} candidatos, {linha.aceitos} aceitos")
+    return df_perfil
+
+def buscar_sigla_no_texto_original(
+    texto_original: str,
+    sigla: str,
+    posicoes: Optional[List[int]] = None,
+    max_exemplos: int = 3,
+    rejeicoes: Optional[Dict[str, int]] = None
+) -> Tuple[int, List[str]]:
     """
     Busca sigla curta no texto original com padrões rigorosos.
+    Se `posicoes` for uma lista, recebe a posição (no texto original) de cada ocorrência aceita.
+    max_exemplos limita os exemplos de contexto (0 = só contagem, sem montar strings).
+    Se `rejeicoes` for um dicionário, recebe motivo -> ocorrências rejeitadas (perfil do matcher).
     Aceita:
     - Siglas totalmente maiúsculas: "IA", "LLM", "BI"
     - Siglas com primeira minúscula (início de frase): "Ia generativa", "Bi é importante"
@@ -389,7 +463,7 @@ def buscar_sigla_no_texto_original(texto_original: str, sigla: str) -> Tuple[int
     
     # Buscar todos os padrões
     count = 0
-    exemplos = []  # Lista de até 3 exemplos de contexto
+    exemplos = []  # Lista de até max_exemplos exemplos de contexto
     
     # Buscar padrão 1 (totalmente maiúscula, sem hífen problemático)
     for match in re.finditer(pattern1, texto_original, re.MULTILINE):
@@ -402,6 +476,7 @@ def buscar_sigla_no_texto_original(texto_original: str, sigla: str) -> Tuple[int
             # Verificação especial para "BI" (Business Intelligence vs Bilhões)
             if sigla == "BI":
                 if verificar_bi_bilhoes(pos_inicio_match, texto_original):
+                    _contar_rejeicao(rejeicoes, "verificar_bi_bilhoes")
                     continue  # Rejeitar: é "Bilhões", não "Business Intelligence"
             
             # Calcular posição exata da sigla no texto original
@@ -419,6 +494,7 @@ def buscar_sigla_no_texto_original(texto_original: str, sigla: str) -> Tuple[int
             
             # Se há letras antes E depois, a sigla está dentro de uma palavra maior - REJEITAR
             if char_antes.isalpha() and char_depois.isalpha():
+                _contar_rejeicao(rejeicoes, "dentro_de_palavra")
                 continue  # Rejeitar: está dentro de palavra maior (ex: "patrimoniais", "economia", etc.)
             
             # Verificação adicional para "IA" e "AI": rejeitar quando há letras próximas antes e depois
@@ -438,6 +514,7 @@ def buscar_sigla_no_texto_original(texto_original: str, sigla: str) -> Tuple[int
                     texto_entre = texto_original[max(0, pos_sigla_inicio - 5):min(len(texto_original), pos_sigla_fim + 5)]
                     delimitadores_entre = re.sub(r'[A-Za-z]', '', texto_entre)
                     if len(delimitadores_entre.strip()) <= 3:
+                        _contar_rejeicao(rejeicoes, "letras_proximas_ia_ai")
                         continue  # Rejeitar: parte de palavra maior (patrimoniais, comerciais, etc.)
             
             # "IA" como sufixo (ex.: "tesouraria" → "tesourar IA " por quebra de linha)
@@ -445,12 +522,14 @@ def buscar_sigla_no_texto_original(texto_original: str, sigla: str) -> Tuple[int
                 ctx_antes = texto_original[max(0, pos_sigla_inicio - 15):pos_sigla_inicio]
                 ctx_limpo = ctx_antes.rstrip().lower()
                 if any(ctx_limpo.endswith(r) for r in sufixos_ia_rejeitar):
+                    _contar_rejeicao(rejeicoes, "sufixo_ia")
                     continue  # Rejeitar: é sufixo ("tesourar**ia**", "econom**ia**", etc.)
             
             # Rejeitar "IA"/"AI" em contexto boilerplate (logo, PNG, Vector, EPS, PDF, SVG, Download, etc.)
             if sigla in ("IA", "AI"):
                 ctx_amplo = texto_original[max(0, pos_sigla_inicio - 25):pos_sigla_fim + 25].lower()
                 if any(termo in ctx_amplo for termo in termos_boilerplate_ia_ai):
+                    _contar_rejeicao(rejeicoes, "boilerplate_ia_ai")
                     continue  # Rejeitar: contexto de logo/formato/metadata, não IA de verdade
             
             # Verificar se não faz parte de um padrão a rejeitar (ex: "IA" em "IAS")
@@ -480,11 +559,14 @@ def buscar_sigla_no_texto_original(texto_original: str, sigla: str) -> Tuple[int
                                         break
                 
                 if deve_rejeitar:
+                    _contar_rejeicao(rejeicoes, "padrao_maior_ias")
                     continue  # Rejeitar: faz parte de padrão maior (ex: "IAS")
             
             count += 1
-            # Capturar exemplo de contexto (até 3)
-            if len(exemplos) < 3:
+            if posicoes is not None:
+                posicoes.append(pos_sigla_inicio)
+            # Capturar exemplo de contexto (até max_exemplos)
+            if len(exemplos) < max_exemplos:
                 ctx_antes = texto_original[max(0, pos_sigla_inicio - 30):pos_sigla_inicio]
                 ctx_depois = texto_original[pos_sigla_fim:min(len(texto_original), pos_sigla_fim + 30)]
                 sigla_encontrada = texto_original[pos_sigla_inicio:pos_sigla_fim]
@@ -505,6 +587,7 @@ def buscar_sigla_no_texto_original(texto_original: str, sigla: str) -> Tuple[int
                     # Verificação especial para "BI" (Business Intelligence vs Bilhões)
                     if sigla == "BI":
                         if verificar_bi_bilhoes(pos_inicio_match, texto_original):
+                            _contar_rejeicao(rejeicoes, "verificar_bi_bilhoes")
                             continue  # Rejeitar: é "Bilhões", não "Business Intelligence"
                     
                     # Calcular posição exata da sigla no texto original
@@ -522,6 +605,7 @@ def buscar_sigla_no_texto_original(texto_original: str, sigla: str) -> Tuple[int
                     
                     # Se há letras antes E depois, a sigla está dentro de uma palavra maior - REJEITAR
                     if char_antes.isalpha() and char_depois.isalpha():
+                        _contar_rejeicao(rejeicoes, "dentro_de_palavra")
                         continue  # Rejeitar: está dentro de palavra maior (ex: "patrimoniais", "economia", etc.)
                     
                     # Verificação adicional para "IA" e "AI": rejeitar quando há letras próximas antes e depois
@@ -534,6 +618,7 @@ def buscar_sigla_no_texto_original(texto_original: str, sigla: str) -> Tuple[int
                             texto_entre = texto_original[max(0, pos_sigla_inicio - 5):min(len(texto_original), pos_sigla_fim + 5)]
                             delimitadores_entre = re.sub(r'[A-Za-z]', '', texto_entre)
                             if len(delimitadores_entre.strip()) <= 3:
+                                _contar_rejeicao(rejeicoes, "letras_proximas_ia_ai")
                                 continue
                     
                     # "IA" como sufixo
@@ -541,12 +626,14 @@ def buscar_sigla_no_texto_original(texto_original: str, sigla: str) -> Tuple[int
                         ctx_antes = texto_original[max(0, pos_sigla_inicio - 15):pos_sigla_inicio]
                         ctx_limpo = ctx_antes.rstrip().lower()
                         if any(ctx_limpo.endswith(r) for r in sufixos_ia_rejeitar):
+                            _contar_rejeicao(rejeicoes, "sufixo_ia")
                             continue  # Rejeitar: é sufixo
                     
                     # Rejeitar "IA"/"AI" em contexto boilerplate
                     if sigla in ("IA", "AI"):
                         ctx_amplo = texto_original[max(0, pos_sigla_inicio - 25):pos_sigla_fim + 25].lower()
                         if any(termo in ctx_amplo for termo in termos_boilerplate_ia_ai):
+                            _contar_rejeicao(rejeicoes, "boilerplate_ia_ai")
                             continue
                     
                     # Verificar se não faz parte de um padrão a rejeitar (similar ao padrão 1)
@@ -571,11 +658,14 @@ def buscar_sigla_no_texto_original(texto_original: str, sigla: str) -> Tuple[int
                                             break
                     
                     if deve_rejeitar:
+                        _contar_rejeicao(rejeicoes, "padrao_maior_ias")
                         continue  # Rejeitar: faz parte de padrão maior
                     
                     count += 1
-                    # Capturar exemplo de contexto (até 3)
-                    if len(exemplos) < 3:
+                    if posicoes is not None:
+                        posicoes.append(pos_sigla_inicio)
+                    # Capturar exemplo de contexto (até max_exemplos)
+                    if len(exemplos) < max_exemplos:
                         ctx_antes = texto_original[max(0, pos_sigla_inicio - 30):pos_sigla_inicio]
                         ctx_depois = texto_original[pos_sigla_fim:min(len(texto_original), pos_sigla_fim + 30)]
                         sigla_encontrada = texto_original[pos_sigla_inicio:pos_sigla_fim]
@@ -597,6 +687,7 @@ def buscar_sigla_no_texto_original(texto_original: str, sigla: str) -> Tuple[int
         # Se há letras antes E depois, é palavra composta - REJEITAR
         # Exemplo: "DIA-IA-DIA" -> char_antes_hifen1='A', char_depois_hifen2='D'
         if char_antes_hifen1.isalpha() and char_depois_hifen2.isalpha():
+            _contar_rejeicao(rejeicoes, "palavra_composta_hifen")
             continue  # Rejeitar: está dentro de palavra composta como "DIA-IA-DIA"
         
         # Se não há letras antes OU depois, pode ser sigla isolada
@@ -606,6 +697,7 @@ def buscar_sigla_no_texto_original(texto_original: str, sigla: str) -> Tuple[int
         # Verificação especial para "BI" (Business Intelligence vs Bilhões)
         if sigla == "BI":
             if verificar_bi_bilhoes(pos_inicio + 1, texto_original):  # +1 para posição da sigla (após o hífen)
+                _contar_rejeicao(rejeicoes, "verificar_bi_bilhoes")
                 continue  # Rejeitar: é "Bilhões", não "Business Intelligence"
         
         # Rejeitar "IA"/"AI" em contexto boilerplate (logo, PNG, Vector, etc.)
@@ -613,112 +705,311 @@ def buscar_sigla_no_texto_original(texto_original: str, sigla: str) -> Tuple[int
             pos_sigla = pos_inicio + 1
             ctx_amplo = texto_original[max(0, pos_sigla - 25):pos_fim - 1 + 25].lower()
             if any(termo in ctx_amplo for termo in termos_boilerplate_ia_ai):
+                _contar_rejeicao(rejeicoes, "boilerplate_ia_ai")
                 continue
         
         # Aceitar se totalmente maiúscula OU primeira minúscula + resto maiúsculo
         if sigla_no_match.isupper():
             count += 1
-            # Capturar exemplo (até 3)
-            if len(exemplos) < 3:
+            if posicoes is not None:
+                posicoes.append(pos_inicio + 1)
+            # Capturar exemplo (até max_exemplos)
+            if len(exemplos) < max_exemplos:
                 ctx_antes = texto_original[max(0, pos_inicio - 20):pos_inicio + 1]
                 ctx_depois = texto_original[pos_fim - 1:min(len(texto_original), pos_fim + 20)]
                 exemplo = f"...{ctx_antes}**{sigla_no_match}**{ctx_depois}..."
                 exemplos.append(exemplo)
         elif len(sigla_no_match) > 1 and sigla_no_match[0].islower() and sigla_no_match[1:].isupper():
             count += 1
-            # Capturar exemplo (até 3)
-            if len(exemplos) < 3:
+            if posicoes is not None:
+                posicoes.append(pos_inicio + 1)
+            # Capturar exemplo (até max_exemplos)
+            if len(exemplos) < max_exemplos:
                 ctx_antes = texto_original[max(0, pos_inicio - 20):pos_inicio + 1]
                 ctx_depois = texto_original[pos_fim - 1:min(len(texto_original), pos_fim + 20)]
                 exemplo = f"...{ctx_antes}**{sigla_no_match}**{ctx_depois}..."
                 exemplos.append(exemplo)
+        else:
+            _contar_rejeicao(rejeicoes, "caixa_hifen")
     
     return count, exemplos
 
+def _contar_rejeicao(rejeicoes: Optional[Dict[str, int]], motivo: str):
+    """Conta uma ocorrência rejeitada em `rejeicoes` (se o perfil do matcher estiver ligado)."""
+    if rejeicoes is not None:
+        rejeicoes[motivo] = rejeicoes.get(motivo, 0) + 1
+
+def _exemplos_termo(texto_original: str, termo: str, limite: int) -> List[str]:
+    """Até `limite` exemplos de contexto do termo, buscados no texto original (contexto real)."""
+    exemplos = []
+    if limite <= 0:
+        return exemplos
+    regex_original = criar_regex_termo(termo, usar_word_boundary=True)
+    for m_orig in islice(regex_original.finditer(texto_original), limite):
+        ctx_antes = texto_original[max(0, m_orig.start() - 30):m_orig.start()]
+        ctx_depois = texto_original[m_orig.end():min(len(texto_original), m_orig.end() + 30)]
+        termo_real = m_orig.group()
+        exemplo = f"...{ctx_antes}**{termo_real}**{ctx_depois}..."
+        exemplos.append(exemplo)
+    return exemplos
+
+def contar_grupos_no_texto(
+    texto_original: str,
+    texto_normalizado: str,
+    taxonomia: Taxonomia,
+    posicoes: Optional[Dict[str, Dict[str, List[int]]]] = None,
+    max_exemplos: int = 3,
+    perfil: Optional[PerfilMatcher] = None
+) -> Dict[str, Tuple[Dict[str, int], List[str], Dict[str, List[str]]]]:
+    """
+    Conta os termos de todos os grupos da taxonomia numa varredura única do texto normalizado;
+    siglas (no texto original) são buscadas uma vez cada, mesmo se estiverem em vários grupos.
+    Retorna: grupo -> (dicionário termo -> contagem, lista de termos encontrados, exemplos_contexto),
+    como contar_termos_no_texto para cada grupo.
+    Se `posicoes` for um dicionário, recebe grupo -> termo -> posições das ocorrências aceitas.
+    Se `perfil` for informado, acumula nele tempo, aceitos e rejeições por termo e sigla.
+    """
+    if perfil is None:
+        encontrados = taxonomia.varrer(texto_normalizado)
+    else:
+        perfil_termos = {}
+        inicio = time.perf_counter()
+        encontrados = taxonomia.varrer(texto_normalizado, perfil_termos)
+        segundos_termos = sum(e["segundos"] for e in perfil_termos.values())
+        perfil.registrar(TERMO_VARREDURA, time.perf_counter() - inicio - segundos_termos)
+        for termo in taxonomia.termos_unicos:
+            estatisticas = perfil_termos.get(termo, {})
+            perfil.registrar(
+                termo, estatisticas.get("segundos", 0.0), len(encontrados.get(termo, ())),
+                estatisticas.get("rejeitados")
+            )
+
+    exemplos_por_termo = {}
+    for termo, ocorrencias_termo in encontrados.items():
+        # Termos com verificação de contexto não mostram mais exemplos do que ocorrências aceitas
+        limite = len(ocorrencias_termo) if termo in taxonomia.verificacoes else max_exemplos
+        inicio = time.perf_counter() if perfil is not None else 0.0
+        exemplos_por_termo[termo] = _exemplos_termo(texto_original, termo, min(limite, max_exemplos))
+        if perfil is not None:
+            perfil.registrar(termo, time.perf_counter() - inicio)
+
+    siglas = {}
+    for sigla in taxonomia.siglas_unicas:
+        posicoes_sigla = [] if posicoes is not None else None
+        if perfil is None:
+            count, exemplos_sigla = buscar_sigla_no_texto_original(texto_original, sigla, posicoes_sigla, max_exemplos)
+        else:
+            rejeicoes = {}
+            inicio = time.perf_counter()
+            count, exemplos_sigla = buscar_sigla_no_texto_original(
+                texto_original, sigla, posicoes_sigla, max_exemplos, rejeicoes
+            )
+            perfil.registrar(sigla, time.perf_counter() - inicio, count, rejeicoes)
+        siglas[sigla] = (count, exemplos_sigla, posicoes_sigla)
+
+    resultado = {}
+    for grupo, definicao in taxonomia.grupos.items():
+        ocorrencias = {}
+        termos_encontrados = []
+        exemplos_contexto = {}
+        posicoes_grupo = {}
+        for termo in definicao["termos"]:
+            if termo in encontrados:
+                ocorrencias[termo] = len(encontrados[termo])
+                termos_encontrados.append(termo)
+                exemplos_contexto[termo] = exemplos_por_termo[termo]
+                posicoes_grupo[termo] = [inicio for inicio, _ in encontrados[termo]]
+        for sigla in definicao["siglas"]:
+            count, exemplos_sigla, posicoes_sigla = siglas[sigla]
+            if posicoes_sigla:
+                posicoes_grupo[sigla] = posicoes_sigla
+            if count > 0:
+                ocorrencias[sigla] = count
+                termos_encontrados.append(sigla)
+                exemplos_contexto[sigla] = exemplos_sigla
+        if posicoes is not None:
+            posicoes[grupo] = posicoes_grupo
+        resultado[grupo] = (ocorrencias, termos_encontrados, exemplos_contexto)
+    return resultado
+
 def contar_termos_no_texto(
     texto_original: str,
     texto_normalizado: str,
     termos: List[str],
-    siglas_sensiveis: List[str]
+    siglas_sensiveis: List[str],
+    posicoes: Optional[Dict[str, List[int]]] = None,
+    max_exemplos: int = 3
 ) -> Tuple[Dict[str, int], List[str], Dict[str, List[str]]]:
     """
     Conta ocorrências de termos no texto e captura exemplos de contexto.
     Retorna: (dicionário termo -> contagem, lista de termos encontrados, exemplos_contexto)
-    Termos em VERIFICACOES_CONTEXTO usam finditer e checagem de contexto.
+    Termos com regra em "verificacoes" no dicionário passam por checagem de contexto.
+    Se `posicoes` for um dicionário, recebe termo -> posições das ocorrências aceitas
+    (no texto normalizado para termos; no texto original para siglas).
+    max_exemplos limita os exemplos por termo; com 0 não há nenhum fatiamento/formatação
+    de strings (modo só contagem: os exemplos podem ser gerados depois a partir das posições).
+    Para vários grupos de uma vez, use contar_grupos_no_texto (uma varredura só).
     """
-    ocorrencias = {}
-    termos_encontrados = []
-    exemplos_contexto = {}  # termo -> lista de até 3 exemplos
-    
-    # Conta termos normais (no texto normalizado)
-    for termo in termos:
-        regex = criar_regex_termo(termo, usar_word_boundary=True)
-        verificar = VERIFICACOES_CONTEXTO.get(termo)
-        exemplos = []
-        
-        if verificar is None:
-            matches = regex.findall(texto_normalizado)
-            count = len(matches)
-            # Capturar exemplos do texto original (para mostrar contexto real)
-            # Buscar diretamente no texto original com regex case-insensitive
-            regex_original = criar_regex_termo(termo, usar_word_boundary=True)
-            for i, m_orig in enumerate(regex_original.finditer(texto_original)):
-                if i >= 3:
-                    break
-                ctx_antes = texto_original[max(0, m_orig.start() - 30):m_orig.start()]
-                ctx_depois = texto_original[m_orig.end():min(len(texto_original), m_orig.end() + 30)]
-                termo_real = m_orig.group()
-                exemplo = f"...{ctx_antes}**{termo_real}**{ctx_depois}..."
-                exemplos.append(exemplo)
-        else:
-            count = 0
-            for m in regex.finditer(texto_normalizado):
-                if not verificar(m.start(), m.end(), texto_normalizado):
-                    count += 1
-                    # Capturar exemplos do texto original (primeiros 3)
-                    if len(exemplos) < 3:
-                        # Buscar no texto original usando regex
-                        regex_original = criar_regex_termo(termo, usar_word_boundary=True)
-                        encontrados_orig = list(regex_original.finditer(texto_original))
-                        if len(encontrados_orig) > len(exemplos):
-                            m_orig = encontrados_orig[len(exemplos)]
-                            ctx_antes = texto_original[max(0, m_orig.start() - 30):m_orig.start()]
-                            ctx_depois = texto_original[m_orig.end():min(len(texto_original), m_orig.end() + 30)]
-                            termo_real = m_orig.group()
-                            exemplo = f"...{ctx_antes}**{termo_real}**{ctx_depois}..."
-                            exemplos.append(exemplo)
-        
-        if count > 0:
-            ocorrencias[termo] = count
-            termos_encontrados.append(termo)
-            exemplos_contexto[termo] = exemplos
-    
-    # Conta siglas sensíveis (no texto original, apenas maiúsculas)
-    for sigla in siglas_sensiveis:
-        count, exemplos_sigla = buscar_sigla_no_texto_original(texto_original, sigla)
-        if count > 0:
-            ocorrencias[sigla] = count
-            termos_encontrados.append(sigla)
-            exemplos_contexto[sigla] = exemplos_sigla
-    
-    return ocorrencias, termos_encontrados, exemplos_contexto
+    taxonomia = Taxonomia(
+        {"termos": {"termos": termos, "siglas": siglas_sensiveis}},
+        criar_regex_termo,
+        obter_taxonomia().verificacoes
+    )
+    posicoes_grupos = {} if posicoes is not None else None
+    contagem = contar_grupos_no_texto(
+        texto_original, texto_normalizado, taxonomia, posicoes_grupos, max_exemplos
+    )["termos"]
+    if posicoes is not None:
+        posicoes.update(posicoes_grupos["termos"])
+    return contagem
+
+def contar_grupos_por_paragrafo(
+    texto_original: str,
+    taxonomia: Taxonomia,
+    memoria: MemoriaParagrafos,
+    caminho_pdf: str,
+    max_exemplos: int = 3,
+    perfil: Optional[PerfilMatcher] = None
+) -> Tuple[Dict[str, Tuple[Dict[str, int], List[str], Dict[str, List[str]]]], Dict[str, Dict[str, int]]]:
+    """
+    Como contar_grupos_no_texto, mas parágrafo a parágrafo: parágrafos já vistos em outro
+    relatório da empresa (`memoria`) reaproveitam a contagem guardada, e só os novos passam
+    pelo matcher. Os exemplos de contexto saem da mesma varredura dos parágrafos novos
+    (contexto limitado ao parágrafo); termos só em parágrafos recorrentes ficam sem exemplo,
+    que já saiu no relatório onde o parágrafo apareceu antes.
+    Retorna (contagens por grupo, grupo -> {hash do parágrafo: menções do grupo}).
+    `perfil` (se informado) mede só os parágrafos que passam pelo matcher.
+    """
+    conhecidos = memoria.carregar()
+    paragrafos_pdf: Dict[str, Dict[str, Dict[str, int]]] = {}
+    ocorrencias = {grupo: {} for grupo in taxonomia.grupos}
+    exemplos: Dict[str, Dict[str, List[str]]] = {grupo: {} for grupo in taxonomia.grupos}
+    mencoes = {grupo: {} for grupo in taxonomia.grupos}
+    
+    for paragrafo in dividir_paragrafos(texto_original):
+        normalizado = normalizar_texto(paragrafo)
+        chave = hash_paragrafo(normalizado)
+        contagem = paragrafos_pdf.get(chave)
+        if contagem is None:
+            contagem = conhecidos.get(chave)
+        if contagem is None:
+            contagens_paragrafo = contar_grupos_no_texto(paragrafo, normalizado, taxonomia, None, max_exemplos, perfil)
+            contagem = {grupo: c[0] for grupo, c in contagens_paragrafo.items() if c[0]}
+            for grupo, (_, _, exemplos_paragrafo) in contagens_paragrafo.items():
+                for termo, lista in exemplos_paragrafo.items():
+                    destino = exemplos[grupo].setdefault(termo, [])
+                    destino.extend(lista[:max_exemplos - len(destino)])
+        paragrafos_pdf[chave] = contagem
+        for grupo, ocorrencias_paragrafo in contagem.items():
+            for termo, n in ocorrencias_paragrafo.items():
+                ocorrencias[grupo][termo] = ocorrencias[grupo].get(termo, 0) + n
+            mencoes[grupo][chave] = mencoes[grupo].get(chave, 0) + sum(ocorrencias_paragrafo.values())
+    memoria.gravar(caminho_pdf, paragrafos_pdf)
+    
+    resultado = {}
+    for grupo, definicao in taxonomia.grupos.items():
+        # Mesma ordem de contar_grupos_no_texto: termos e depois siglas, como no dicionário
+        termos_encontrados = [t for t in definicao["termos"] + definicao["siglas"] if t in ocorrencias[grupo]]
+        ocorrencias_grupo = {t: ocorrencias[grupo][t] for t in termos_encontrados}
+        exemplos_grupo = {t: exemplos[grupo].get(t, []) for t in termos_encontrados}
+        resultado[grupo] = (ocorrencias_grupo, termos_encontrados, exemplos_grupo)
+    return resultado, mencoes
 
 # ============================================================================
 # FUNÇÕES DE PROCESSAMENTO
 # ============================================================================
 
-def _extrair_texto_pdf_sem_timeout(caminho_pdf: str) -> Tuple[str, int]:
-    """Extrai texto do PDF (chamado dentro do executor para permitir timeout)."""
-    texto_completo = []
+def _extrair_paginas_pdf_sem_timeout(
+    caminho_pdf: str,
+    pagina_inicio: int = 0,
+    pagina_fim: Optional[int] = None,
+    dados: Optional[bytes] = None
+) -> Tuple[List[Tuple[int, str]], int, List[int]]:
+    """
+    Extrai texto página a página (chamado dentro do executor para permitir timeout).
+    pagina_inicio/pagina_fim (fim exclusivo) restringem a um bloco de páginas.
+    Se `dados` (bytes do PDF pré-lidos) for informado, lê da memória em vez do disco.
+    Páginas só-imagem (escaneadas) são detectadas pelo content stream e puladas sem rodar
+    o layout; seus índices voltam separados para a faixa de OCR.
+    Entre páginas, respeita a pausa e o cancelamento da execução (ver cancelamento.py).
+    Retorna: ([(indice_pagina, texto)], total_paginas, indices_paginas_imagem).
+    """
+    paginas_texto = []
+    paginas_imagem = []
     total_paginas = 0
-    with pdfplumber.open(caminho_pdf) as pdf:
+    with pdfplumber.open(io.BytesIO(dados) if dados is not None else caminho_pdf) as pdf:
         total_paginas = len(pdf.pages)
-        for pagina in pdf.pages:
-            texto_pagina = pagina.extract_text()
-            if texto_pagina:
-                texto_completo.append(texto_pagina)
-    texto_final = "\n".join(texto_completo)
-    return texto_final, total_paginas
+        fim = total_paginas if pagina_fim is None else min(pagina_fim, total_paginas)
+        for indice in range(pagina_inicio, fim):
+            ponto_de_parada()
+            pagina = pdf.pages[indice]
+            try:
+                if DETECTAR_PAGINAS_IMAGEM:
+                    tipo = classificar_pagina(pagina)
+                    if tipo == PAGINA_IMAGEM:
+                        paginas_imagem.append(indice)
+                        continue
+                    if tipo == PAGINA_VAZIA:
+                        continue
+                texto_pagina = pagina.extract_text()
+                if texto_pagina:
+                    paginas_texto.append((indice, texto_pagina))
+            finally:
+                # Libera os objetos de layout da página (senão ficam em memória até fechar o PDF)
+                pagina.close()
+    return paginas_texto, total_paginas, paginas_imagem
+
+
+def _juntar_paginas(paginas_texto: List[Tuple[int, str]]) -> str:
+    """Junta os textos das páginas na ordem do documento."""
+    return "\n".join(texto for _, texto in sorted(paginas_texto))
+
+
+def _inicios_paginas(paginas_texto: List[Tuple[int, str]]) -> List[int]:
+    """Posição (no texto juntado por _juntar_paginas) onde começa cada página com texto."""
+    return tabela_paginas(paginas_texto)[1]
+
+
+class TimeoutExtracao(Exception):
+    """A extração do PDF (ou de um bloco de páginas) passou do timeout."""
+
+def extrair_paginas_pdf(
+    caminho_pdf: str,
+    timeout_segundos: Optional[float] = None,
+    pagina_inicio: int = 0,
+    pagina_fim: Optional[int] = None,
+    dados: Optional[bytes] = None
+) -> Tuple[List[Tuple[int, str]], int, List[int]]:
+    """
+    Extrai as páginas de um PDF (ou de um bloco de páginas) usando pdfplumber, com timeout opcional.
+    `dados` são os bytes do PDF já em memória (pré-leitura), se houver.
+    Retorna: ([(indice_pagina, texto)], total_paginas, indices_paginas_imagem).
+    Se timeout_segundos for None, usa TIMEOUT_PDF_SEGUNDOS. O tempo em pausa não conta.
+    """
+    timeout = timeout_segundos if timeout_segundos is not None else TIMEOUT_PDF_SEGUNDOS
+    inicio, pausa_inicial = time.monotonic(), segundos_em_pausa()
+    
+    def _restante() -> float:
+        return inicio + timeout + (segundos_em_pausa() - pausa_inicial) - time.monotonic()
+    
+    # Sem "with": o shutdown do with esperaria a thread terminar e o timeout não teria efeito
+    executor = ThreadPoolExecutor(max_workers=1)
+    try:
+        future = executor.submit(_extrair_paginas_pdf_sem_timeout, caminho_pdf, pagina_inicio, pagina_fim, dados)
+        while True:
+            try:
+                return future.result(timeout=max(0.0, _restante()))
+            except FuturesTimeoutError:
+                if _restante() <= 0:  # Senão houve pausa no meio: o prazo foi estendido
+                    raise TimeoutExtracao(
+                        f"Timeout ao extrair PDF após {timeout:.0f}s. O arquivo pode ser muito grande ou corrompido: {caminho_pdf}"
+                    )
+    except (TimeoutExtracao, ExecucaoCancelada):
+        raise
+    except Exception as e:
+        raise Exception(f"Erro ao extrair texto do PDF: {e}")
+    finally:
+        executor.shutdown(wait=False)
 
 
 def extrair_texto_pdf(caminho_pdf: str, timeout_segundos: Optional[int] = None) -> Tuple[str, int]:
@@ -727,57 +1018,171 @@ def extrair_texto_pdf(caminho_pdf: str, timeout_segundos: Optional[int] = None)
     Retorna: (texto_completo, total_paginas).
     Se timeout_segundos for None, usa TIMEOUT_PDF_SEGUNDOS.
     """
-    timeout = timeout_segundos if timeout_segundos is not None else TIMEOUT_PDF_SEGUNDOS
-    try:
-        with ThreadPoolExecutor(max_workers=1) as executor:
-            future = executor.submit(_extrair_texto_pdf_sem_timeout, caminho_pdf)
-            texto_final, total_paginas = future.result(timeout=timeout)
-        return texto_final, total_paginas
-    except FuturesTimeoutError:
-        raise Exception(
-            f"Timeout ao extrair PDF após {timeout}s. O arquivo pode ser muito grande ou corrompido: {caminho_pdf}"
+    paginas_texto, total_paginas, _ = extrair_paginas_pdf(caminho_pdf, timeout_segundos)
+    return _juntar_paginas(paginas_texto), total_paginas
+
+def _posicoes_exemplos_json(posicoes: Dict[str, List[int]], termos: List[str]) -> str:
+    """Primeiras MAX_EXEMPLOS_POR_TERMO posições de cada termo encontrado, em JSON."""
+    return json.dumps(
+        {termo: posicoes.get(termo, [])[:MAX_EXEMPLOS_POR_TERMO] for termo in termos},
+        ensure_ascii=False
+    )
+
+
+def renderizar_exemplos(
+    texto_original: str,
+    texto_normalizado: str,
+    posicoes_exemplos: Dict[str, List[int]],
+    siglas: List[str]
+) -> str:
+    """
+    Gera a string de exemplos de contexto (mesmo formato de "exemplos_contexto") a partir
+    das posições guardadas no modo só contagem. Termos têm posições no texto normalizado
+    (o contexto vem dele); siglas, no texto original.
+    """
+    partes = []
+    for termo, lista in posicoes_exemplos.items():
+        exemplos = []
+        for pos in lista:
+            if termo in siglas:
+                texto, fim = texto_original, pos + len(termo)
+            else:
+                m = criar_regex_termo(termo).match(texto_normalizado, pos)
+                if m is None:
+                    continue
+                texto, fim = texto_normalizado, m.end()
+            ctx_antes = texto[max(0, pos - 30):pos]
+            ctx_depois = texto[fim:min(len(texto), fim + 30)]
+            exemplos.append(f"...{ctx_antes}**{texto[pos:fim]}**{ctx_depois}...")
+        if exemplos:
+            partes.append(f"{termo}: {' | '.join(exemplos)}")
+    return " || ".join(partes)
+
+
+def renderizar_exemplos_pdf(
+    caminho_pdf: str,
+    posicoes_json: str,
+    paginas_ocr: int = 0,
+    total_palavras: Optional[int] = None
+) -> str:
+    """
+    Renderiza sob demanda os exemplos de uma linha gerada no modo só contagem
+    (coluna "posicoes_exemplos"): reextrai o PDF e monta o contexto de cada posição.
+    Se a linha teve páginas lidas por OCR (coluna "paginas_ocr"), o OCR é refeito nas
+    páginas só-imagem antes, porque as posições contam o texto delas. `total_palavras`
+    (coluna "total_palavras_pdf") confere que o texto reconstruído é o mesmo da contagem.
+    """
+    paginas_texto, _, paginas_imagem = extrair_paginas_pdf(caminho_pdf)
+    if paginas_ocr:
+        if not OCR_DISPONIVEL:
+            raise ValueError(
+                f"Instale pytesseract para renderizar os exemplos de {caminho_pdf} "
+                f"({paginas_ocr} páginas lidas por OCR na contagem)"
+            )
+        paginas_texto = paginas_texto + ocr_paginas(caminho_pdf, paginas_imagem)
+    texto_original = _juntar_paginas(paginas_texto)
+    texto_normalizado = normalizar_texto(texto_original)
+    if total_palavras is not None and contar_palavras_aproximado(texto_normalizado) != total_palavras:
+        print(
+            f"AVISO: o texto reextraído de {caminho_pdf} difere do usado na contagem "
+            f"({contar_palavras_aproximado(texto_normalizado)} x {total_palavras} palavras); "
+            f"os exemplos podem estar deslocados."
         )
-    except Exception as e:
-        raise Exception(f"Erro ao extrair texto do PDF: {e}")
+    siglas = obter_taxonomia().siglas_unicas
+    return renderizar_exemplos(texto_original, texto_normalizado, json.loads(posicoes_json), siglas)
 
-def processar_pdf(
+
+def analisar_paginas(
+    paginas_texto: List[Tuple[int, str]],
+    total_paginas: int,
+    paginas_imagem: List[int],
     caminho_pdf: str,
     empresa: str,
-    ano: str
-) -> Optional[List[Dict]]:
+    ano: str,
+    dados: Optional[bytes] = None,
+    textos_ocr: Optional[List[Tuple[int, str]]] = None
+) -> List[Dict]:
     """
-    Processa um único PDF e retorna lista de dicionários com resultados.
-    Cada dicionário representa um grupo (IA_LLM ou DADOS_BI).
-    Retorna None se houver erro.
+    Analisa páginas já extraídas (do PDF inteiro ou de blocos de páginas juntados).
+    Páginas só-imagem vão para a faixa de OCR, se habilitada (ou chegam já lidas em
+    `textos_ocr`, quando o OCR rodou no pool próprio); depois o texto é normalizado e os
+    termos são contados por grupo sobre o documento inteiro (com DETECTAR_IDIOMA, só os
+    termos neutros e os do idioma detectado).
     """
-    try:
-        # Extrair texto
-        texto_original, total_paginas = extrair_texto_pdf(caminho_pdf)
-        texto_normalizado = normalizar_texto(texto_original)
-        total_palavras = contar_palavras_aproximado(texto_normalizado)
-        
-        pdf_nome = os.path.basename(caminho_pdf)
-        
-        resultados = []
-        
-        # Processar grupo IA_LLM
-        ocorrencias_ia, termos_ia, exemplos_ia = contar_termos_no_texto(
+    paginas_ocr = 0
+    if paginas_imagem:
+        if OCR_HABILITADO and OCR_DISPONIVEL:
+            if textos_ocr is None:
+                textos_ocr = ocr_paginas(caminho_pdf, paginas_imagem, dados)
+            paginas_ocr = len(textos_ocr)
+            paginas_texto = paginas_texto + textos_ocr
+        else:
+            print(
+                f"\nAVISO: {len(paginas_imagem)} de {total_paginas} páginas sem texto (escaneadas) "
+                f"em {caminho_pdf}. Habilite OCR_HABILITADO para não subcontar."
+            )
+    texto_original = _juntar_paginas(paginas_texto)
+    texto_normalizado = normalizar_texto(texto_original)
+    total_palavras = contar_palavras_aproximado(texto_normalizado)
+    
+    pdf_nome = os.path.basename(caminho_pdf)
+    
+    resultados = []
+    # No modo só contagem nenhum exemplo é montado: as posições bastam para gerá-los depois
+    max_exemplos = 0 if MODO_SOMENTE_CONTAGEM else MAX_EXEMPLOS_POR_TERMO
+    guardar_posicoes = CALCULAR_COOCORRENCIA or MODO_SOMENTE_CONTAGEM or CONTAGEM_POR_PAGINA
+    
+    # Todos os grupos numa varredura só
+    idioma = detectar_idioma(texto_normalizado) if DETECTAR_IDIOMA else None
+    taxonomia = obter_taxonomia_idioma(idioma) if idioma else obter_taxonomia()
+    perfil = obter_perfil()
+    posicoes = {} if guardar_posicoes else None
+    mencoes = None
+    if DETECTAR_TEXTO_RECORRENTE and not guardar_posicoes:
+        _, hash_dic = obter_dicionario()
+        # Com idioma, a contagem de um parágrafo depende dos termos usados: memória separada
+        versao_memoria = f"{hash_dic[:16]}_v{VERSAO_COMPILADOR}" + (f"_{idioma}" if idioma else "")
+        memoria = MemoriaParagrafos(empresa, versao_memoria)
+        contagens, mencoes = contar_grupos_por_paragrafo(
+            texto_original, taxonomia, memoria, caminho_pdf, max_exemplos, perfil
+        )
+    else:
+        contagens = contar_grupos_no_texto(
             texto_original,
             texto_normalizado,
-            TERMOS_IA_LLM["IA_LLM"],
-            TERMOS_IA_LLM["SIGLAS_SENSIVEIS"]
+            taxonomia,
+            posicoes,
+            max_exemplos,
+            perfil
+        )
+    if perfil is not None:
+        # Gravado a cada PDF: o processo principal junta os perfis dos workers no fim
+        perfil.documentos += 1
+        perfil.gravar()
+    eh_sigla = {
+        (grupo, t): True
+        for grupo, definicao in taxonomia.grupos.items()
+        for t in definicao["siglas"]
+    }
+    por_pagina = None
+    if CONTAGEM_POR_PAGINA:
+        numeros_paginas, inicios_paginas = tabela_paginas(paginas_texto)
+        por_pagina = contar_por_pagina(
+            posicoes, eh_sigla, texto_original, texto_normalizado, numeros_paginas, inicios_paginas
         )
-        total_ia = sum(ocorrencias_ia.values())
+    
+    for grupo, (ocorrencias, termos, exemplos) in contagens.items():
+        total_grupo = sum(ocorrencias.values())
         
-        # Criar string com exemplos de contexto (até 3 por termo)
-        exemplos_texto_ia = []
-        for termo in termos_ia:
-            if termo in exemplos_ia and exemplos_ia[termo]:
-                exemplos_termo = " | ".join(exemplos_ia[termo])
-                exemplos_texto_ia.append(f"{termo}: {exemplos_termo}")
-        exemplos_str_ia = " || ".join(exemplos_texto_ia) if exemplos_texto_ia else ""
+        # Criar string com exemplos de contexto (até max_exemplos por termo)
+        exemplos_texto = []
+        for termo in termos:
+            if termo in exemplos and exemplos[termo]:
+                exemplos_termo = " | ".join(exemplos[termo])
+                exemplos_texto.append(f"{termo}: {exemplos_termo}")
+        exemplos_str = " || ".join(exemplos_texto) if exemplos_texto else ""
         
-        if total_ia > 0 or INCLUIR_PDFS_SEM_OCORRENCIAS:
+        if total_grupo > 0 or INCLUIR_PDFS_SEM_OCORRENCIAS:
             resultados.append({
                 "ano": ano,
                 "empresa": empresa,
@@ -785,66 +1190,436 @@ def processar_pdf(
                 "pdf_caminho": caminho_pdf,
                 "total_paginas": total_paginas,
                 "total_palavras_pdf": total_palavras,
-                "grupo": "IA_LLM",
-                "ocorrencias_total_grupo": total_ia,
-                "termos_encontrados": ", ".join(termos_ia) if termos_ia else "",
-                "ocorrencias_por_termo": json.dumps(ocorrencias_ia, ensure_ascii=False),
-                "exemplos_contexto": exemplos_str_ia
+                "paginas_sem_texto": len(paginas_imagem),
+                "paginas_ocr": paginas_ocr,
+                "grupo": grupo,
+                "ocorrencias_total_grupo": total_grupo,
+                "termos_encontrados": ", ".join(termos) if termos else "",
+                "ocorrencias_por_termo": json.dumps(ocorrencias, ensure_ascii=False),
+                "exemplos_contexto": exemplos_str
             })
-        
-        # Processar grupo DADOS_BI
-        ocorrencias_bi, termos_bi, exemplos_bi = contar_termos_no_texto(
-            texto_original,
-            texto_normalizado,
-            TERMOS_DADOS_BI["DADOS_BI"],
-            TERMOS_DADOS_BI["SIGLAS_SENSIVEIS"]
+            if idioma:
+                resultados[-1]["idioma"] = idioma
+            if MODO_SOMENTE_CONTAGEM:
+                resultados[-1]["posicoes_exemplos"] = _posicoes_exemplos_json(posicoes[grupo], termos)
+            if mencoes is not None:
+                resultados[-1]["mencoes_por_paragrafo"] = json.dumps(mencoes[grupo])
+            if por_pagina is not None:
+                resultados[-1]["ocorrencias_por_pagina"] = json.dumps(
+                    {t: por_pagina[grupo][t] for t in termos if t in por_pagina[grupo]}, ensure_ascii=False
+                )
+    
+    # Coocorrência/proximidade entre termos de todos os grupos (cada par fica na linha do grupo_a)
+    if CALCULAR_COOCORRENCIA:
+        posicoes_termos = {
+            (grupo, t): p for grupo, do_grupo in posicoes.items() for t, p in do_grupo.items()
+        }
+        df_coocorrencia = calcular_coocorrencia(
+            posicoes_termos, eh_sigla, texto_original, texto_normalizado,
+            _inicios_paginas(paginas_texto), JANELA_COOCORRENCIA_TOKENS
+        )
+        for resultado in resultados:
+            do_grupo = df_coocorrencia[df_coocorrencia["grupo_a"] == resultado["grupo"]]
+            resultado["coocorrencias"] = json.dumps(
+                do_grupo.drop(columns="grupo_a").values.tolist(), ensure_ascii=False
+            )
+    
+    return resultados
+
+def processar_pdf(
+    caminho_pdf: str,
+    empresa: str,
+    ano: str,
+    dados: Optional[bytes] = None,
+    timeout_segundos: Optional[float] = None,
+    etapas: Optional[Dict] = None,
+    adiar_ocr: bool = False
+) -> Optional[List[Dict]]:
+    """
+    Processa um único PDF e retorna lista de dicionários com resultados.
+    Cada dicionário representa um grupo do dicionário de termos (ex.: IA_LLM, DADOS_BI).
+    `dados` são os bytes do PDF já em memória (pré-leitura), se houver.
+    Se `etapas` for um dicionário, recebe os segundos de "extracao" e "analise" e
+    "timeout" = True se a extração passou do tempo.
+    Com `adiar_ocr`, um PDF com páginas só-imagem (e OCR habilitado) para depois da
+    extração: retorna None com etapas["ocr_pendente"] = (paginas_texto, total_paginas,
+    paginas_imagem), para o OCR rodar fora deste processo e a análise vir depois.
+    Retorna None se houver erro; ExecucaoCancelada se a execução for cancelada no meio.
+    """
+    if etapas is None:
+        etapas = {}
+    try:
+        inicio = time.perf_counter()
+        paginas_texto, total_paginas, paginas_imagem = extrair_paginas_pdf(caminho_pdf, timeout_segundos, dados=dados)
+        etapas["extracao"] = time.perf_counter() - inicio
+        if adiar_ocr and paginas_imagem and OCR_HABILITADO and OCR_DISPONIVEL:
+            etapas["ocr_pendente"] = (paginas_texto, total_paginas, paginas_imagem)
+            return None
+        inicio = time.perf_counter()
+        resultado = analisar_paginas(paginas_texto, total_paginas, paginas_imagem, caminho_pdf, empresa, ano, dados)
+        etapas["analise"] = time.perf_counter() - inicio
+        return resultado
+    except ExecucaoCancelada:
+        raise
+    except TimeoutExtracao as e:
+        etapas["timeout"] = True
+        print(f"\nERRO ao processar {caminho_pdf}: {e}")
+        return None
+    except Exception as e:
+        print(f"\nERRO ao processar {caminho_pdf}: {e}")
+        return None
+
+def _processar_tarefa(
+    caminho_pdf: str,
+    empresa: str,
+    ano: str,
+    dados: Optional[bytes] = None,
+    timeout_segundos: Optional[float] = None,
+    adiar_ocr: bool = False
+) -> Tuple[Optional[List[Dict]], float, Dict]:
+    """Processa um PDF e mede o tempo gasto, total e por etapa (executado nos workers)."""
+    inicio = time.perf_counter()
+    etapas = {}
+    resultado = processar_pdf(caminho_pdf, empresa, ano, dados, timeout_segundos, etapas, adiar_ocr)
+    return resultado, time.perf_counter() - inicio, etapas
+
+def _ocr_tarefa(caminho_pdf: str, paginas_imagem: List[int]) -> Tuple[List[Tuple[int, str]], float]:
+    """OCR das páginas só-imagem de um PDF, com o tempo gasto (executado no pool de OCR)."""
+    inicio = time.perf_counter()
+    textos = ocr_paginas(caminho_pdf, paginas_imagem)
+    return textos, time.perf_counter() - inicio
+
+def _extrair_bloco_tarefa(
+    caminho_pdf: str,
+    pagina_inicio: int,
+    pagina_fim: int,
+    dados: Optional[bytes] = None,
+    timeout_segundos: Optional[float] = None
+) -> Tuple[List[Tuple[int, str]], int, List[int], float]:
+    """Extrai um bloco de páginas de um PDF gigante e mede o tempo (executado nos workers)."""
+    inicio = time.perf_counter()
+    paginas_texto, total_paginas, paginas_imagem = extrair_paginas_pdf(
+        caminho_pdf, timeout_segundos, pagina_inicio=pagina_inicio, pagina_fim=pagina_fim, dados=dados
+    )
+    return paginas_texto, total_paginas, paginas_imagem, time.perf_counter() - inicio
+
+def _timeout_tarefa(tarefa: Dict, fracao: float = 1.0) -> Optional[float]:
+    """
+    Timeout de extração proporcional ao custo estimado da tarefa (ou da `fracao` de páginas
+    de um bloco), nunca abaixo de TIMEOUT_PDF_SEGUNDOS. None (= TIMEOUT_PDF_SEGUNDOS) se
+    TIMEOUT_ADAPTATIVO estiver desligado.
+    """
+    if not TIMEOUT_ADAPTATIVO:
+        return None
+    return timeout_adaptativo(
+        tarefa.get("custo_estimado") and tarefa["custo_estimado"] * fracao, TIMEOUT_PDF_SEGUNDOS
+    )
+
+def _rss_workers(executor: ProcessPoolExecutor) -> Optional[float]:
+    """RSS somado dos processos do pool (None se não houver como medir)."""
+    processos = getattr(executor, "_processes", None) or {}
+    return rss_processos_mb(list(processos))
+
+def _analisar_tarefa(
+    paginas_texto: List[Tuple[int, str]],
+    total_paginas: int,
+    paginas_imagem: List[int],
+    caminho_pdf: str,
+    empresa: str,
+    ano: str,
+    textos_ocr: Optional[List[Tuple[int, str]]] = None
+) -> Tuple[Optional[List[Dict]], float, Dict]:
+    """
+    Analisa as páginas juntadas de um PDF dividido em blocos, ou de um PDF cujo OCR rodou
+    no pool de OCR (executado nos workers).
+    """
+    inicio = time.perf_counter()
+    try:
+        resultado = analisar_paginas(
+            paginas_texto, total_paginas, paginas_imagem, caminho_pdf, empresa, ano, textos_ocr=textos_ocr
         )
-        total_bi = sum(ocorrencias_bi.values())
+    except ExecucaoCancelada:
+        raise
+    except Exception as e:
+        print(f"\nERRO ao processar {caminho_pdf}: {e}")
+        resultado = None
+    segundos = time.perf_counter() - inicio
+    return resultado, segundos, {"analise": segundos}
+
+def _inicializar_worker(semaforo_ocr, controle: Optional[ControleExecucao]):
+    """Initializer do pool: semáforo do OCR compartilhado e controle de pausa/cancelamento."""
+    configurar_semaforo_ocr(semaforo_ocr)
+    configurar_controle(controle)
+    if controle is not None:
+        # Ctrl+C chega a todo o grupo de processos: quem trata é o principal, pelo controle
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+def _executar_em_paralelo(
+    ordenadas: List[Dict],
+    concluir: Callable[[Dict, Optional[List[Dict]], float, Optional[Dict]], None],
+    erros: List[str],
+    callback: Optional[Callable[[int, int, str, str], None]] = None,
+    metricas: Optional[MetricasExecucao] = None,
+    controle_execucao: Optional[ControleExecucao] = None
+):
+    """
+    Despacha as tarefas (já em ordem LPT) para um pool de processos.
+    PDFs gigantes com mais de PAGINAS_POR_BLOCO páginas são divididos em blocos de páginas
+    extraídos por workers diferentes; quando todos os blocos chegam, as páginas são juntadas
+    na ordem e a contagem roda sobre o texto completo. Assim termos, siglas e janelas de
+    contexto que atravessam a fronteira entre blocos contam exatamente como no PDF inteiro.
+    Só 2 x NUM_WORKERS_PDF trabalhos ficam na fila por vez; os bytes de cada PDF vêm da
+    pré-leitura assíncrona (mesma ordem LPT), sobrepondo I/O lento com a CPU dos workers.
+    PDFs divididos em blocos não são pré-lidos: cada bloco abre o arquivo pelo caminho
+    (mandar o PDF inteiro a cada bloco furaria a memória reservada para o bloco).
+    Além disso, cada trabalho só é despachado se sua memória estimada couber no orçamento
+    (ControleAdmissao); senão espera algum trabalho em execução terminar.
+    Com OCR habilitado, PDFs com páginas só-imagem voltam da extração sem análise: o OCR
+    roda num pool próprio (MAX_OCR_SIMULTANEOS processos, tempo máximo por PDF em
+    ocr.TIMEOUT_OCR_PDF_SEGUNDOS) e a análise é despachada quando o texto do OCR chega,
+    sem prender os workers de contagem nem contar no timeout da extração.
+    concluir(tarefa, resultado, segundos, etapas) recebe cada PDF terminado; filas, memória
+    e pré-leitura vão para `metricas`. Com `controle_execucao` pausado nada novo é
+    despachado (os trabalhos em execução esperam na próxima página); cancelado, os
+    trabalhos em execução param na próxima página e os PDFs interrompidos não passam
+    por concluir.
+    """
+    metricas = metricas or MetricasExecucao()
+    total_pdfs = len(ordenadas)
+    concluidos = 0
+    blocos_por_indice: Dict[int, Dict] = {}
+    ocr_por_indice: Dict[int, Dict] = {}  # PDFs esperando o OCR: páginas extraídas, segundos e etapas
+    max_na_fila = 2 * NUM_WORKERS_PDF
+    controle = ControleAdmissao()
+    
+    def _em_blocos(t: Dict) -> bool:
+        return t["gigante"] and (t.get("paginas") or 0) > PAGINAS_POR_BLOCO
+    
+    def _trabalhos(prefetcher: PrefetcherPDF):
+        """Gera (tipo, tarefa, função, argumentos, memória estimada em MB) na ordem de despacho."""
+        for t in ordenadas:
+            if _em_blocos(t):
+                blocos = dividir_em_blocos(t["paginas"], PAGINAS_POR_BLOCO)
+                blocos_por_indice[t["indice"]] = {
+                    "restantes": len(blocos), "paginas_texto": [], "paginas_imagem": [],
+                    "total_paginas": t["paginas"], "segundos": 0.0, "falhou": False,
+                }
+                for pagina_inicio, pagina_fim in blocos:
+                    fracao = (pagina_fim - pagina_inicio) / t["paginas"]
+                    timeout = _timeout_tarefa(t, fracao)
+                    memoria = estimar_memoria_mb(pagina_fim - pagina_inicio, t["tamanho_bytes"] * fracao)
+                    yield "bloco", t, _extrair_bloco_tarefa, (t["caminho"], pagina_inicio, pagina_fim, None, timeout), memoria
+            else:
+                inicio = time.perf_counter()
+                dados = prefetcher.obter(t["caminho"])
+                metricas.observar("espera_prefetch", time.perf_counter() - inicio)
+                metricas.registrar_cache("prefetch", dados is not None)
+                memoria = estimar_memoria_mb(t.get("paginas"), t["tamanho_bytes"])
+                yield "pdf", t, _processar_tarefa, (t["caminho"], t["empresa"], t["ano"], dados, _timeout_tarefa(t), True), memoria
+    
+    # Semáforo compartilhado: o limite de OCR simultâneo vale para o pool inteiro
+    semaforo_ocr = multiprocessing.BoundedSemaphore(MAX_OCR_SIMULTANEOS)
+    with PrefetcherPDF([t["caminho"] for t in ordenadas if not _em_blocos(t)]) as prefetcher, ProcessPoolExecutor(
+        max_workers=NUM_WORKERS_PDF,
+        initializer=_inicializar_worker,
+        initargs=(semaforo_ocr, controle_execucao),
+    ) as executor, ProcessPoolExecutor(
+        max_workers=MAX_OCR_SIMULTANEOS,
+        initializer=_inicializar_worker,
+        initargs=(semaforo_ocr, controle_execucao),
+    ) as executor_ocr:  # Processos criados só no primeiro OCR
         
-        # Criar string com exemplos de contexto (até 3 por termo)
-        exemplos_texto_bi = []
-        for termo in termos_bi:
-            if termo in exemplos_bi and exemplos_bi[termo]:
-                exemplos_termo = " | ".join(exemplos_bi[termo])
-                exemplos_texto_bi.append(f"{termo}: {exemplos_termo}")
-        exemplos_str_bi = " || ".join(exemplos_texto_bi) if exemplos_texto_bi else ""
+        def _despachar_ocr(tarefa: Dict, paginas_texto, total_paginas, paginas_imagem, segundos: float, etapas: Dict):
+            ocr_por_indice[tarefa["indice"]] = {
+                "paginas_texto": paginas_texto, "total_paginas": total_paginas,
+                "paginas_imagem": paginas_imagem, "segundos": segundos, "etapas": etapas,
+            }
+            futuro_ocr = executor_ocr.submit(_ocr_tarefa, tarefa["caminho"], paginas_imagem)
+            futuros[futuro_ocr] = ("ocr", tarefa, 0.0)
+            pendentes.add(futuro_ocr)
         
-        if total_bi > 0 or INCLUIR_PDFS_SEM_OCORRENCIAS:
-            resultados.append({
-                "ano": ano,
-                "empresa": empresa,
-                "pdf_nome": pdf_nome,
-                "pdf_caminho": caminho_pdf,
-                "total_paginas": total_paginas,
-                "total_palavras_pdf": total_palavras,
-                "grupo": "DADOS_BI",
-                "ocorrencias_total_grupo": total_bi,
-                "termos_encontrados": ", ".join(termos_bi) if termos_bi else "",
-                "ocorrencias_por_termo": json.dumps(ocorrencias_bi, ensure_ascii=False),
-                "exemplos_contexto": exemplos_str_bi
-            })
+        def _despachar_analise(tarefa: Dict, paginas_texto, total_paginas, paginas_imagem, textos_ocr=None):
+            # A análise fecha um PDF já extraído: entra sem esperar, mas reserva memória
+            memoria_analise = estimar_memoria_mb(total_paginas, 0)
+            controle.reservar(memoria_analise)
+            futuro_analise = executor.submit(
+                _analisar_tarefa, paginas_texto, total_paginas, paginas_imagem,
+                tarefa["caminho"], tarefa["empresa"], tarefa["ano"], textos_ocr,
+            )
+            futuros[futuro_analise] = ("pdf", tarefa, memoria_analise)
+            pendentes.add(futuro_analise)
         
-        return resultados
+        futuros: Dict = {}
+        pendentes = set()
+        fila = _trabalhos(prefetcher)
+        fila_esgotada = False
+        retido = None  # Trabalho que não coube no orçamento de memória, aguardando
         
-    except Exception as e:
-        print(f"\nERRO ao processar {caminho_pdf}: {e}")
-        return None
+        while pendentes or not fila_esgotada or retido:
+            if controle_execucao is not None and controle_execucao.cancelado:
+                fila_esgotada, retido = True, None  # Só esperar os trabalhos em execução
+            em_ocr = sum(1 for f in pendentes if futuros[f][0] == "ocr")  # Não ocupam os workers de contagem
+            while len(pendentes) - em_ocr < max_na_fila and not (controle_execucao is not None and controle_execucao.pausado):
+                if fila_esgotada and not retido:
+                    break
+                ja_retido = retido is not None
+                proximo = retido or next(fila, None)
+                retido = None
+                if proximo is None:
+                    fila_esgotada = True
+                    break
+                tipo, t, funcao, argumentos, memoria = proximo
+                if not controle.cabe(memoria, _rss_workers(executor)):
+                    if not ja_retido:
+                        controle.reter()
+                    retido = proximo
+                    break
+                controle.reservar(memoria)
+                futuro = executor.submit(funcao, *argumentos)
+                futuros[futuro] = (tipo, t, memoria)
+                pendentes.add(futuro)
+            
+            metricas.definir("fila_trabalhos", len(pendentes) - em_ocr, fila="despachados")
+            metricas.definir("fila_trabalhos", em_ocr, fila="ocr")
+            metricas.definir("fila_trabalhos", 1 if retido else 0, fila="retidos_memoria")
+            metricas.definir("fila_trabalhos", total_pdfs - concluidos, fila="pdfs_restantes")
+            metricas.definir("memoria_reservada_mb", controle.reservado_mb)
+            rss = _rss_workers(executor)
+            if rss is not None:
+                metricas.definir("rss_workers_mb", rss)
+            
+            if not pendentes:
+                time.sleep(INTERVALO_VERIFICACAO_SEGUNDOS)  # Pausado sem nada em execução
+                continue
+            prontos, pendentes = wait(pendentes, return_when=FIRST_COMPLETED)
+            for futuro in prontos:
+                tipo, tarefa, memoria = futuros.pop(futuro)
+                if tipo != "ocr":
+                    controle.liberar(memoria)  # O OCR roda no pool próprio e não reserva memória
+                pdf_nome = os.path.basename(tarefa["caminho"])
+                
+                if tipo == "bloco":
+                    estado = blocos_por_indice[tarefa["indice"]]
+                    if estado["falhou"]:
+                        continue
+                    try:
+                        paginas_texto, total_paginas, paginas_imagem, segundos = futuro.result()
+                    except ExecucaoCancelada:
+                        estado["falhou"] = True  # Fica fora do diário: refeito no --resume
+                        continue
+                    except Exception as e:
+                        # Um bloco falhou: o PDF inteiro conta como erro (como em processar_pdf)
+                        print(f"\nERRO ao processar {tarefa['caminho']}: {e}")
+                        estado["falhou"] = True
+                        concluidos += 1
+                        if callback:
+                            callback(concluidos, total_pdfs, pdf_nome, "pdf")
+                        concluir(tarefa, None, estado["segundos"], {"timeout": isinstance(e, TimeoutExtracao)})
+                        continue
+                    metricas.observar("extracao_bloco", segundos)
+                    estado["paginas_texto"].extend(paginas_texto)
+                    estado["paginas_imagem"].extend(paginas_imagem)
+                    estado["total_paginas"] = total_paginas
+                    estado["segundos"] += segundos
+                    estado["restantes"] -= 1
+                    if estado["restantes"] == 0:
+                        paginas_imagem = sorted(estado["paginas_imagem"])
+                        if paginas_imagem and OCR_HABILITADO and OCR_DISPONIVEL:
+                            _despachar_ocr(
+                                tarefa, estado["paginas_texto"], estado["total_paginas"], paginas_imagem,
+                                0.0, {"extracao": estado["segundos"]},
+                            )
+                        else:
+                            _despachar_analise(tarefa, estado["paginas_texto"], estado["total_paginas"], paginas_imagem)
+                    continue
+                
+                if tipo == "ocr":
+                    estado = ocr_por_indice[tarefa["indice"]]
+                    try:
+                        textos_ocr, segundos = futuro.result()
+                    except ExecucaoCancelada:
+                        ocr_por_indice.pop(tarefa["indice"])
+                        blocos_por_indice.pop(tarefa["indice"], None)
+                        continue
+                    except Exception as e:
+                        print(f"\nAVISO: OCR falhou em {tarefa['caminho']}: {e}")
+                        textos_ocr, segundos = [], 0.0
+                    estado["segundos"] += segundos
+                    estado["etapas"]["ocr"] = segundos
+                    _despachar_analise(
+                        tarefa, estado["paginas_texto"], estado["total_paginas"], estado["paginas_imagem"], textos_ocr
+                    )
+                    continue
+                
+                try:
+                    resultado, segundos, etapas = futuro.result()
+                except ExecucaoCancelada:
+                    ocr_por_indice.pop(tarefa["indice"], None)
+                    blocos_por_indice.pop(tarefa["indice"], None)
+                    continue
+                except Exception as e:
+                    concluidos += 1
+                    if callback:
+                        callback(concluidos, total_pdfs, pdf_nome, "pdf")
+                    print(f"\nERRO ao processar {pdf_nome}: {e}")
+                    erros.append(tarefa["caminho"])
+                    metricas.registrar_documento("erro")
+                    continue
+                if "ocr_pendente" in etapas:
+                    paginas_texto, total_paginas, paginas_imagem = etapas.pop("ocr_pendente")
+                    _despachar_ocr(tarefa, paginas_texto, total_paginas, paginas_imagem, segundos, etapas)
+                    continue
+                
+                concluidos += 1
+                if callback:
+                    callback(concluidos, total_pdfs, pdf_nome, "pdf")
+                try:
+                    if tarefa["indice"] in blocos_por_indice:
+                        segundos += blocos_por_indice.pop(tarefa["indice"])["segundos"]
+                    if tarefa["indice"] in ocr_por_indice:
+                        anterior = ocr_por_indice.pop(tarefa["indice"])
+                        segundos += anterior["segundos"]
+                        etapas = {**anterior["etapas"], **etapas}
+                    concluir(tarefa, resultado, segundos, etapas)
+                except Exception as e:
+                    print(f"\nERRO ao processar {pdf_nome}: {e}")
+                    erros.append(tarefa["caminho"])
+                    metricas.registrar_documento("erro")
+    
+    if controle.retencoes:
+        print(
+            f"\nControle de memória: {controle.retencoes} despachos aguardaram memória livre "
+            f"(orçamento de {controle.orcamento_mb:.0f} MB)."
+        )
 
 def varrer_pastas(
-    callback: Optional[Callable[[int, int, str, str], None]] = None
-) -> List[Dict]:
+    callback: Optional[Callable[[int, int, str, str], None]] = None,
+    retomar: bool = False,
+    selecionar: Optional[Callable[[List[Dict]], List[Dict]]] = None,
+    arquivo_diario: Optional[str] = None,
+    controle: Optional[ControleExecucao] = None
+) -> TabelaResultados:
     """
     Varre recursivamente a pasta raiz e processa todos os PDFs.
     callback(atual, total, nome_arquivo, etapa) é chamado para atualizar progresso.
     etapa: "iniciando" | "pdf" | "excel" | "concluido"
-    Retorna lista de dicionários com resultados.
+    Com NUM_WORKERS_PDF > 1, os PDFs são despachados em ordem LPT (maior custo estimado
+    primeiro) para um pool de processos, e PDFs gigantes são divididos em blocos de páginas.
+    A ordem dos resultados é sempre a do rglob.
+    Cada PDF concluído é gravado no diário (ARQUIVO_DIARIO). Com retomar=True, PDFs já
+    concluídos (mesmo tamanho/mtime) não são reprocessados: seus resultados vêm do diário.
+    selecionar(tarefas) pode restringir os PDFs processados (ex.: amostra da prévia);
+    arquivo_diario troca o diário usado (para não sobrescrever o da execução completa).
+    `controle` (ControleExecucao) permite pausar e cancelar: a extração para entre páginas;
+    cancelada, a varredura devolve só os PDFs concluídos, que já estão no diário, e os
+    demais são processados num --resume.
+    Retorna os resultados numa TabelaResultados (colunar; iterar devolve dicionários).
     """
     pasta_raiz = Path(PASTA_RAIZ)
     
     if not pasta_raiz.exists():
         raise FileNotFoundError(f"Pasta raiz não encontrada: {PASTA_RAIZ}")
     
-    todos_resultados = []
     erros = []
     
     # Encontrar todos os PDFs
@@ -852,59 +1627,151 @@ def varrer_pastas(
     
     if not pdfs:
         print(f"Nenhum PDF encontrado em {PASTA_RAIZ}")
-        return []
-    
-    total_pdfs = len(pdfs)
-    print(f"Encontrados {total_pdfs} PDFs para processar.\n")
+        return TabelaResultados()
     
-    if callback:
-        callback(0, total_pdfs, "", "iniciando")
+    # Dicionário e matcher carregados antes de criar os workers (que herdam ou leem do cache)
+    try:
+        _, hash_dic = obter_dicionario()
+        obter_taxonomia()
+    except (OSError, ValueError) as e:
+        print(f"Erro ao carregar o dicionário de termos ({ARQUIVO_DICIONARIO}): {e}")
+        return TabelaResultados()
+    if avisos_dicionario():
+        print(
+            f"AVISO: {len(avisos_dicionario())} avisos na compilação do dicionário "
+            f"(veja a aba parametros ou rode com --verificar-dicionario)."
+        )
+    # Resultados com outra configuração de saída (idioma, OCR, exemplos...) não se misturam na retomada
+    hash_config = hash_configuracao(configuracao_atual())
+    if DETECTAR_TEXTO_RECORRENTE and (CALCULAR_COOCORRENCIA or MODO_SOMENTE_CONTAGEM or CONTAGEM_POR_PAGINA):
+        # Coocorrência, modo só contagem e contagem por página precisam das posições no texto inteiro
+        print(
+            "AVISO: DETECTAR_TEXTO_RECORRENTE é ignorado com CALCULAR_COOCORRENCIA, "
+            "MODO_SOMENTE_CONTAGEM ou CONTAGEM_POR_PAGINA."
+        )
     
-    # Processar cada PDF
-    processados = 0
+    # Identificar empresa (pasta imediatamente abaixo da raiz) e ano (pasta 2023/2024/2025 ou nome do arquivo)
+    tarefas = []
     for idx, caminho_pdf in enumerate(pdfs):
-        pdf_nome = os.path.basename(caminho_pdf)
-        if callback:
-            callback(idx + 1, total_pdfs, pdf_nome, "pdf")
-        
-        # Identificar empresa (pasta imediatamente abaixo da raiz)
-        partes = caminho_pdf.relative_to(pasta_raiz).parts
-        if len(partes) < 2:
+        identificacao = identificar_empresa_ano(caminho_pdf, pasta_raiz)
+        if identificacao is None:
             erros.append(f"PDF fora da estrutura esperada: {caminho_pdf}")
             continue
         
-        empresa = partes[0]
+        empresa, ano = identificacao
         
         # Filtrar por empresa se especificado
         if EMPRESA_FILTRO is not None and empresa != EMPRESA_FILTRO:
             continue  # Pular esta empresa
         
-        # Identificar ano (pasta 2023/2024/2025)
-        ano = None
-        for parte in partes[1:]:
-            if parte in ["2023", "2024", "2025"]:
-                ano = parte
-                break
-        
-        # Se não encontrou ano na estrutura de pastas, tentar extrair do nome do arquivo
-        if ano is None:
-            nome_arquivo = partes[-1]  # Nome do PDF
-            # Tentar encontrar ano no nome do arquivo (2023, 2024, 2025)
-            ano_match = re.search(r'(202[3-5])', nome_arquivo)
-            if ano_match:
-                ano = ano_match.group(1)
+        tarefas.append({
+            "indice": idx, "caminho": str(caminho_pdf), "empresa": empresa, "ano": ano,
+            "hash_dicionario": hash_dic, "hash_configuracao": hash_config,
+        })
+    
+    # Tamanho e páginas (cache do inventário) alimentam o modelo de custo
+    tarefas = complementar_metadados(tarefas)
+    metricas = MetricasExecucao()
+    for tarefa in tarefas:
+        metricas.registrar_cache("metadados", tarefa["em_cache"])
+    if selecionar is not None:
+        tarefas = selecionar(tarefas)
+    modelo = ModeloCusto()
+    
+    # Linhas guardadas em colunas à medida que os PDFs terminam (ordem do rglob no fim)
+    tabela = TabelaResultados()
+    
+    # Retomada: reaproveitar PDFs já concluídos no diário
+    diario = DiarioResultados(arquivo_diario or ARQUIVO_DIARIO)
+    if retomar:
+        concluidos = diario.carregar()
+        pendentes = []
+        for tarefa in tarefas:
+            registro = concluidos.get(tarefa["caminho"])
+            reaproveitar = registro_vale_para(registro, tarefa)
+            metricas.registrar_cache("diario", reaproveitar)
+            if reaproveitar:
+                tabela.adicionar(registro["resultados"], tarefa["indice"])
             else:
-                ano = "DESCONHECIDO"
-        
-        # Processar PDF
-        try:
-            resultado = processar_pdf(str(caminho_pdf), empresa, ano)
-            if resultado:
-                todos_resultados.extend(resultado)
-            processados += 1
-        except Exception as e:
-            print(f"\nERRO ao processar {pdf_nome}: {e}")
-            erros.append(str(caminho_pdf))
+                pendentes.append(tarefa)
+        print(f"Retomando: {len(tarefas) - len(pendentes)} PDFs já concluídos no diário.")
+        tarefas = pendentes
+    
+    total_pdfs = len(tarefas)
+    print(f"Encontrados {total_pdfs} PDFs para processar.\n")
+    
+    if callback:
+        callback(0, total_pdfs, "", "iniciando")
+    
+    def _concluir(tarefa: Dict, resultado: Optional[List[Dict]], segundos: float, etapas: Optional[Dict] = None):
+        etapas = etapas or {}
+        for etapa in ("extracao", "ocr", "analise"):
+            if etapa in etapas:
+                metricas.observar(etapa, etapas[etapa])
+        metricas.observar("pdf", segundos)
+        if resultado is not None:
+            modelo.registrar(tarefa, segundos)
+            diario.registrar(tarefa, "ok", resultado, segundos)
+            tabela.adicionar(resultado, tarefa["indice"])
+            metricas.registrar_documento("ok", tarefa.get("paginas"), tarefa.get("tamanho_bytes"))
+        else:
+            diario.registrar(tarefa, "erro", segundos=segundos)
+            metricas.registrar_documento("timeout" if etapas.get("timeout") else "erro")
+    
+    if PERFIL_MATCHER:
+        reiniciar_perfil()  # Antes de criar os workers: o perfil cobre só esta execução
+    
+    servidor_metricas = ServidorMetricas(metricas, PORTA_METRICAS) if PORTA_METRICAS else None
+    if servidor_metricas:
+        servidor_metricas.iniciar()
+    diario.abrir(retomar)
+    configurar_controle(controle)  # Extração no próprio processo (sem workers)
+    try:
+        if NUM_WORKERS_PDF <= 1:
+            # Pré-leitura: o próximo PDF já está em memória quando o atual termina
+            with PrefetcherPDF([t["caminho"] for t in tarefas]) as prefetcher:
+                for atual, tarefa in enumerate(tarefas, 1):
+                    try:
+                        if controle is not None:
+                            controle.aguardar()
+                    except ExecucaoCancelada:
+                        break
+                    pdf_nome = os.path.basename(tarefa["caminho"])
+                    if callback:
+                        callback(atual, total_pdfs, pdf_nome, "pdf")
+                    metricas.definir("fila_trabalhos", total_pdfs - atual + 1, fila="pdfs_restantes")
+                    try:
+                        inicio = time.perf_counter()
+                        dados = prefetcher.obter(tarefa["caminho"])
+                        metricas.observar("espera_prefetch", time.perf_counter() - inicio)
+                        metricas.registrar_cache("prefetch", dados is not None)
+                        tarefa["custo_estimado"] = modelo.estimar(tarefa)
+                        resultado, segundos, etapas = _processar_tarefa(
+                            tarefa["caminho"], tarefa["empresa"], tarefa["ano"], dados, _timeout_tarefa(tarefa)
+                        )
+                        _concluir(tarefa, resultado, segundos, etapas)
+                    except ExecucaoCancelada:
+                        break
+                    except Exception as e:
+                        print(f"\nERRO ao processar {pdf_nome}: {e}")
+                        erros.append(tarefa["caminho"])
+                        metricas.registrar_documento("erro")
+                    rss = rss_processos_mb([os.getpid()])
+                    if rss is not None:
+                        metricas.definir("rss_workers_mb", rss)
+                metricas.definir("fila_trabalhos", 0, fila="pdfs_restantes")
+        else:
+            ordenadas = ordenar_lpt(tarefas, modelo)
+            gigantes = sum(1 for t in ordenadas if t["gigante"])
+            if gigantes:
+                print(f"{gigantes} PDFs gigantes serão despachados primeiro.")
+            _executar_em_paralelo(ordenadas, _concluir, erros, callback, metricas, controle)
+    finally:
+        configurar_controle(None)
+        diario.fechar()
+        modelo.salvar()
+        if servidor_metricas:
+            servidor_metricas.encerrar()
     
     if erros:
         print(f"\n{len(erros)} erros encontrados durante o processamento.")
@@ -913,7 +1780,17 @@ def varrer_pastas(
         if len(erros) > 10:
             print(f"  ... e mais {len(erros) - 10} erros.")
     
-    return todos_resultados
+    if controle is not None and controle.cancelado:
+        print(
+            f"\nExecução cancelada: os PDFs concluídos estão no diário ({diario.arquivo}). "
+            f"Rode com --resume para continuar de onde parou."
+        )
+    
+    if PERFIL_MATCHER:
+        exportar_perfil()
+    
+    tabela.ordenar()
+    return tabela
 
 # ============================================================================
 # FUNÇÕES DE GERAÇÃO DE EXCEL
@@ -936,7 +1813,7 @@ def gerar_aba_resumo(df_completo: pd.DataFrame) -> pd.DataFrame:
     """
     Gera aba de resumo agrupada por empresa, ano e grupo.
     """
-    resumo = df_completo.groupby(["empresa", "ano", "grupo"]).agg({
+    resumo = df_completo.groupby(["empresa", "ano", "grupo"], observed=True).agg({
         "pdf_nome": "nunique",  # PDFs únicos com ocorrência
         "ocorrencias_total_grupo": "sum"  # Total de ocorrências
     }).reset_index()
@@ -951,7 +1828,8 @@ def gerar_aba_evolucao(df_completo: pd.DataFrame) -> pd.DataFrame:
     Gera aba de evolução por empresa e grupo com deltas e percentuais.
     """
     # Criar pivot table: empresa + grupo como índice, ano como coluna
-    pivot = df_completo.groupby(["empresa", "grupo", "ano"])["ocorrencias_total_grupo"].sum().reset_index()
+    pivot = df_completo.groupby(["empresa", "grupo", "ano"], observed=True)["ocorrencias_total_grupo"].sum().reset_index()
+    pivot["ano"] = pivot["ano"].astype(str)  # Colunas de ano como texto (a entrada pode ter categóricas)
     pivot = pivot.pivot_table(
         index=["empresa", "grupo"],
         columns="ano",
@@ -997,53 +1875,89 @@ def gerar_aba_evolucao(df_completo: pd.DataFrame) -> pd.DataFrame:
     
     return pivot
 
+def gerar_aba_coocorrencia(df_completo: pd.DataFrame) -> pd.DataFrame:
+    """
+    Gera aba de coocorrência: um par de termos por linha e PDF, com pares a até
+    JANELA_COOCORRENCIA_TOKENS tokens e páginas em comum.
+    """
+    linhas = []
+    for registro in df_completo[["empresa", "ano", "pdf_nome", "grupo", "coocorrencias"]].itertuples(index=False):
+        if not isinstance(registro.coocorrencias, str):
+            continue
+        for termo_a, grupo_b, termo_b, pares, paginas in json.loads(registro.coocorrencias):
+            linhas.append((
+                registro.empresa, registro.ano, registro.pdf_nome,
+                registro.grupo, termo_a, grupo_b, termo_b, pares, paginas
+            ))
+    colunas = ["empresa", "ano", "pdf_nome"] + COLUNAS_COOCORRENCIA
+    return pd.DataFrame(linhas, columns=colunas)
+
 def gerar_aba_auditoria() -> pd.DataFrame:
     """
-    Gera aba de auditoria com lista de termos por grupo.
-    """
-    dados = []
-    
-    # Grupo IA_LLM
-    dados.append({
-        "grupo": "IA_LLM",
-        "tipo": "Termos",
-        "lista": ", ".join(TERMOS_IA_LLM["IA_LLM"])
-    })
-    dados.append({
-        "grupo": "IA_LLM",
-        "tipo": "Siglas Sensíveis",
-        "lista": ", ".join(TERMOS_IA_LLM["SIGLAS_SENSIVEIS"])
-    })
-    
-    # Grupo DADOS_BI
-    dados.append({
-        "grupo": "DADOS_BI",
-        "tipo": "Termos",
-        "lista": ", ".join(TERMOS_DADOS_BI["DADOS_BI"])
-    })
-    dados.append({
-        "grupo": "DADOS_BI",
-        "tipo": "Siglas Sensíveis",
-        "lista": ", ".join(TERMOS_DADOS_BI["SIGLAS_SENSIVEIS"])
-    })
+    Gera aba de auditoria com lista de termos por grupo e a identificação do dicionário
+    usado (arquivo, versão e hash), para reprodutibilidade.
+    """
+    dicionario, hash_dic = obter_dicionario()
+    dados = [
+        {"grupo": "(dicionário)", "tipo": "Arquivo", "lista": ARQUIVO_DICIONARIO},
+        {"grupo": "(dicionário)", "tipo": "Versão", "lista": str(dicionario.get("versao") or "")},
+        {"grupo": "(dicionário)", "tipo": "Hash SHA-256", "lista": hash_dic},
+        {
+            "grupo": "(dicionário)",
+            "tipo": "Verificações de contexto",
+            "lista": ", ".join(f"{t}: {r}" for t, r in dicionario["verificacoes"].items())
+        },
+        {"grupo": "(dicionário)", "tipo": "Detecção de idioma", "lista": "sim" if DETECTAR_IDIOMA else "não"},
+        {
+            "grupo": "(configuração)",
+            "tipo": "Hash SHA-256",
+            "lista": f"{hash_configuracao(configuracao_atual())} ({json.dumps(configuracao_atual(), ensure_ascii=False)})"
+        },
+    ]
+    for idioma, termos in dicionario["idiomas"].items():
+        dados.append({"grupo": f"(idioma {idioma})", "tipo": "Termos exclusivos", "lista": ", ".join(termos)})
+    for aviso in avisos_dicionario():
+        dados.append({
+            "grupo": aviso["grupo"],
+            "tipo": "Aviso do compilador",
+            "lista": f"{aviso['termo']}: {aviso['problema']}"
+        })
+    
+    for grupo, definicao in dicionario["grupos"].items():
+        dados.append({
+            "grupo": grupo,
+            "tipo": "Termos",
+            "lista": ", ".join(definicao["termos"])
+        })
+        dados.append({
+            "grupo": grupo,
+            "tipo": "Siglas Sensíveis",
+            "lista": ", ".join(definicao["siglas"])
+        })
     
     return pd.DataFrame(dados)
 
-def gerar_excel(resultados: List[Dict]):
+def gerar_excel(resultados: Union[TabelaResultados, List[Dict]], arquivo_saida: Optional[str] = None):
     """
-    Gera arquivo Excel com todas as abas solicitadas.
+    Gera arquivo Excel com todas as abas solicitadas (em `arquivo_saida`; padrão ARQUIVO_EXCEL_SAIDA).
     """
+    arquivo_saida = arquivo_saida or ARQUIVO_EXCEL_SAIDA
     if not resultados:
         print("Nenhum resultado para gerar Excel.")
         return
     
-    # Criar DataFrame completo
-    df_completo = pd.DataFrame(resultados)
+    # Criar DataFrame completo (chaves categóricas e contagens inteiras, sem cópia)
+    if isinstance(resultados, TabelaResultados):
+        df_completo = resultados.para_dataframe()
+    else:
+        df_completo = pd.DataFrame(resultados)
+    if "mencoes_por_paragrafo" in df_completo.columns:
+        df_completo = classificar_recorrencia(df_completo)
     
     print(f"\nGerando Excel com {len(df_completo)} registros...")
     
     # Criar writer Excel
-    with pd.ExcelWriter(ARQUIVO_EXCEL_SAIDA, engine='openpyxl') as writer:
+    with pd.ExcelWriter(arquivo_saida, engine='openpyxl') as writer:
         # Abas analíticas por ano
         abas_analiticas = gerar_aba_analitica_por_ano(df_completo)
         for nome_aba, df_aba in abas_analiticas.items():
@@ -1060,19 +1974,108 @@ def gerar_excel(resultados: List[Dict]):
         df_evolucao = gerar_aba_evolucao(df_completo)
         df_evolucao.to_excel(writer, sheet_name="evolucao", index=False)
         
+        # Abas do índice de ênfase em IA (densidades, share IA/(IA+BI), z-scores)
+        df_indice_docs = calcular_indice_documentos(df_completo)
+        df_indice_docs.to_excel(writer, sheet_name="indice_documentos", index=False)
+        calcular_indice_empresa_ano(df_indice_docs).to_excel(writer, sheet_name="indice_empresa_ano", index=False)
+        
+        # Aba de coocorrência (se calculada)
+        if "coocorrencias" in df_completo.columns:
+            gerar_aba_coocorrencia(df_completo).to_excel(writer, sheet_name="coocorrencia", index=False)
+        
+        # Aba das páginas com mais ocorrências (se a contagem por página estiver ligada)
+        if "ocorrencias_por_pagina" in df_completo.columns:
+            gerar_aba_top_paginas(df_completo).to_excel(writer, sheet_name="top_paginas", index=False)
+        
+        # Aba de menções novas x recorrentes (se a detecção de texto recorrente estiver ligada)
+        if "ocorrencias_novas" in df_completo.columns:
+            gerar_aba_recorrencia(df_completo).to_excel(writer, sheet_name="recorrencia", index=False)
+        
+        # Aba de custo/seletividade por termo (se o perfil do matcher estiver ligado)
+        if PERFIL_MATCHER:
+            perfil = carregar_perfis()
+            if perfil.termos:
+                perfil.para_dataframe().to_excel(writer, sheet_name="perfil_termos", index=False)
+        
         # Aba de auditoria
         df_auditoria = gerar_aba_auditoria()
         df_auditoria.to_excel(writer, sheet_name="parametros", index=False)
     
-    print(f"\n✓ Excel gerado com sucesso: {ARQUIVO_EXCEL_SAIDA}")
+    print(f"\n✓ Excel gerado com sucesso: {arquivo_saida}")
     print(f"  Total de registros: {len(df_completo)}")
     print(f"  Total de PDFs únicos: {df_completo['pdf_nome'].nunique()}")
 
+def executar_previa(fracao: float = FRACAO_AMOSTRA_PADRAO, semente: int = SEMENTE_PADRAO):
+    """
+    Prévia rápida: processa uma amostra estratificada (empresa x ano, ponderada por tamanho)
+    e grava em ARQUIVO_EXCEL_PREVIA os totais extrapolados de resumo_empresas e evolucao,
+    com intervalos de confiança por bootstrap. A mesma semente reproduz a prévia.
+    """
+    populacao: List[Dict] = []
+    
+    def _selecionar(tarefas: List[Dict]) -> List[Dict]:
+        populacao.extend(tarefas)
+        amostra = sortear_amostra(tarefas, fracao, semente=semente)
+        print(f"Prévia: {len(amostra)} de {len(tarefas)} PDFs sorteados (fração {fracao:.0%}, semente {semente}).")
+        return amostra
+    
+    resultados = varrer_pastas(selecionar=_selecionar, arquivo_diario=ARQUIVO_DIARIO_PREVIA)
+    amostra = [t for t in populacao if "estrato_pdfs" in t]
+    if not amostra:
+        print("\nNenhum PDF na amostra.")
+        return
+    
+    # Sorteados sem sucesso no diário da prévia (erro, timeout, cancelados) não contam como zero
+    registros = DiarioResultados(ARQUIVO_DIARIO_PREVIA).carregar()
+    falhas = {
+        t["caminho"] for t in amostra
+        if registros.get(t["caminho"], {}).get("status") != "ok"
+    }
+    
+    dicionario, hash_dic = obter_dicionario()
+    grupos = list(dicionario["grupos"])
+    estimativas = estimar_estratos(amostra, resultados, grupos, REPLICAS_BOOTSTRAP, semente, falhas)
+    sem_estimativa = len({(t["empresa"], t["ano"]) for t in amostra} - set(estimativas))
+    if sem_estimativa:
+        print(f"AVISO: {sem_estimativa} estratos sem nenhum PDF sorteado processado ficaram fora da prévia.")
+    
+    df_amostra = pd.DataFrame([
+        {k: t.get(k) for k in ("empresa", "ano", "caminho", "tamanho_bytes", "paginas", "estrato_pdfs", "estrato_bytes")}
+        for t in amostra
+    ])
+    df_parametros = pd.DataFrame([
+        {"parametro": "fracao_amostra", "valor": fracao},
+        {"parametro": "semente", "valor": semente},
+        {"parametro": "replicas_bootstrap", "valor": REPLICAS_BOOTSTRAP},
+        {"parametro": "nivel_confianca", "valor": NIVEL_CONFIANCA},
+        {"parametro": "pdfs_populacao", "valor": len(populacao)},
+        {"parametro": "pdfs_amostra", "valor": len(amostra)},
+        {"parametro": "pdfs_amostra_com_erro", "valor": len(falhas)},
+        {"parametro": "estratos_sem_estimativa", "valor": sem_estimativa},
+        {"parametro": "hash_dicionario", "valor": hash_dic},
+    ])
+    
+    os.makedirs(os.path.dirname(ARQUIVO_EXCEL_PREVIA), exist_ok=True)
+    with pd.ExcelWriter(ARQUIVO_EXCEL_PREVIA, engine='openpyxl') as writer:
+        resumo_estimado(estimativas, grupos, NIVEL_CONFIANCA).to_excel(writer, sheet_name="resumo_empresas", index=False)
+        evolucao_estimada(estimativas, grupos, NIVEL_CONFIANCA).to_excel(writer, sheet_name="evolucao", index=False)
+        df_amostra.to_excel(writer, sheet_name="amostra", index=False)
+        df_parametros.to_excel(writer, sheet_name="parametros", index=False)
+    
+    print(f"\n✓ Prévia gerada: {ARQUIVO_EXCEL_PREVIA}")
+    print(f"  Estimativas extrapoladas de {len(amostra)} PDFs (IC {NIVEL_CONFIANCA:.0%} por bootstrap)")
+
 # ============================================================================
 # TELA DE CARREGAMENTO (TKINTER)
 # ============================================================================
 
-def _atualizar_janela_progresso(root: "tk.Tk", barra: "ttk.Progressbar", lbl_status: "tk.Label", lbl_arquivo: "tk.Label"):
+def _atualizar_janela_progresso(
+    root: "tk.Tk",
+    barra: "ttk.Progressbar",
+    lbl_status: "tk.Label",
+    lbl_arquivo: "tk.Label",
+    controle: Optional[ControleExecucao] = None
+):
     """Atualiza a janela de progresso (chamada via root.after a partir da thread)."""
     def _atualizar(atual: int, total: int, nome_arquivo: str, etapa: str):
         try:
@@ -1089,6 +2092,8 @@ def _atualizar_janela_progresso(root: "tk.Tk", barra: "ttk.Progressbar", lbl_sta
                 lbl_arquivo["text"] = ""
             elif etapa == "pdf":
                 lbl_status["text"] = f"Processando PDF {atual} de {total}"
+                if controle is not None and controle.pausado:
+                    lbl_status["text"] += " (pausado)"
                 # Nome do arquivo truncado para caber na tela
                 nome_exibir = nome_arquivo[:60] + "..." if len(nome_arquivo) > 60 else nome_arquivo
                 lbl_arquivo["text"] = nome_exibir or ""
@@ -1111,16 +2116,25 @@ def _rodar_em_thread(
     lbl_arquivo: "tk.Label",
     resultado_ref: list,
     erro_ref: list,
+    retomar: bool = False,
+    controle: Optional[ControleExecucao] = None,
 ):
-    """Executa varrer_pastas + gerar_excel em thread e atualiza a janela via root.after."""
-    atualizar = _atualizar_janela_progresso(root, barra, lbl_status, lbl_arquivo)
+    """
+    Executa varrer_pastas + gerar_excel em thread e atualiza a janela via root.after.
+    Se `controle` for cancelado, o Excel não é gerado: os PDFs concluídos ficam no diário.
+    """
+    atualizar = _atualizar_janela_progresso(root, barra, lbl_status, lbl_arquivo, controle)
     
     def callback(atual: int, total: int, nome_arquivo: str, etapa: str):
         root.after(0, lambda: atualizar(atual, total, nome_arquivo, etapa))
     
     def trabalho():
         try:
-            resultados = varrer_pastas(callback=callback)
+            resultados = varrer_pastas(callback=callback, retomar=retomar, controle=controle)
+            if controle is not None and controle.cancelado:
+                resultado_ref.append(False)
+                root.after(0, lambda: lbl_status.config(text="Cancelado. PDFs concluídos estão no diário (rode com --resume)."))
+                return
             root.after(0, lambda: atualizar(0, 1, "", "excel"))
             if resultados:
                 gerar_excel(resultados)
@@ -1138,21 +2152,25 @@ def _rodar_em_thread(
     t.start()
 
 
-def abrir_janela_carregamento():
-    """Abre janela tkinter com barra de progresso e executa o processamento em thread."""
+def abrir_janela_carregamento(retomar: bool = False):
+    """
+    Abre janela tkinter com barra de progresso e executa o processamento em thread.
+    Pausar/Continuar e Cancelar agem entre páginas; fechar a janela também cancela (a
+    janela fecha quando a varredura para, com o diário íntegro para o --resume).
+    """
     if not TKINTER_DISPONIVEL:
         print("Tkinter não disponível. Executando sem janela de progresso.")
-        main_sem_janela()
+        main_sem_janela(retomar)
         return
     
     root = tk.Tk()
     root.title("Análise de PDFs - IA vs Dados/BI")
-    root.geometry("520x220")
+    root.geometry("520x260")
     root.resizable(True, False)
     
     # Centralizar na tela
     root.update_idletasks()
-    w, h = 520, 220
+    w, h = 520, 260
     x = (root.winfo_screenwidth() // 2) - (w // 2)
     y = (root.winfo_screenheight() // 2) - (h // 2)
     root.geometry(f"{w}x{h}+{x}+{y}")
@@ -1174,14 +2192,50 @@ def abrir_janela_carregamento():
     
     resultado_ref = []
     erro_ref = []
+    controle = ControleExecucao()
     
-    root.after(100, lambda: _rodar_em_thread(root, barra, lbl_status, lbl_arquivo, resultado_ref, erro_ref))
+    def _pausar():
+        if controle.pausado:
+            controle.retomar()
+            btn_pausar["text"] = "Pausar"
+            lbl_status["text"] = "Continuando..."
+        else:
+            controle.pausar()
+            btn_pausar["text"] = "Continuar"
+            lbl_status["text"] = "Pausando (as páginas em andamento terminam antes)..."
+    
+    def _cancelar():
+        controle.cancelar()
+        btn_pausar.state(["disabled"])
+        btn_cancelar.state(["disabled"])
+        lbl_status["text"] = "Cancelando (as páginas em andamento terminam antes)..."
+    
+    def _fechar():
+        if resultado_ref or erro_ref:
+            root.destroy()
+        elif not controle.cancelado:
+            _cancelar()  # A thread fecha a janela quando a varredura parar
+    
+    botoes = ttk.Frame(frame)
+    botoes.pack(anchor=tk.E, pady=(10, 0))
+    btn_pausar = ttk.Button(botoes, text="Pausar", command=_pausar)
+    btn_pausar.pack(side=tk.LEFT, padx=(0, 8))
+    btn_cancelar = ttk.Button(botoes, text="Cancelar", command=_cancelar)
+    btn_cancelar.pack(side=tk.LEFT)
+    root.protocol("WM_DELETE_WINDOW", _fechar)
+    
+    root.after(100, lambda: _rodar_em_thread(
+        root, barra, lbl_status, lbl_arquivo, resultado_ref, erro_ref, retomar, controle
+    ))
     
     root.mainloop()
 
 
-def main_sem_janela():
-    """Execução sem janela (só terminal)."""
+def main_sem_janela(retomar: bool = False):
+    """
+    Execução sem janela (só terminal). Ctrl+C cancela entre páginas, mantendo no diário os
+    PDFs concluídos (um segundo Ctrl+C interrompe na hora).
+    """
     print("=" * 70)
     print("ANÁLISE DE TERMOS EM PDFs - IA vs Dados/BI")
     print("=" * 70)
@@ -1191,11 +2245,24 @@ def main_sem_janela():
         print(f"Filtro de empresa: {EMPRESA_FILTRO}")
     else:
         print("Filtro de empresa: Nenhum")
+    if retomar:
+        print(f"Retomando a partir do diário: {ARQUIVO_DIARIO}")
     print("=" * 70)
     
+    controle = ControleExecucao()
+    
+    def _interromper(sinal, quadro):
+        if controle.cancelado:
+            raise KeyboardInterrupt
+        print("\nCancelando: terminando as páginas em andamento (Ctrl+C de novo para sair na hora)...")
+        controle.cancelar()
+    
+    sinal_anterior = signal.signal(signal.SIGINT, _interromper)
     try:
-        resultados = varrer_pastas()
-        if resultados:
+        resultados = varrer_pastas(retomar=retomar, controle=controle)
+        if controle.cancelado:
+            pass  # Sem Excel parcial: o --resume completa a partir do diário
+        elif resultados:
             gerar_excel(resultados)
         else:
             print("\nNenhum resultado encontrado.")
@@ -1203,18 +2270,121 @@ def main_sem_janela():
         print(f"\nERRO CRÍTICO: {e}")
         import traceback
         traceback.print_exc()
+    finally:
+        signal.signal(signal.SIGINT, sinal_anterior)
 
+def observar_pasta():
+    """
+    Modo contínuo (--observar): processa a pasta retomando do diário e depois observa
+    PASTA_RAIZ. Quando PDFs chegam, mudam ou somem (e ficam estáveis), só os novos/alterados
+    passam por processar_pdf; os demais vêm do diário, e o Excel é regerado em seguida.
+    PDFs que falharam só são tentados de novo se o arquivo mudar.
+    """
+    primeira = [True]
+    
+    def _selecionar(tarefas: List[Dict]) -> List[Dict]:
+        instaveis = observador.instaveis()
+        tarefas = [t for t in tarefas if t["caminho"] not in instaveis]
+        if primeira[0]:
+            return tarefas  # Como no --resume: falhas anteriores são tentadas uma vez
+        registros = DiarioResultados(ARQUIVO_DIARIO).carregar()
+        return [t for t in tarefas if not registro_falhou_para(registros.get(t["caminho"]), t)]
+    
+    def _atualizar(caminhos: List[str]):
+        if caminhos:
+            print(f"\n{len(caminhos)} PDFs novos, alterados ou removidos:")
+            for caminho in caminhos[:10]:
+                print(f"  - {caminho}")
+        resultados = varrer_pastas(retomar=True, selecionar=_selecionar)
+        primeira[0] = False
+        if resultados:
+            try:
+                gerar_excel(resultados)
+            except OSError as e:
+                # Ex.: Excel aberto no Windows; a próxima atualização tenta de novo
+                print(f"\nAVISO: não foi possível gravar {ARQUIVO_EXCEL_SAIDA}: {e}")
+    
+    print("=" * 70)
+    print("ANÁLISE DE TERMOS EM PDFs - MODO CONTÍNUO")
+    print("=" * 70)
+    # Estado inicial lido antes da primeira passada: o que chegar durante ela não se perde
+    observador = ObservadorPasta(PASTA_RAIZ, _atualizar)
+    try:
+        _atualizar([])
+    except Exception as e:
+        print(f"\nERRO CRÍTICO: {e}")
+        return
+    try:
+        observador.executar()
+    except KeyboardInterrupt:
+        print("\nObservação encerrada.")
 
 # ============================================================================
 # MAIN
 # ============================================================================
 
+def verificar_dicionario():
+    """Imprime o resultado da compilação do dicionário de termos (padrões finais e avisos)."""
+    try:
+        bruto = carregar_dicionario(ARQUIVO_DICIONARIO)
+        compilado, hash_dic = obter_dicionario()
+    except (OSError, ValueError) as e:
+        print(f"Erro ao carregar o dicionário de termos ({ARQUIVO_DICIONARIO}): {e}")
+        return
+    entradas = sum(len(g["termos"]) + len(g["siglas"]) for g in bruto["grupos"].values())
+    padroes = len(Taxonomia(compilado["grupos"], criar_regex_termo).termos_unicos)
+    siglas = len({s for g in compilado["grupos"].values() for s in g["siglas"]})
+    print(f"Dicionário: {ARQUIVO_DICIONARIO} (hash {hash_dic[:12]})")
+    print(f"  {entradas} entradas -> {padroes} termos únicos + {siglas} siglas")
+    avisos = avisos_dicionario()
+    if not avisos:
+        print("  ✓ Nenhum aviso.")
+    for aviso in avisos:
+        print(f"  - [{aviso['grupo']}] {aviso['termo']}: {aviso['problema']}")
+
 def main():
     """Função principal. Usa tela de carregamento se USAR_TELA_CARREGAMENTO e tkinter disponível."""
+    parser = argparse.ArgumentParser(description="Conta termos de IA vs Dados/BI nos PDFs e gera o Excel.")
+    parser.add_argument(
+        "--resume", "--retomar", dest="retomar", action="store_true",
+        help="Retoma a execução anterior: pula PDFs já concluídos no diário e reconstrói o Excel"
+    )
+    parser.add_argument(
+        "--previa", nargs="?", type=float, const=FRACAO_AMOSTRA_PADRAO, default=None, metavar="FRACAO",
+        help=f"Prévia por amostragem estratificada (fração dos PDFs por empresa x ano; padrão {FRACAO_AMOSTRA_PADRAO})"
+    )
+    parser.add_argument(
+        "--semente", type=int, default=SEMENTE_PADRAO,
+        help="Semente do sorteio e do bootstrap da prévia (reprodutibilidade)"
+    )
+    parser.add_argument(
+        "--observar", action="store_true",
+        help="Modo contínuo: processa a pasta e fica observando PDFs novos/alterados, atualizando diário e Excel"
+    )
+    parser.add_argument(
+        "--verificar-dicionario", action="store_true",
+        help="Só compila o dicionário de termos e lista normalizações, duplicatas e sobreposições"
+    )
+    args = parser.parse_args()
+    
+    if args.verificar_dicionario:
+        verificar_dicionario()
+        return
+    
+    if args.observar:
+        observar_pasta()
+        return
+    
+    if args.previa is not None:
+        if not 0 < args.previa <= 1:
+            parser.error("--previa deve estar entre 0 e 1")
+        executar_previa(args.previa, args.semente)
+        return
+    
     if USAR_TELA_CARREGAMENTO and TKINTER_DISPONIVEL:
-        abrir_janela_carregamento()
+        abrir_janela_carregamento(args.retomar)
     else:
-        main_sem_janela()
+        main_sem_janela(args.retomar)
 
 
 if __name__ == "__main__":
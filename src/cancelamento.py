@@ -0,0 +1,95 @@
+"""
+Cancelamento, pausa e retomada cooperativos de uma varredura.
+
+Um ControleExecucao é criado por quem inicia a varredura (janela, terminal) e passado a
+varrer_pastas. Os eventos são de multiprocessing: o mesmo controle vale no processo
+principal e nos workers (configurado pelo initializer do pool, como o semáforo do OCR).
+A extração chama ponto_de_parada() entre páginas: em pausa, espera ali; cancelada, levanta
+ExecucaoCancelada. O PDF interrompido não entra no diário e é refeito no --resume; os já
+concluídos continuam no diário (gravado com fsync a cada PDF).
+"""
+
+import time
+import multiprocessing
+from typing import Optional
+
+# ============================================================================
+# CONFIGURAÇÕES
+# ============================================================================
+
+INTERVALO_VERIFICACAO_SEGUNDOS = 0.5  # Em pausa, frequência com que o cancelamento é verificado
+
+# ============================================================================
+# CONTROLE
+# ============================================================================
+
+class ExecucaoCancelada(Exception):
+    """A varredura foi cancelada pelo usuário (botão Cancelar ou Ctrl+C)."""
+
+class ControleExecucao:
+    """Pedido de cancelamento e estado de pausa, compartilhados entre processos."""
+
+    def __init__(self):
+        self._cancelado = multiprocessing.Event()
+        self._liberado = multiprocessing.Event()  # Limpo enquanto pausado
+        self._liberado.set()
+
+    @property
+    def cancelado(self) -> bool:
+        return self._cancelado.is_set()
+
+    @property
+    def pausado(self) -> bool:
+        return not self._liberado.is_set() and not self.cancelado
+
+    def cancelar(self):
+        self._cancelado.set()
+        self._liberado.set()  # Quem está em pausa acorda e vê o cancelamento
+
+    def pausar(self):
+        if not self.cancelado:
+            self._liberado.clear()
+
+    def retomar(self):
+        self._liberado.set()
+
+    def aguardar(self):
+        """Espera enquanto pausado; levanta ExecucaoCancelada se cancelado."""
+        while not self._liberado.wait(INTERVALO_VERIFICACAO_SEGUNDOS):
+            pass
+        if self._cancelado.is_set():
+            raise ExecucaoCancelada("execução cancelada")
+
+# ============================================================================
+# CONTROLE DO PROCESSO (EXTRAÇÃO)
+# ============================================================================
+
+_controle_processo: Optional[ControleExecucao] = None
+_segundos_pausado = 0.0
+_pausado_desde: Optional[float] = None
+
+def configurar_controle(controle: Optional[ControleExecucao]):
+    """Define o controle consultado por ponto_de_parada() neste processo (None desliga)."""
+    global _controle_processo
+    _controle_processo = controle
+
+def ponto_de_parada():
+    """Entre páginas: espera se a execução estiver pausada, levanta ExecucaoCancelada se cancelada."""
+    global _segundos_pausado, _pausado_desde
+    controle = _controle_processo
+    if controle is None:
+        return
+    if controle.pausado:
+        _pausado_desde = time.monotonic()
+        try:
+            controle.aguardar()
+        finally:
+            _segundos_pausado += time.monotonic() - _pausado_desde
+            _pausado_desde = None
+    elif controle.cancelado:
+        raise ExecucaoCancelada("execução cancelada")
+
+def segundos_em_pausa() -> float:
+    """Tempo total que a extração passou pausada neste processo (inclui a pausa em curso)."""
+    desde = _pausado_desde
+    return _segundos_pausado + (time.monotonic() - desde if desde is not None else 0.0)
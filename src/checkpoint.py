@@ -0,0 +1,186 @@
+"""
+Diário (journal) append-only dos resultados por PDF, para retomar execuções interrompidas.
+Cada linha é um JSON com o PDF (caminho, tamanho, mtime), o hash do dicionário de termos,
+o hash da configuração de saída (exemplos, OCR, coocorrência, ...), o status e os resultados.
+"""
+
+import os
+import ast
+import json
+import hashlib
+from pathlib import Path
+from typing import Dict, List, Optional
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+ARQUIVO_DIARIO = str(_PROJECT_ROOT / "data" / "diario_execucao.jsonl")
+
+# Configurações (de analisar_pdfs.py; IDIOMAS_OCR de ocr.py) que mudam as linhas gravadas por
+# PDF. OCR_DISPONIVEL diz se o pytesseract está instalado (OCR habilitado sem ele não roda).
+CONFIGURACOES_SAIDA = (
+    "INCLUIR_PDFS_SEM_OCORRENCIAS", "DETECTAR_PAGINAS_IMAGEM", "OCR_HABILITADO", "IDIOMAS_OCR",
+    "CALCULAR_COOCORRENCIA", "JANELA_COOCORRENCIA_TOKENS", "MODO_SOMENTE_CONTAGEM",
+    "CONTAGEM_POR_PAGINA", "MAX_EXEMPLOS_POR_TERMO", "DETECTAR_TEXTO_RECORRENTE", "DETECTAR_IDIOMA",
+)
+
+
+def configuracao_saida(configuracoes: Dict, ocr_disponivel: bool) -> Dict:
+    """
+    Configuração de saída (colunas, exemplos, contagens) a partir dos valores de
+    CONFIGURACOES_SAIDA. Um registro do diário só é reaproveitado com a mesma configuração.
+    """
+    c = configuracoes
+    return {
+        "incluir_pdfs_sem_ocorrencias": c["INCLUIR_PDFS_SEM_OCORRENCIAS"],
+        "detectar_paginas_imagem": c["DETECTAR_PAGINAS_IMAGEM"],
+        "ocr": c["IDIOMAS_OCR"] if c["OCR_HABILITADO"] and ocr_disponivel else None,
+        "coocorrencia": c["JANELA_COOCORRENCIA_TOKENS"] if c["CALCULAR_COOCORRENCIA"] else None,
+        "somente_contagem": c["MODO_SOMENTE_CONTAGEM"],
+        "contagem_por_pagina": c["CONTAGEM_POR_PAGINA"],
+        "max_exemplos_por_termo": c["MAX_EXEMPLOS_POR_TERMO"],
+        "texto_recorrente": c["DETECTAR_TEXTO_RECORRENTE"],
+        "idioma": c["DETECTAR_IDIOMA"],
+    }
+
+
+def hash_configuracao(configuracao: Dict) -> str:
+    """SHA-256 (JSON canônico) de uma configuracao_saida, gravado no diário ao lado do hash do dicionário."""
+    canonico = json.dumps(configuracao, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(canonico.encode("utf-8")).hexdigest()
+
+
+def ler_configuracoes(arquivos: List[str], nomes=CONFIGURACOES_SAIDA) -> Dict:
+    """
+    Valores literais das atribuições de nível de módulo (NOME = valor) dos `arquivos`,
+    sem importá-los (para ferramentas leves como listar_empresas.py). ValueError se algum
+    dos `nomes` faltar ou não for um literal.
+    """
+    valores = {}
+    for arquivo in arquivos:
+        with open(arquivo, "r", encoding="utf-8") as f:
+            arvore = ast.parse(f.read(), filename=arquivo)
+        for no in arvore.body:
+            if isinstance(no, ast.Assign) and len(no.targets) == 1 and isinstance(no.targets[0], ast.Name):
+                alvo, valor = no.targets[0].id, no.value
+            elif isinstance(no, ast.AnnAssign) and isinstance(no.target, ast.Name) and no.value is not None:
+                alvo, valor = no.target.id, no.value
+            else:
+                continue
+            if alvo in nomes:
+                try:
+                    valores[alvo] = ast.literal_eval(valor)
+                except ValueError:
+                    raise ValueError(f"{alvo} em {arquivo} não é um valor literal")
+    faltando = [n for n in nomes if n not in valores]
+    if faltando:
+        raise ValueError(f"configurações não encontradas: {', '.join(faltando)}")
+    return valores
+
+
+class DiarioResultados:
+    """
+    Grava uma linha por PDF concluído (flush + fsync), de modo que um crash
+    perca no máximo o PDF em andamento. Linhas truncadas no fim são ignoradas na leitura.
+    """
+
+    def __init__(self, arquivo: Optional[str] = None):
+        self.arquivo = arquivo or ARQUIVO_DIARIO
+        self._f = None
+
+    def carregar(self) -> Dict[str, Dict]:
+        """Retorna caminho -> último registro gravado para aquele PDF."""
+        registros = {}
+        try:
+            with open(self.arquivo, "r", encoding="utf-8") as f:
+                for linha in f:
+                    try:
+                        registro = json.loads(linha)
+                    except ValueError:
+                        continue  # Linha incompleta (processo morreu no meio da escrita)
+                    if isinstance(registro, dict) and "caminho" in registro:
+                        registros[registro["caminho"]] = registro
+        except OSError:
+            pass
+        return registros
+
+    def abrir(self, retomar: bool):
+        """Abre o diário: em modo retomar acrescenta ao existente; senão começa do zero."""
+        os.makedirs(os.path.dirname(self.arquivo), exist_ok=True)
+        if retomar:
+            self._descartar_linha_truncada()
+        self._f = open(self.arquivo, "a" if retomar else "w", encoding="utf-8")
+
+    def _descartar_linha_truncada(self):
+        """Remove uma última linha sem '\\n' (escrita interrompida) antes de acrescentar."""
+        try:
+            with open(self.arquivo, "rb+") as f:
+                f.seek(0, os.SEEK_END)
+                tamanho = f.tell()
+                if tamanho == 0:
+                    return
+                f.seek(tamanho - 1)
+                if f.read(1) == b"\n":
+                    return
+                f.seek(0)
+                conteudo = f.read()
+                f.seek(conteudo.rfind(b"\n") + 1)
+                f.truncate()
+        except OSError:
+            pass
+
+    def registrar(
+        self,
+        tarefa: Dict,
+        status: str,
+        resultados: Optional[List[Dict]] = None,
+        segundos: Optional[float] = None,
+    ):
+        """Acrescenta o registro de um PDF e força a gravação em disco."""
+        registro = {
+            "caminho": tarefa["caminho"],
+            "tamanho_bytes": tarefa.get("tamanho_bytes"),
+            "mtime_ns": tarefa.get("mtime_ns"),
+            "hash_dicionario": tarefa.get("hash_dicionario"),
+            "hash_configuracao": tarefa.get("hash_configuracao"),
+            "empresa": tarefa["empresa"],
+            "ano": tarefa["ano"],
+            "status": status,
+            "segundos": round(segundos, 4) if segundos is not None else None,
+            "resultados": resultados or [],
+        }
+        self._f.write(json.dumps(registro, ensure_ascii=False) + "\n")
+        self._f.flush()
+        os.fsync(self._f.fileno())
+
+    def fechar(self):
+        if self._f is not None:
+            self._f.close()
+            self._f = None
+
+
+def _mesma_tarefa(registro: Dict, tarefa: Dict) -> bool:
+    """Mesmo arquivo (tamanho e mtime), mesmo dicionário e mesma configuração de saída."""
+    return all(
+        registro.get(chave) == tarefa.get(chave)
+        for chave in ("tamanho_bytes", "mtime_ns", "hash_dicionario", "hash_configuracao")
+    )
+
+
+def registro_vale_para(registro: Optional[Dict], tarefa: Dict) -> bool:
+    """
+    True se o registro do diário é um sucesso para o mesmo arquivo (tamanho e mtime iguais)
+    contado com o mesmo dicionário de termos e a mesma configuração de saída (hashes iguais).
+    """
+    return (
+        registro is not None
+        and registro.get("status") == "ok"
+        and _mesma_tarefa(registro, tarefa)
+    )
+
+
+def registro_falhou_para(registro: Optional[Dict], tarefa: Dict) -> bool:
+    """True se o registro do diário é uma falha para o mesmo arquivo, dicionário e configuração (tentar de novo não adianta)."""
+    return (
+        registro is not None
+        and registro.get("status") != "ok"
+        and _mesma_tarefa(registro, tarefa)
+    )
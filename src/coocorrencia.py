@@ -0,0 +1,175 @@
+"""
+Coocorrência e proximidade de termos dentro de um documento.
+
+As ocorrências aceitas de todos os grupos viram três vetores (token, termo, página).
+Depois de ordenar por token, uma única varredura com searchsorted encontra, para cada
+ocorrência, as seguintes dentro de JANELA tokens; os pares são contados como matriz
+esparsa no formato COO (termo_a, termo_b, contagem), sem regex par a par.
+
+Posições de termos vêm do texto normalizado e as de siglas do texto original; ambas são
+convertidas para índice de token (\\w+) no respectivo texto. A normalização preserva os
+tokens (só tira acentos/maiúsculas), então os dois índices ficam alinhados na prática.
+Uma posição sobre um delimitador (siglas curtas incluem o delimitador consumido antes,
+ver taxonomia.py) conta no token seguinte, que é onde o termo começa.
+"""
+
+import re
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+JANELA_PADRAO_TOKENS = 50
+
+_RE_TOKEN = re.compile(r'\w+')
+
+COLUNAS_COOCORRENCIA = [
+    "grupo_a", "termo_a", "grupo_b", "termo_b", "pares_na_janela", "paginas_em_comum",
+]
+
+
+def limites_tokens(texto: str) -> Tuple[np.ndarray, np.ndarray]:
+    """(inícios, fins) de cada token (\\w+) do texto."""
+    limites = np.fromiter(
+        (p for m in _RE_TOKEN.finditer(texto) for p in m.span()), dtype=np.int64
+    ).reshape(-1, 2)
+    return limites[:, 0], limites[:, 1]
+
+
+def token_da_posicao(inicios: np.ndarray, fins: np.ndarray, posicoes: np.ndarray) -> np.ndarray:
+    """
+    Índice do token que contém cada posição; se a posição cair fora de um token (espaço
+    ou delimitador antes de uma sigla curta), o token seguinte.
+    """
+    token = np.searchsorted(inicios, posicoes, side="right") - 1
+    if not len(fins):
+        return np.zeros(len(posicoes), dtype=np.int64)
+    fora = (token < 0) | (posicoes >= fins[np.clip(token, 0, None)])
+    return np.where(fora, token + 1, token)
+
+
+def montar_ocorrencias(
+    posicoes_por_termo: Dict[Tuple[str, str], Sequence[int]],
+    eh_sigla: Dict[Tuple[str, str], bool],
+    texto_original: str,
+    texto_normalizado: str,
+    inicios_paginas: Optional[Sequence[int]] = None,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, List[Tuple[str, str]]]:
+    """
+    Converte {(grupo, termo): posições} em vetores ordenados por token.
+    inicios_paginas são as posições (no texto original) onde cada página começa.
+    Retorna: (token, id_termo, pagina, rotulos) com rotulos[id_termo] = (grupo, termo).
+    """
+    tokens_norm = limites_tokens(texto_normalizado)
+    tokens_orig = limites_tokens(texto_original)
+
+    if inicios_paginas:
+        paginas_token = np.searchsorted(tokens_orig[0], np.asarray(inicios_paginas, dtype=np.int64), side="left")
+    else:
+        paginas_token = np.zeros(1, dtype=np.int64)
+
+    rotulos = sorted(posicoes_por_termo)
+    partes_token, partes_termo = [], []
+    for id_termo, chave in enumerate(rotulos):
+        posicoes = np.asarray(posicoes_por_termo[chave], dtype=np.int64)
+        inicios, fins = tokens_orig if eh_sigla.get(chave) else tokens_norm
+        partes_token.append(token_da_posicao(inicios, fins, posicoes))
+        partes_termo.append(np.full(len(posicoes), id_termo, dtype=np.int32))
+
+    if not partes_token:
+        vazio = np.zeros(0, dtype=np.int64)
+        return vazio, vazio.astype(np.int32), vazio, rotulos
+
+    token = np.concatenate(partes_token)
+    termo = np.concatenate(partes_termo)
+    ordem = np.argsort(token, kind="stable")
+    token, termo = token[ordem], termo[ordem]
+    pagina = np.searchsorted(paginas_token, token, side="right") - 1
+    return token, termo, pagina, rotulos
+
+
+def _pares_na_janela(token: np.ndarray, termo: np.ndarray, janela: int, n_termos: int) -> Dict[Tuple[int, int], int]:
+    """Conta pares de ocorrências (i < j) com token[j] - token[i] <= janela, por par de termos."""
+    n = len(token)
+    if n < 2:
+        return {}
+    fim = np.searchsorted(token, token + janela, side="right")
+    inicio = np.arange(1, n + 1)
+    quantos = np.maximum(fim - inicio, 0)
+    total = int(quantos.sum())
+    if total == 0:
+        return {}
+    i = np.repeat(np.arange(n), quantos)
+    deslocamento = np.arange(total) - np.repeat(np.cumsum(quantos) - quantos, quantos)
+    j = np.repeat(inicio, quantos) + deslocamento
+
+    a = np.minimum(termo[i], termo[j]).astype(np.int64)
+    b = np.maximum(termo[i], termo[j]).astype(np.int64)
+    diferentes = a != b
+    chaves, contagens = np.unique(a[diferentes] * n_termos + b[diferentes], return_counts=True)
+    return {(int(k // n_termos), int(k % n_termos)): int(c) for k, c in zip(chaves, contagens)}
+
+
+def _paginas_em_comum(termo: np.ndarray, pagina: np.ndarray, n_termos: int) -> Dict[Tuple[int, int], int]:
+    """Número de páginas em que cada par de termos aparece junto."""
+    if len(termo) < 2:
+        return {}
+    presentes = np.unique(pagina.astype(np.int64) * n_termos + termo)
+    pag = presentes // n_termos
+    ter = presentes % n_termos
+    contagem: Dict[Tuple[int, int], int] = {}
+    limites = np.flatnonzero(np.diff(pag)) + 1
+    for bloco in np.split(ter, limites):
+        if len(bloco) < 2:
+            continue
+        for x in range(len(bloco)):
+            for y in range(x + 1, len(bloco)):
+                chave = (int(bloco[x]), int(bloco[y]))
+                contagem[chave] = contagem.get(chave, 0) + 1
+    return contagem
+
+
+def calcular_coocorrencia(
+    posicoes_por_termo: Dict[Tuple[str, str], Sequence[int]],
+    eh_sigla: Dict[Tuple[str, str], bool],
+    texto_original: str,
+    texto_normalizado: str,
+    inicios_paginas: Optional[Sequence[int]] = None,
+    janela_tokens: int = JANELA_PADRAO_TOKENS,
+) -> pd.DataFrame:
+    """
+    Matriz esparsa (formato longo/COO) de coocorrência entre termos de todos os grupos:
+    pares_na_janela = pares de ocorrências a até `janela_tokens` tokens;
+    paginas_em_comum = páginas onde os dois termos aparecem.
+    Cada par aparece uma vez, com (grupo_a, termo_a) < (grupo_b, termo_b).
+    """
+    token, termo, pagina, rotulos = montar_ocorrencias(
+        posicoes_por_termo, eh_sigla, texto_original, texto_normalizado, inicios_paginas
+    )
+    n_termos = max(len(rotulos), 1)
+    janela = _pares_na_janela(token, termo, janela_tokens, n_termos)
+    paginas = _paginas_em_comum(termo, pagina, n_termos) if inicios_paginas else {}
+
+    linhas = []
+    for a, b in sorted(set(janela) | set(paginas)):
+        linhas.append({
+            "grupo_a": rotulos[a][0], "termo_a": rotulos[a][1],
+            "grupo_b": rotulos[b][0], "termo_b": rotulos[b][1],
+            "pares_na_janela": janela.get((a, b), 0),
+            "paginas_em_comum": paginas.get((a, b), 0),
+        })
+    return pd.DataFrame(linhas, columns=COLUNAS_COOCORRENCIA)
+
+
+def para_matriz(coocorrencias: pd.DataFrame, valor: str = "pares_na_janela") -> pd.DataFrame:
+    """Converte o formato longo em matriz termo x termo (simétrica) com dtype esparso."""
+    if coocorrencias.empty:
+        return pd.DataFrame()
+    a = coocorrencias["grupo_a"] + ":" + coocorrencias["termo_a"]
+    b = coocorrencias["grupo_b"] + ":" + coocorrencias["termo_b"]
+    longo = pd.concat([
+        pd.DataFrame({"linha": a, "coluna": b, "valor": coocorrencias[valor]}),
+        pd.DataFrame({"linha": b, "coluna": a, "valor": coocorrencias[valor]}),
+    ])
+    matriz = longo.pivot_table(index="linha", columns="coluna", values="valor", aggfunc="sum", fill_value=0)
+    return matriz.astype(pd.SparseDtype("int64", 0))
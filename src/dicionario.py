@@ -0,0 +1,251 @@
+"""
+Dicionário de termos externo (YAML ou JSON) e cache em disco do matcher compilado.
+
+O dicionário tem grupos (termos e siglas), as regras de contexto por termo e, opcionalmente,
+os termos exclusivos de cada idioma (usados com a detecção de idioma; ver idioma.py). Seu hash
+(SHA-256 do conteúdo, independente de formatação e comentários) identifica a versão
+usada numa execução: vai para a aba "parametros" e para o diário de retomada.
+Antes do matcher, compilar_dicionario normaliza os termos como o texto (minúsculas, sem
+acento, espaços simples), junta duplicatas e aponta entradas inalcançáveis ou sobrepostas.
+A Taxonomia compilada é gravada em data/cache/ com o hash no nome, de modo que o início
+do processo (e cada worker) carrega o matcher pronto em vez de recompilar os termos.
+"""
+
+import os
+import re
+import json
+import pickle
+import hashlib
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+try:
+    import yaml
+    YAML_DISPONIVEL = True
+except ImportError:
+    YAML_DISPONIVEL = False
+
+from taxonomia import Taxonomia
+
+# ============================================================================
+# CONFIGURAÇÕES
+# ============================================================================
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+ARQUIVO_DICIONARIO = str(_PROJECT_ROOT / "config" / "dicionario_termos.yaml")
+PASTA_CACHE_MATCHER = str(_PROJECT_ROOT / "data" / "cache" / "matchers")
+VERSAO_COMPILADOR = 2  # Incrementar quando a estrutura da Taxonomia mudar (invalida o cache)
+
+# ============================================================================
+# LEITURA E HASH
+# ============================================================================
+
+def _validar_lista(valor, onde: str) -> list:
+    if valor is None:
+        return []
+    if not isinstance(valor, list) or not all(isinstance(v, str) for v in valor):
+        raise ValueError(f"Dicionário inválido: {onde} deve ser uma lista de textos")
+    return valor
+
+def carregar_dicionario(arquivo: Optional[str] = None) -> Dict:
+    """
+    Lê o dicionário (.yaml/.yml ou .json) e devolve
+    {"versao": ..., "grupos": {grupo: {"termos": [...], "siglas": [...]}}, "verificacoes": {termo: regra}},
+    mais "idiomas": {idioma: [termos exclusivos]} se o arquivo tiver essa seção.
+    Levanta ValueError se a estrutura estiver errada.
+    """
+    arquivo = arquivo or ARQUIVO_DICIONARIO
+    with open(arquivo, "r", encoding="utf-8") as f:
+        if arquivo.lower().endswith((".yaml", ".yml")):
+            if not YAML_DISPONIVEL:
+                raise ValueError(f"Instale pyyaml para ler {arquivo} (ou use um dicionário .json)")
+            bruto = yaml.safe_load(f)
+        else:
+            bruto = json.load(f)
+
+    if not isinstance(bruto, dict) or not isinstance(bruto.get("grupos"), dict) or not bruto["grupos"]:
+        raise ValueError(f"Dicionário inválido em {arquivo}: falta o mapa 'grupos'")
+
+    grupos = {}
+    for nome, definicao in bruto["grupos"].items():
+        if not isinstance(definicao, dict):
+            raise ValueError(f"Dicionário inválido: grupo {nome} deve ter 'termos' e/ou 'siglas'")
+        grupos[str(nome)] = {
+            "termos": _validar_lista(definicao.get("termos"), f"grupos.{nome}.termos"),
+            "siglas": _validar_lista(definicao.get("siglas"), f"grupos.{nome}.siglas"),
+        }
+
+    verificacoes = bruto.get("verificacoes") or {}
+    if not isinstance(verificacoes, dict) or not all(isinstance(v, str) for v in verificacoes.values()):
+        raise ValueError("Dicionário inválido: 'verificacoes' deve mapear termo -> nome da regra")
+
+    dicionario = {
+        "versao": bruto.get("versao"),
+        "grupos": grupos,
+        "verificacoes": {str(t): r for t, r in verificacoes.items()},
+    }
+    idiomas = bruto.get("idiomas")
+    if idiomas:
+        # Só entra no dicionário (e no hash) se existir: arquivos sem a seção mantêm o hash
+        if not isinstance(idiomas, dict):
+            raise ValueError("Dicionário inválido: 'idiomas' deve mapear idioma -> lista de termos")
+        dicionario["idiomas"] = {
+            str(idioma): _validar_lista(termos, f"idiomas.{idioma}") for idioma, termos in idiomas.items()
+        }
+    return dicionario
+
+def hash_dicionario(dicionario: Dict) -> str:
+    """SHA-256 do conteúdo do dicionário (JSON canônico)."""
+    canonico = json.dumps(dicionario, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(canonico.encode("utf-8")).hexdigest()
+
+# ============================================================================
+# COMPILAÇÃO (NORMALIZAÇÃO E VALIDAÇÃO DOS TERMOS)
+# ============================================================================
+
+_RE_TOKEN = re.compile(r'\w+')
+
+def _contem_sequencia(tokens: List[str], trecho: List[str]) -> bool:
+    n = len(trecho)
+    return any(tokens[i:i + n] == trecho for i in range(len(tokens) - n + 1))
+
+def compilar_dicionario(dicionario: Dict, normalizar: Callable[[str], str]) -> Tuple[Dict, List[Dict]]:
+    """
+    Conjunto mínimo de padrões: cada termo normalizado com `normalizar` (a mesma função
+    aplicada ao texto), sem duplicatas no grupo; siglas sem duplicatas; regras de contexto
+    com o termo normalizado e só para termos existentes.
+    Retorna (dicionário compilado, avisos). Cada aviso é {"grupo", "termo", "problema"}:
+    termos que só casariam depois de normalizados, duplicatas, regras sem termo e termos
+    contidos em outro do mesmo grupo (as duas entradas contam no mesmo trecho). Termos de
+    idioma que não estão em nenhum grupo ou que aparecem em dois idiomas são ignorados.
+    """
+    avisos: List[Dict] = []
+
+    def _avisar(grupo: str, termo: str, problema: str):
+        avisos.append({"grupo": grupo, "termo": termo, "problema": problema})
+
+    grupos = {}
+    for nome, definicao in dicionario["grupos"].items():
+        termos: List[str] = []
+        for termo in definicao["termos"]:
+            normalizado = normalizar(termo)
+            if not normalizado:
+                _avisar(nome, termo, "vazio após normalização (removido)")
+                continue
+            if normalizado in termos:
+                _avisar(nome, termo, f"duplicado de '{normalizado}' após normalização (removido)")
+                continue
+            if normalizado != termo:
+                _avisar(nome, termo, f"nunca casaria com o texto normalizado; usado como '{normalizado}'")
+            termos.append(normalizado)
+
+        siglas: List[str] = []
+        for sigla in definicao["siglas"]:
+            if sigla in siglas:
+                _avisar(nome, sigla, "sigla duplicada (removida)")
+                continue
+            siglas.append(sigla)
+
+        tokens = {t: _RE_TOKEN.findall(t) for t in termos}
+        for termo in termos:
+            # Espaço no termo aceita espaço ou hífen no texto: "data driven" já casa "data-driven"
+            equivalente = next((
+                outro for outro in termos
+                if outro != termo and tokens[outro] == tokens[termo] and outro == " ".join(tokens[outro])
+            ), None)
+            if equivalente is not None:
+                _avisar(nome, termo, f"variante de '{equivalente}', que já aceita espaço ou hífen (o mesmo trecho conta nas duas)")
+                continue
+            contem = [
+                outro for outro in termos
+                if outro != termo and tokens[outro] != tokens[termo] and _contem_sequencia(tokens[outro], tokens[termo])
+            ]
+            if contem:
+                _avisar(nome, termo, "sobreposto: também conta dentro de " + ", ".join(f"'{t}'" for t in contem))
+        for sigla in siglas:
+            if sigla.lower() in termos:
+                _avisar(nome, sigla, f"sigla também listada como termo '{sigla.lower()}' (conta duas vezes)")
+
+        grupos[nome] = {"termos": termos, "siglas": siglas}
+
+    todos_termos = {t for g in grupos.values() for t in g["termos"]}
+    verificacoes = {}
+    for termo, regra in dicionario["verificacoes"].items():
+        normalizado = normalizar(termo)
+        if normalizado not in todos_termos:
+            _avisar("(verificacoes)", termo, f"regra {regra} sem termo correspondente (ignorada)")
+            continue
+        verificacoes[normalizado] = regra
+
+    idiomas: Dict[str, List[str]] = {}
+    idioma_do_termo: Dict[str, str] = {}
+    for idioma, termos_idioma in dicionario.get("idiomas", {}).items():
+        idiomas[idioma] = []
+        for termo in termos_idioma:
+            normalizado = normalizar(termo)
+            if normalizado not in todos_termos:
+                _avisar(f"(idiomas.{idioma})", termo, "termo de idioma fora dos grupos (ignorado)")
+                continue
+            anterior = idioma_do_termo.setdefault(normalizado, idioma)
+            if anterior != idioma:
+                _avisar(f"(idiomas.{idioma})", termo, f"já listado em idiomas.{anterior} (ignorado)")
+                continue
+            if normalizado not in idiomas[idioma]:
+                idiomas[idioma].append(normalizado)
+
+    compilado = {"versao": dicionario.get("versao"), "grupos": grupos, "verificacoes": verificacoes, "idiomas": idiomas}
+    return compilado, avisos
+
+# ============================================================================
+# MATCHER COMPILADO (CACHE EM DISCO)
+# ============================================================================
+
+def resolver_verificacoes(
+    dicionario: Dict,
+    regras: Dict[str, Callable[[int, int, str], bool]],
+) -> Dict[str, Callable[[int, int, str], bool]]:
+    """Converte termo -> nome da regra em termo -> função, a partir do registro `regras`."""
+    verificacoes = {}
+    for termo, nome_regra in dicionario["verificacoes"].items():
+        if nome_regra not in regras:
+            raise ValueError(
+                f"Regra de contexto desconhecida para '{termo}': {nome_regra} "
+                f"(disponíveis: {', '.join(sorted(regras))})"
+            )
+        verificacoes[termo] = regras[nome_regra]
+    return verificacoes
+
+def carregar_matcher(
+    dicionario: Dict,
+    hash_dic: str,
+    criar_regex: Callable,
+    verificacoes: Dict[str, Callable[[int, int, str], bool]],
+    pasta_cache: Optional[str] = None,
+) -> Taxonomia:
+    """
+    Taxonomia compilada do dicionário: lida do cache (data/cache/matchers/<hash>.pickle)
+    se existir; senão compilada e gravada. As regras de contexto são funções e não vão
+    para o cache: são reanexadas aqui.
+    """
+    pasta_cache = pasta_cache or PASTA_CACHE_MATCHER
+    arquivo = os.path.join(pasta_cache, f"{hash_dic[:32]}_v{VERSAO_COMPILADOR}.pickle")
+
+    try:
+        with open(arquivo, "rb") as f:
+            taxonomia = pickle.load(f)
+        if isinstance(taxonomia, Taxonomia):
+            taxonomia.verificacoes = verificacoes
+            return taxonomia
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        pass  # Sem cache (ou cache de outra versão): compilar
+
+    taxonomia = Taxonomia(dicionario["grupos"], criar_regex, verificacoes)
+    try:
+        os.makedirs(pasta_cache, exist_ok=True)
+        tmp = f"{arquivo}.{os.getpid()}.tmp"  # Workers podem gravar ao mesmo tempo
+        with open(tmp, "wb") as f:
+            pickle.dump(taxonomia, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, arquivo)
+    except OSError as e:
+        print(f"\nAVISO: não foi possível gravar o cache do matcher em {arquivo}: {e}")
+    return taxonomia
@@ -0,0 +1,287 @@
+"""
+Teste diferencial: roda a implementação de referência (referencia_legado.py, congelada)
+e os motores de contagem atuais lado a lado e lista toda divergência de contagem, de
+termos encontrados ou de exemplos, por grupo e termo.
+
+Corpus:
+- textos extraídos de PDFs (e arquivos .txt) de uma pasta (--pasta);
+- textos gerados (--gerados N, com --semente): termos e siglas do dicionário em caixas,
+  acentos e separadores variados, misturados a casos de borda (IAS, DIA-IA-DIA,
+  "R$ 2 bi", "data do balanço", "patrimoniais", logos "PNG Vector (AI)", ...).
+Também confere a página atribuída a cada ocorrência (CASOS_PAGINA, contagem por página):
+siglas e termos curtos no início de uma página, cujo match começa no delimitador antes.
+
+Uso:
+    python src/equivalencia.py --gerados 500
+    python src/equivalencia.py --pasta "C:\\...\\PDFs" --motor taxonomia --saida data/divergencias.csv
+Sai com código 1 se houver divergência. Para um motor novo, acrescente-o a MOTORES.
+"""
+
+import os
+import sys
+import random
+import argparse
+import tempfile
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+import pandas as pd
+
+import referencia_legado as legado
+from analisar_pdfs import (
+    _juntar_paginas, contar_grupos_no_texto, contar_grupos_por_paragrafo, extrair_texto_pdf, normalizar_texto,
+    obter_dicionario, obter_taxonomia,
+)
+from dicionario import ARQUIVO_DICIONARIO, VERSAO_COMPILADOR, carregar_dicionario, resolver_verificacoes
+from paginas import contar_por_pagina, tabela_paginas
+from recorrencia import MemoriaParagrafos
+
+# ============================================================================
+# CONFIGURAÇÕES
+# ============================================================================
+
+TEXTOS_GERADOS_PADRAO = 300
+SEMENTE_PADRAO = 42
+MAX_EXEMPLOS = 3  # Igual ao fixo da referência
+MAX_DIVERGENCIAS_EXIBIDAS = 20
+
+CASOS_BORDA = [
+    "IAS 8", "IAS", "IAS 38", "DIA-IA-DIA", "-IA-", "IA-DIA", "DIA-IA", "(IA)", ".IA ", "IA.",
+    "Ia generativa", "eu ia", "via", "patrimoniais", "PATRIMON\nIAIS", "COMERC\nIAIS", "tesourar\nIA ",
+    "econom IA", "AIS", "AID", "AIM", "Logo PNG Vector (AI, EPS, SVG) Free Download", "Twitter AI logo",
+    "R$ 2 bi", "R$ 2,5 bi", "US$ 1 bi", "2 bi de reais", "BI-", "-BI-", "Power BI", "BI é", "Bi",
+    "data do balanço", "data de divulgação", "Data do balanço:", "à data", "a data de",
+    "na data base", "data limite", "big data", "data-driven", "data driven", "data lake", "data\nscience",
+    "base de dados", "dados pessoais", "análise de dados", "governança de dados", "dados\nanalytics",
+    "ETL/ELT", "KPIs", "KPI,", "SQL-", "e-mail", "(LLM)", "LLMs", "GenAI",
+    "Inteligência Artificial", "inteligência-artificial", "INTELIGÊNCIA\nARTIFICIAL",
+    "machine\nlearning", "machine - learning", "machine--learning",
+]
+PALAVRAS_COMUNS = [
+    "a", "o", "de", "da", "do", "em", "com", "para", "empresa", "relatório", "anual", "receita",
+    "exercício", "controladas", "nota", "explicativa", "consolidado", "ativo", "passivo", "2024",
+    "31/12/2023", "R$", "mil", "milhões", "%", "—", "•", "e", "que", "uso", "projeto", "clientes",
+]
+# (textos das páginas, termo -> {página: ocorrências esperadas})
+CASOS_PAGINA = [
+    (["Relatório anual.", "nlp aplicado ao atendimento"], {"nlp": {2: 1}}),
+    (["Usamos nlp", "etl e nlp diários"], {"nlp": {1: 1, 2: 1}, "etl": {2: 1}}),
+    (["Projeto piloto.", "LLM nos canais digitais"], {"LLM": {2: 1}, "llm": {2: 1}}),
+    (["LLM no início", "e no fim LLM"], {"LLM": {1: 1, 2: 1}}),
+    (["Nota 3.", "machine learning e big data"], {"machine learning": {2: 1}, "big data": {2: 1}}),
+]
+SEPARADORES = [" ", " ", " ", "\n", "  ", "-", " - ", "/", ", ", ". ", "; ", ": ", "(", ")", "\t", "\n\n"]
+
+# ============================================================================
+# MOTORES
+# ============================================================================
+
+Contagens = Dict[str, Tuple[Dict[str, int], List[str], Dict[str, List[str]]]]
+
+_dicionario_bruto: Optional[Dict] = None
+
+def _motor_referencia(texto_original: str) -> Contagens:
+    """Referência congelada: um contar_termos_no_texto por grupo, com o dicionário como está no arquivo."""
+    global _dicionario_bruto
+    if _dicionario_bruto is None:
+        _dicionario_bruto = carregar_dicionario(ARQUIVO_DICIONARIO)
+    dicionario = _dicionario_bruto
+    verificacoes = resolver_verificacoes(dicionario, legado.REGRAS_CONTEXTO)
+    texto_normalizado = legado.normalizar_texto(texto_original)
+    return {
+        grupo: legado.contar_termos_no_texto(
+            texto_original, texto_normalizado, definicao["termos"], definicao["siglas"], verificacoes
+        )
+        for grupo, definicao in dicionario["grupos"].items()
+    }
+
+def _motor_taxonomia(texto_original: str) -> Contagens:
+    """Motor atual: trie de todos os grupos numa varredura (contar_grupos_no_texto)."""
+    return contar_grupos_no_texto(
+        texto_original, normalizar_texto(texto_original), obter_taxonomia(), None, MAX_EXEMPLOS
+    )
+
+_pasta_paragrafos: Optional[tempfile.TemporaryDirectory] = None
+
+def _motor_paragrafos(texto_original: str) -> Contagens:
+    """Contagem parágrafo a parágrafo (DETECTAR_TEXTO_RECORRENTE), com cache temporário."""
+    global _pasta_paragrafos
+    if _pasta_paragrafos is None:
+        _pasta_paragrafos = tempfile.TemporaryDirectory(prefix="equivalencia_")
+    _, hash_dic = obter_dicionario()
+    memoria = MemoriaParagrafos("equivalencia", f"{hash_dic[:16]}_v{VERSAO_COMPILADOR}", _pasta_paragrafos.name)
+    contagens, _ = contar_grupos_por_paragrafo(texto_original, obter_taxonomia(), memoria, "texto", MAX_EXEMPLOS)
+    return contagens
+
+MOTORES: Dict[str, Callable[[str], Contagens]] = {
+    "taxonomia": _motor_taxonomia,
+    "paragrafos": _motor_paragrafos,
+}
+# Motores que só são comparados quando pedidos: a contagem por parágrafo diverge por
+# construção quando regras de contexto (ex.: logo/PNG perto de "AI") atravessam parágrafos
+MOTORES_APROXIMADOS = {"paragrafos"}
+
+# ============================================================================
+# CORPUS
+# ============================================================================
+
+def _variar_caixa(rng: random.Random, texto: str) -> str:
+    escolha = rng.random()
+    if escolha < 0.4:
+        return texto
+    if escolha < 0.6:
+        return texto.upper()
+    if escolha < 0.8:
+        return texto.title()
+    return texto.capitalize()
+
+def _variar_separadores(rng: random.Random, termo: str) -> str:
+    """Troca os espaços internos do termo por quebras de linha, hífens ou espaços repetidos."""
+    return "".join(rng.choice([" ", "\n", "-", "  ", " - "]) if c == " " else c for c in termo)
+
+def gerar_texto(rng: random.Random, termos: List[str], siglas: List[str]) -> str:
+    """Um texto sintético com termos, siglas, casos de borda e palavras comuns."""
+    partes = []
+    for _ in range(rng.randint(5, 120)):
+        sorteio = rng.random()
+        if sorteio < 0.3:
+            fragmento = _variar_caixa(rng, _variar_separadores(rng, rng.choice(termos)))
+        elif sorteio < 0.45:
+            fragmento = rng.choice(siglas) if rng.random() < 0.8 else rng.choice(siglas).lower()
+        elif sorteio < 0.7:
+            fragmento = rng.choice(CASOS_BORDA)
+        else:
+            fragmento = rng.choice(PALAVRAS_COMUNS)
+        partes.append(fragmento)
+        partes.append(rng.choice(SEPARADORES))
+    return "".join(partes).strip()
+
+def textos_gerados(quantidade: int, semente: int) -> Iterator[Tuple[str, str]]:
+    """(origem, texto) de `quantidade` textos sintéticos reproduzíveis pela semente."""
+    dicionario, _ = obter_dicionario()
+    termos = [t for g in dicionario["grupos"].values() for t in g["termos"]]
+    siglas = [s for g in dicionario["grupos"].values() for s in g["siglas"]] or ["IA"]
+    rng = random.Random(semente)
+    for i in range(quantidade):
+        yield f"gerado#{i}", gerar_texto(rng, termos, siglas)
+
+def textos_da_pasta(pasta: str) -> Iterator[Tuple[str, str]]:
+    """(origem, texto) dos PDFs e .txt da pasta (recursivo)."""
+    for caminho in sorted(Path(pasta).rglob("*")):
+        sufixo = caminho.suffix.lower()
+        try:
+            if sufixo == ".pdf":
+                yield str(caminho), extrair_texto_pdf(str(caminho))[0]
+            elif sufixo == ".txt":
+                yield str(caminho), caminho.read_text(encoding="utf-8", errors="replace")
+        except Exception as e:
+            print(f"AVISO: {caminho} ignorado: {e}")
+
+# ============================================================================
+# COMPARAÇÃO
+# ============================================================================
+
+def comparar(origem: str, referencia: Contagens, obtido: Contagens, motor: str) -> List[Dict]:
+    """Divergências entre duas contagens (uma linha por grupo x termo x aspecto)."""
+    divergencias = []
+
+    def _registrar(grupo, termo, aspecto, esperado, valor):
+        divergencias.append({
+            "origem": origem, "motor": motor, "grupo": grupo, "termo": termo,
+            "aspecto": aspecto, "referencia": repr(esperado), "motor_valor": repr(valor),
+        })
+
+    for grupo in sorted(set(referencia) | set(obtido)):
+        if grupo not in referencia or grupo not in obtido:
+            _registrar(grupo, "", "grupo", grupo in referencia, grupo in obtido)
+            continue
+        ocorr_ref, termos_ref, exemplos_ref = referencia[grupo]
+        ocorr_mot, termos_mot, exemplos_mot = obtido[grupo]
+        for termo in list(dict.fromkeys(list(ocorr_ref) + list(ocorr_mot))):
+            if ocorr_ref.get(termo, 0) != ocorr_mot.get(termo, 0):
+                _registrar(grupo, termo, "contagem", ocorr_ref.get(termo, 0), ocorr_mot.get(termo, 0))
+            elif exemplos_ref.get(termo, []) != exemplos_mot.get(termo, []):
+                _registrar(grupo, termo, "exemplos", exemplos_ref.get(termo, []), exemplos_mot.get(termo, []))
+        if termos_ref != termos_mot and set(termos_ref) == set(termos_mot):
+            _registrar(grupo, "", "ordem dos termos", termos_ref, termos_mot)
+    return divergencias
+
+def verificar_paginas() -> List[Dict]:
+    """Divergências entre a página esperada e a atribuída (contar_por_pagina) nos CASOS_PAGINA."""
+    taxonomia = obter_taxonomia()
+    eh_sigla = {(g, s): True for g, definicao in taxonomia.grupos.items() for s in definicao["siglas"]}
+    divergencias = []
+    for textos, esperado in CASOS_PAGINA:
+        paginas_texto = list(enumerate(textos))
+        texto_original = _juntar_paginas(paginas_texto)
+        texto_normalizado = normalizar_texto(texto_original)
+        posicoes: Dict[str, Dict[str, List[int]]] = {}
+        contar_grupos_no_texto(texto_original, texto_normalizado, taxonomia, posicoes, 0)
+        por_pagina = contar_por_pagina(posicoes, eh_sigla, texto_original, texto_normalizado, *tabela_paginas(paginas_texto))
+        for termo, paginas_esperadas in esperado.items():
+            for grupo in taxonomia.grupos_do_termo(termo):
+                paginas, contagens = por_pagina[grupo].get(termo, ([], []))
+                obtido = dict(zip(paginas, contagens))
+                if obtido != paginas_esperadas:
+                    divergencias.append({
+                        "origem": " | ".join(textos), "motor": "paginas", "grupo": grupo, "termo": termo,
+                        "aspecto": "pagina", "referencia": repr(paginas_esperadas), "motor_valor": repr(obtido),
+                    })
+    return divergencias
+
+def executar(textos: Iterator[Tuple[str, str]], motores: List[str]) -> Tuple[int, List[Dict]]:
+    """Roda referência e motores em cada texto. Retorna (textos comparados, divergências)."""
+    total = 0
+    divergencias = []
+    for origem, texto in textos:
+        total += 1
+        referencia = _motor_referencia(texto)
+        for motor in motores:
+            divergencias.extend(comparar(origem, referencia, MOTORES[motor](texto), motor))
+    return total, divergencias
+
+def main():
+    parser = argparse.ArgumentParser(description="Compara os motores de contagem com a implementação de referência.")
+    parser.add_argument("--pasta", help="Pasta com PDFs e/ou .txt (textos reais)")
+    parser.add_argument("--gerados", type=int, default=TEXTOS_GERADOS_PADRAO, help="Quantidade de textos sintéticos")
+    parser.add_argument("--semente", type=int, default=SEMENTE_PADRAO, help="Semente dos textos sintéticos")
+    parser.add_argument(
+        "--motor", action="append", choices=sorted(MOTORES),
+        help="Motor a comparar (repetível; padrão: todos menos os aproximados, como 'paragrafos')"
+    )
+    parser.add_argument("--saida", help="Grava todas as divergências neste CSV")
+    args = parser.parse_args()
+
+    try:
+        obter_taxonomia()
+    except (OSError, ValueError) as e:
+        print(f"Erro ao carregar o dicionário de termos: {e}")
+        sys.exit(2)
+
+    def _corpus():
+        if args.pasta:
+            yield from textos_da_pasta(args.pasta)
+        yield from textos_gerados(args.gerados, args.semente)
+
+    motores = args.motor or [m for m in MOTORES if m not in MOTORES_APROXIMADOS]
+    total, divergencias = executar(_corpus(), motores)
+    divergencias.extend(verificar_paginas())
+
+    print(f"{total} textos comparados com a referência (motores: {', '.join(motores)}); {len(CASOS_PAGINA)} casos de página.")
+    if not divergencias:
+        print("✓ Nenhuma divergência.")
+        return
+    df = pd.DataFrame(divergencias)
+    print(f"✗ {len(df)} divergências:")
+    print(df.groupby(["motor", "aspecto"]).size().to_string())
+    for d in divergencias[:MAX_DIVERGENCIAS_EXIBIDAS]:
+        print(f"  - [{d['motor']}] {d['origem']} {d['grupo']}/{d['termo']} ({d['aspecto']}): "
+              f"referência {d['referencia'][:120]} x motor {d['motor_valor'][:120]}")
+    if args.saida:
+        os.makedirs(os.path.dirname(os.path.abspath(args.saida)), exist_ok=True)
+        df.to_csv(args.saida, index=False)
+        print(f"Divergências gravadas em {args.saida}")
+    sys.exit(1)
+
+if __name__ == "__main__":
+    main()
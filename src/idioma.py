@@ -0,0 +1,63 @@
+"""
+Detecção barata do idioma de um documento (português ou inglês) pela frequência de
+palavras funcionais (stopwords) nas primeiras páginas.
+
+Com DETECTAR_IDIOMA em analisar_pdfs.py, cada documento é varrido só com os termos
+neutros do dicionário (marcas, siglas, empréstimos como "machine learning") e os
+exclusivos do idioma detectado (seção "idiomas" do dicionário). Documentos sem idioma
+claro (pouco texto ou mistura equilibrada) usam todos os termos.
+"""
+
+import re
+from typing import Dict, FrozenSet
+
+# ============================================================================
+# CONFIGURAÇÕES
+# ============================================================================
+
+CARACTERES_AMOSTRA_IDIOMA = 20000  # Início do texto usado na detecção (~ primeiras páginas)
+MIN_STOPWORDS_IDIOMA = 30  # Abaixo disso (capa, sumário, página escaneada) o idioma fica indeterminado
+RAZAO_MINIMA_IDIOMA = 2.0  # O idioma vencedor precisa de pelo menos esse múltiplo de stopwords do outro
+IDIOMA_INDETERMINADO = "indeterminado"
+
+# Palavras funcionais sem acento (o texto chega normalizado) e que não existem no outro
+# idioma: "a", "e", "o", "no", "do", "as" ficam de fora por ambiguidade
+STOPWORDS: Dict[str, FrozenSet[str]] = {
+    "pt": frozenset({
+        "de", "da", "das", "dos", "que", "nao", "para", "com", "uma", "um", "os", "em", "na",
+        "nos", "nas", "por", "mais", "pelo", "pela", "pelos", "pelas", "sao", "esta", "estao",
+        "tambem", "foi", "foram", "ao", "aos", "sua", "seu", "suas", "seus", "entre", "sobre",
+        "como", "ja", "ou", "quando", "muito", "ser", "tem", "nosso", "nossa", "nossos", "nossas",
+    }),
+    "en": frozenset({
+        "the", "and", "of", "to", "in", "is", "are", "for", "with", "that", "this", "by", "on",
+        "was", "were", "be", "been", "which", "from", "our", "its", "has", "have", "will", "at",
+        "an", "or", "it", "not", "these", "those", "their", "also", "such", "than", "we",
+    }),
+}
+
+_RE_PALAVRA = re.compile(r'[a-z]+')
+
+# ============================================================================
+# DETECÇÃO
+# ============================================================================
+
+def contar_stopwords(texto_normalizado: str) -> Dict[str, int]:
+    """Ocorrências das stopwords de cada idioma no texto."""
+    contagens = {idioma: 0 for idioma in STOPWORDS}
+    for palavra in _RE_PALAVRA.findall(texto_normalizado):
+        for idioma, palavras in STOPWORDS.items():
+            if palavra in palavras:
+                contagens[idioma] += 1
+    return contagens
+
+def detectar_idioma(texto_normalizado: str, max_caracteres: int = CARACTERES_AMOSTRA_IDIOMA) -> str:
+    """
+    "pt", "en" ou IDIOMA_INDETERMINADO, pelo início do texto normalizado (minúsculo, sem
+    acento). Indeterminado se houver poucas stopwords ou nenhum idioma predominar.
+    """
+    contagens = contar_stopwords(texto_normalizado[:max_caracteres])
+    (primeiro, n_primeiro), (_, n_segundo) = sorted(contagens.items(), key=lambda item: -item[1])[:2]
+    if n_primeiro < MIN_STOPWORDS_IDIOMA or n_primeiro < RAZAO_MINIMA_IDIOMA * n_segundo:
+        return IDIOMA_INDETERMINADO
+    return primeiro
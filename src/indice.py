@@ -0,0 +1,99 @@
+"""
+Índice de ênfase em IA, calculado só com operações vetorizadas (pandas/NumPy)
+sobre o DataFrame de resultados (uma linha por PDF x grupo, como em gerar_excel).
+
+- densidade por 10 mil palavras de cada grupo
+- participação IA / (IA + DADOS_BI)
+- z-score da densidade de IA dentro de cada ano
+- índice empresa-ano ponderado por palavras (densidade agregada = soma das ocorrências / soma das palavras)
+
+PDFs sem nenhuma ocorrência só entram no denominador se INCLUIR_PDFS_SEM_OCORRENCIAS = True.
+"""
+
+from typing import List
+
+import numpy as np
+import pandas as pd
+
+GRUPO_IA = "IA_LLM"
+GRUPO_BI = "DADOS_BI"
+POR_PALAVRAS = 10_000
+
+
+def _dividir(numerador: pd.Series, denominador: pd.Series) -> pd.Series:
+    """Divisão elemento a elemento com NaN onde o denominador é 0."""
+    num = numerador.to_numpy(dtype=float)
+    den = denominador.to_numpy(dtype=float)
+    out = np.full(num.shape, np.nan)
+    np.divide(num, den, out=out, where=den > 0)
+    return pd.Series(out, index=numerador.index)
+
+
+def _zscore_por_grupo(valores: pd.Series, chaves: pd.Series) -> pd.Series:
+    """z-score de `valores` dentro de cada valor de `chaves` (desvio amostral; NaN se n < 2)."""
+    agrupado = valores.groupby(chaves, observed=True)
+    media = agrupado.transform("mean")
+    desvio = agrupado.transform("std")
+    return _dividir(valores - media, desvio)
+
+
+def _colunas_grupos(df: pd.DataFrame) -> List[str]:
+    grupos = sorted(df["grupo"].unique())
+    for obrigatorio in (GRUPO_IA, GRUPO_BI):
+        if obrigatorio not in grupos:
+            grupos.append(obrigatorio)
+    return grupos
+
+
+def _adicionar_metricas(tabela: pd.DataFrame, grupos: List[str], chave_ano: str = "ano") -> pd.DataFrame:
+    """Densidades, participação de IA e z-score dentro do ano (in place)."""
+    for grupo in grupos:
+        tabela[f"densidade_{grupo}_10k"] = _dividir(tabela[f"ocorr_{grupo}"], tabela["total_palavras"]) * POR_PALAVRAS
+    ia = tabela[f"ocorr_{GRUPO_IA}"]
+    tabela["share_ia"] = _dividir(ia, ia + tabela[f"ocorr_{GRUPO_BI}"])
+    tabela["z_densidade_ia_no_ano"] = _zscore_por_grupo(tabela[f"densidade_{GRUPO_IA}_10k"], tabela[chave_ano])
+    return tabela
+
+
+def calcular_indice_documentos(df_completo: pd.DataFrame) -> pd.DataFrame:
+    """Uma linha por PDF: ocorrências por grupo, densidades, share de IA e z-score no ano."""
+    grupos = _colunas_grupos(df_completo)
+
+    ocorrencias = df_completo.pivot_table(
+        index=["empresa", "ano", "pdf_caminho"],
+        columns="grupo",
+        values="ocorrencias_total_grupo",
+        aggfunc="sum",
+        fill_value=0,
+        observed=True,
+    ).reindex(columns=grupos, fill_value=0)
+    ocorrencias.columns = [f"ocorr_{g}" for g in grupos]
+
+    palavras = df_completo.groupby(["empresa", "ano", "pdf_caminho"], observed=True)["total_palavras_pdf"].max()
+    tabela = ocorrencias.join(palavras.rename("total_palavras")).reset_index()
+
+    nomes = df_completo.drop_duplicates("pdf_caminho").set_index("pdf_caminho")["pdf_nome"]
+    tabela.insert(2, "pdf_nome", tabela["pdf_caminho"].map(nomes))
+
+    return _adicionar_metricas(tabela, grupos)
+
+
+def calcular_indice_empresa_ano(indice_documentos: pd.DataFrame) -> pd.DataFrame:
+    """
+    Agrega por empresa e ano ponderando por palavras: densidade = Σ ocorrências / Σ palavras.
+    indice_enfase_ia é o z-score da densidade agregada de IA entre as empresas do mesmo ano.
+    """
+    colunas_ocorr = [c for c in indice_documentos.columns if c.startswith("ocorr_")]
+    grupos = [c[len("ocorr_"):] for c in colunas_ocorr]
+
+    agregado = indice_documentos.groupby(["empresa", "ano"], as_index=False, observed=True).agg(
+        pdfs=("pdf_caminho", "nunique"),
+        total_palavras=("total_palavras", "sum"),
+        **{c: (c, "sum") for c in colunas_ocorr},
+    )
+    agregado = _adicionar_metricas(agregado, grupos)
+    agregado["indice_enfase_ia"] = agregado.pop("z_densidade_ia_no_ano")
+    agregado["ranking_no_ano"] = (
+        agregado.groupby("ano", observed=True)[f"densidade_{GRUPO_IA}_10k"].rank(ascending=False, method="min")
+    )
+    return agregado.sort_values(["empresa", "ano"]).reset_index(drop=True)
@@ -0,0 +1,273 @@
+"""
+Inventário do corpus de PDFs: arquivos por empresa/ano, bytes, páginas e estimativa de tempo.
+Os metadados por PDF ficam em cache entre execuções (validados por tamanho + mtime).
+"""
+
+import os
+import re
+import json
+import mmap
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+# ============================================================================
+# CONFIGURAÇÕES
+# ============================================================================
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+ARQUIVO_CACHE_METADADOS = str(_PROJECT_ROOT / "data" / "cache" / "metadados_pdfs.json")
+ANOS_VALIDOS = ["2023", "2024", "2025"]
+MAX_WORKERS_INVENTARIO = 8  # stat + leitura leve é I/O: threads bastam
+SEGUNDOS_POR_PAGINA_ESTIMADO = 0.35  # Custo médio de extract_text por página (ajuste após uma execução real)
+
+# ============================================================================
+# ESTRUTURA DE PASTAS
+# ============================================================================
+
+def identificar_empresa_ano(caminho_pdf: Path, pasta_raiz: Path) -> Optional[Tuple[str, str]]:
+    """
+    Identifica (empresa, ano) a partir do caminho: Empresa/[.../]2024/arquivo.pdf.
+    Se não houver pasta de ano, procura o ano no nome do arquivo; senão "DESCONHECIDO".
+    Retorna None se o PDF estiver fora da estrutura esperada (direto na raiz).
+    """
+    partes = caminho_pdf.relative_to(pasta_raiz).parts
+    if len(partes) < 2:
+        return None
+
+    empresa = partes[0]
+
+    for parte in partes[1:]:
+        if parte in ANOS_VALIDOS:
+            return empresa, parte
+
+    ano_match = re.search(r'(202[3-5])', partes[-1])
+    if ano_match:
+        return empresa, ano_match.group(1)
+    return empresa, "DESCONHECIDO"
+
+# ============================================================================
+# CONTAGEM DE PÁGINAS
+# ============================================================================
+
+_RE_OBJ_PAGES = re.compile(rb'/Type\s*/Pages\b')
+_RE_COUNT = re.compile(rb'/Count\s+(\d+)')
+
+def contar_paginas_rapido(caminho_pdf: str) -> Optional[int]:
+    """
+    Conta páginas lendo só os dicionários /Type /Pages (sem montar a árvore do pdfminer).
+    A raiz da árvore de páginas tem o maior /Count. Retorna None se não encontrar
+    (ex.: PDF 1.5+ com object streams comprimidos) — aí use contar_paginas_pdfplumber.
+    """
+    with open(caminho_pdf, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return None
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as dados:
+            maior = None
+            for m in _RE_OBJ_PAGES.finditer(dados):
+                # Limitar a busca de /Count ao próprio objeto (outlines também têm /Count)
+                inicio = dados.rfind(b"obj", 0, m.start())
+                fim = dados.find(b"endobj", m.end())
+                if inicio < 0 or fim < 0:
+                    continue
+                for c in _RE_COUNT.finditer(dados, inicio, fim):
+                    valor = int(c.group(1))
+                    if maior is None or valor > maior:
+                        maior = valor
+            return maior
+
+def contar_paginas_pdfplumber(caminho_pdf: str) -> Optional[int]:
+    """Conta páginas abrindo o PDF com pdfplumber (sem extrair texto)."""
+    try:
+        import pdfplumber
+        with pdfplumber.open(caminho_pdf) as pdf:
+            return len(pdf.pages)
+    except Exception:
+        return None
+
+def contar_paginas(caminho_pdf: str) -> Optional[int]:
+    """Contagem leve com fallback para pdfplumber."""
+    try:
+        paginas = contar_paginas_rapido(caminho_pdf)
+    except (OSError, ValueError):
+        paginas = None
+    if paginas is None:
+        paginas = contar_paginas_pdfplumber(caminho_pdf)
+    return paginas
+
+# ============================================================================
+# CACHE DE METADADOS
+# ============================================================================
+
+def carregar_cache_metadados(arquivo: Optional[str] = None) -> Dict[str, Dict]:
+    """Carrega cache caminho -> {tamanho_bytes, mtime_ns, paginas}. Cache inválido = vazio."""
+    arquivo = arquivo or ARQUIVO_CACHE_METADADOS
+    try:
+        with open(arquivo, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+        return cache if isinstance(cache, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+def salvar_cache_metadados(cache: Dict[str, Dict], arquivo: Optional[str] = None):
+    """Salva o cache de forma atômica (arquivo temporário + os.replace)."""
+    arquivo = arquivo or ARQUIVO_CACHE_METADADOS
+    os.makedirs(os.path.dirname(arquivo), exist_ok=True)
+    tmp = arquivo + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(cache, f, ensure_ascii=False)
+    os.replace(tmp, arquivo)
+
+def _metadados_pdf(caminho_pdf: Path, cache: Dict[str, Dict]) -> Tuple[Dict, bool]:
+    """Retorna (metadados, veio_do_cache) para um PDF."""
+    st = caminho_pdf.stat()
+    chave = str(caminho_pdf)
+    em_cache = cache.get(chave)
+    if (
+        em_cache is not None
+        and em_cache.get("tamanho_bytes") == st.st_size
+        and em_cache.get("mtime_ns") == st.st_mtime_ns
+    ):
+        return em_cache, True
+    meta = {
+        "tamanho_bytes": st.st_size,
+        "mtime_ns": st.st_mtime_ns,
+        "paginas": contar_paginas(chave),
+    }
+    return meta, False
+
+# ============================================================================
+# INVENTÁRIO
+# ============================================================================
+
+def inventariar(
+    pasta_raiz: str,
+    max_workers: Optional[int] = None,
+    usar_cache: bool = True,
+    arquivo_cache: Optional[str] = None,
+) -> List[Dict]:
+    """
+    Lista todos os PDFs da pasta raiz com empresa, ano, bytes e páginas.
+    Cada registro tem "em_cache" = True se os metadados vieram do cache.
+    """
+    raiz = Path(pasta_raiz)
+    if not raiz.exists():
+        raise FileNotFoundError(f"Pasta raiz não encontrada: {pasta_raiz}")
+
+    registros = []
+    for caminho_pdf in raiz.rglob("*.pdf"):
+        ident = identificar_empresa_ano(caminho_pdf, raiz)
+        if ident is not None:
+            registros.append({"caminho": str(caminho_pdf), "empresa": ident[0], "ano": ident[1]})
+
+    return complementar_metadados(registros, max_workers, usar_cache, arquivo_cache)
+
+def complementar_metadados(
+    registros: List[Dict],
+    max_workers: Optional[int] = None,
+    usar_cache: bool = True,
+    arquivo_cache: Optional[str] = None,
+) -> List[Dict]:
+    """
+    Preenche tamanho_bytes, mtime_ns, paginas e em_cache em registros com "caminho".
+    stat + contagem de páginas rodam em paralelo; o cache é atualizado ao final.
+    Registros cujo arquivo sumiu/está inacessível são descartados.
+    """
+    cache = carregar_cache_metadados(arquivo_cache) if usar_cache else {}
+
+    def _processar(registro: Dict) -> Optional[Dict]:
+        try:
+            meta, veio_do_cache = _metadados_pdf(Path(registro["caminho"]), cache)
+        except OSError:
+            return None
+        registro.update(
+            tamanho_bytes=meta["tamanho_bytes"],
+            mtime_ns=meta["mtime_ns"],
+            paginas=meta["paginas"],
+            em_cache=veio_do_cache,
+        )
+        return registro
+
+    with ThreadPoolExecutor(max_workers=max_workers or MAX_WORKERS_INVENTARIO) as executor:
+        completos = [r for r in executor.map(_processar, registros) if r is not None]
+
+    if usar_cache:
+        cache.update({
+            r["caminho"]: {
+                "tamanho_bytes": r["tamanho_bytes"],
+                "mtime_ns": r["mtime_ns"],
+                "paginas": r["paginas"],
+            }
+            for r in completos
+        })
+        salvar_cache_metadados(cache, arquivo_cache)
+
+    return completos
+
+def resumir_inventario(
+    registros: List[Dict],
+    segundos_por_pagina: Optional[float] = None,
+    estimar: Optional[Callable[[Dict], float]] = None,
+) -> List[Dict]:
+    """
+    Agrega o inventário por empresa e ano: PDFs, bytes, páginas, cache e tempo estimado.
+    `estimar(registro)` dá o tempo de cada PDF (ex.: ModeloCusto.estimar, ajustado pelas
+    execuções anteriores); sem ele, páginas x segundos_por_pagina, e PDFs sem contagem de
+    páginas entram pela média de páginas/byte do corpus.
+    Registros com "concluido" = True (já no diário de execução) não entram na estimativa.
+    """
+    spp = segundos_por_pagina if segundos_por_pagina is not None else SEGUNDOS_POR_PAGINA_ESTIMADO
+
+    com_paginas = [r for r in registros if r["paginas"]]
+    bytes_conhecidos = sum(r["tamanho_bytes"] for r in com_paginas)
+    paginas_por_byte = (sum(r["paginas"] for r in com_paginas) / bytes_conhecidos) if bytes_conhecidos else 0.0
+
+    resumo: Dict[Tuple[str, str], Dict] = {}
+    for r in registros:
+        chave = (r["empresa"], r["ano"])
+        linha = resumo.setdefault(chave, {
+            "empresa": r["empresa"],
+            "ano": r["ano"],
+            "pdfs": 0,
+            "tamanho_bytes": 0,
+            "paginas": 0,
+            "sem_contagem_paginas": 0,
+            "em_cache": 0,
+            "pendentes": 0,
+            "concluidos": 0,
+            "estimativa_segundos": 0.0,
+        })
+        linha["pdfs"] += 1
+        linha["tamanho_bytes"] += r["tamanho_bytes"]
+        if r["paginas"]:
+            paginas = r["paginas"]
+            linha["paginas"] += paginas
+        else:
+            paginas = r["tamanho_bytes"] * paginas_por_byte
+            linha["sem_contagem_paginas"] += 1
+        linha["em_cache" if r["em_cache"] else "pendentes"] += 1
+        if r.get("concluido"):
+            linha["concluidos"] += 1
+        else:
+            linha["estimativa_segundos"] += estimar(r) if estimar is not None else paginas * spp
+
+    return [resumo[k] for k in sorted(resumo)]
+
+def formatar_duracao(segundos: float) -> str:
+    """Formata segundos como '1h 02min', '3min 05s' ou '12s'."""
+    segundos = int(round(segundos))
+    horas, resto = divmod(segundos, 3600)
+    minutos, seg = divmod(resto, 60)
+    if horas:
+        return f"{horas}h {minutos:02d}min"
+    if minutos:
+        return f"{minutos}min {seg:02d}s"
+    return f"{seg}s"
+
+def formatar_bytes(n: float) -> str:
+    """Formata bytes em KB/MB/GB."""
+    for unidade in ("B", "KB", "MB", "GB"):
+        if n < 1024 or unidade == "GB":
+            return f"{n:.0f} {unidade}" if unidade == "B" else f"{n:.1f} {unidade}"
+        n /= 1024
+    return f"{n:.1f} GB"
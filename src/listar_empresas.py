@@ -1,27 +1,132 @@
-"""Script auxiliar para listar empresas disponíveis na pasta de PDFs."""
+"""Script auxiliar para listar empresas e inventariar os PDFs antes de uma execução real."""
+import argparse
+import importlib.util
 from pathlib import Path
 
+from agendador import ModeloCusto
+from checkpoint import (
+    DiarioResultados, configuracao_saida, hash_configuracao, ler_configuracoes, registro_vale_para,
+)
+from dicionario import carregar_dicionario, hash_dicionario
+from inventario import (
+    MAX_WORKERS_INVENTARIO,
+    SEGUNDOS_POR_PAGINA_ESTIMADO,
+    formatar_bytes,
+    formatar_duracao,
+    inventariar,
+    resumir_inventario,
+)
+
 PASTA_RAIZ = r"C:\Users\weder\OneDrive\Área de Trabalho\codigos\iaindex\pdfs"
+_SRC = Path(__file__).resolve().parent
+# Lidos sem importar analisar_pdfs (pdfplumber, pandas, janela...): o inventário fica rápido
+ARQUIVOS_CONFIGURACAO = [str(_SRC / "analisar_pdfs.py"), str(_SRC / "ocr.py")]
 
-pasta = Path(PASTA_RAIZ)
-
-if not pasta.exists():
-    print(f"❌ Pasta não encontrada: {PASTA_RAIZ}")
-    print("\nPor favor, crie a pasta e organize os PDFs na estrutura:")
-    print("  pdfs/")
-    print("    ├── Empresa1/")
-    print("    │   ├── 2023/")
-    print("    │   ├── 2024/")
-    print("    │   └── 2025/")
-    print("    └── Empresa2/")
-    print("        └── ...")
-else:
-    empresas = [d.name for d in pasta.iterdir() if d.is_dir()]
-    if empresas:
-        print(f"✅ Empresas encontradas em {PASTA_RAIZ}:")
-        for i, empresa in enumerate(empresas, 1):
-            print(f"  {i}. {empresa}")
-        print(f"\nPara processar apenas uma empresa, edite analisar_pdfs.py e defina:")
-        print(f"  EMPRESA_FILTRO = \"{empresas[0]}\"")
+
+def hash_configuracao_atual() -> str:
+    """Hash da configuração de saída atual de analisar_pdfs.py (como no diário)."""
+    configuracoes = ler_configuracoes(ARQUIVOS_CONFIGURACAO)
+    ocr_disponivel = importlib.util.find_spec("pytesseract") is not None
+    return hash_configuracao(configuracao_saida(configuracoes, ocr_disponivel))
+
+
+def imprimir_inventario(pasta_raiz: str, max_workers: int, usar_cache: bool, workers_execucao: int):
+    """Imprime PDFs, bytes, páginas e tempo estimado por empresa/ano."""
+    registros = inventariar(pasta_raiz, max_workers=max_workers, usar_cache=usar_cache)
+    if not registros:
+        print("\nNenhum PDF encontrado na estrutura Empresa/Ano.")
+        return
+
+    # PDFs já concluídos no diário da última execução (seriam pulados com --resume)
+    try:
+        hash_dic = hash_dicionario(carregar_dicionario())
+    except (OSError, ValueError) as e:
+        print(f"\n⚠️  Dicionário de termos não carregado ({e}); nenhum PDF conta como concluído.")
+        hash_dic = None
+    try:
+        hash_config = hash_configuracao_atual()
+    except (OSError, SyntaxError, ValueError) as e:
+        print(f"\n⚠️  Configuração de analisar_pdfs.py não lida ({e}); nenhum PDF conta como concluído.")
+        hash_dic = None
+        hash_config = None
+    diario = DiarioResultados().carregar()
+    for r in registros:
+        r["hash_dicionario"] = hash_dic
+        r["hash_configuracao"] = hash_config
+        r["concluido"] = hash_dic is not None and registro_vale_para(diario.get(r["caminho"]), r)
+
+    # Tempo por PDF: modelo de custo ajustado nas execuções anteriores, se houver histórico
+    modelo = ModeloCusto()
+    resumo = resumir_inventario(registros, estimar=modelo.estimar if modelo.ajustado else None)
+
+    print(f"\n📊 Inventário ({len(registros)} PDFs):")
+    print(f"  {'empresa':<30} {'ano':<12} {'pdfs':>5} {'tamanho':>10} {'páginas':>8} {'cache':>6} {'pend.':>6} {'concl.':>6} {'estimativa':>12}")
+    for linha in resumo:
+        print(
+            f"  {linha['empresa'][:30]:<30} {linha['ano']:<12} {linha['pdfs']:>5} "
+            f"{formatar_bytes(linha['tamanho_bytes']):>10} {linha['paginas']:>8} "
+            f"{linha['em_cache']:>6} {linha['pendentes']:>6} {linha['concluidos']:>6} {formatar_duracao(linha['estimativa_segundos']):>12}"
+        )
+
+    total_bytes = sum(l["tamanho_bytes"] for l in resumo)
+    total_paginas = sum(l["paginas"] for l in resumo)
+    total_cache = sum(l["em_cache"] for l in resumo)
+    total_concluidos = sum(l["concluidos"] for l in resumo)
+    sem_paginas = sum(l["sem_contagem_paginas"] for l in resumo)
+    total_segundos = sum(l["estimativa_segundos"] for l in resumo)
+
+    print(f"\n  Total: {formatar_bytes(total_bytes)}, {total_paginas} páginas")
+    print(f"  Metadados em cache: {total_cache} de {len(registros)} PDFs")
+    print(f"  Já concluídos no diário (pulados com --resume): {total_concluidos}")
+    if sem_paginas:
+        print(f"  ⚠️  {sem_paginas} PDFs sem contagem de páginas (estimados pelo tamanho)")
+    if modelo.ajustado:
+        base = f"modelo de custo de {len(modelo.historico)} PDFs medidos: {modelo.seg_por_pagina:.3f}s/página + {modelo.seg_por_mb:.3f}s/MB"
     else:
-        print(f"⚠️  Pasta existe mas não há subpastas (empresas) em: {PASTA_RAIZ}")
+        base = f"{SEGUNDOS_POR_PAGINA_ESTIMADO}s/página, sem histórico de custos"
+    print(
+        f"  Tempo estimado dos pendentes ({base}, {workers_execucao} worker(s)): "
+        f"{formatar_duracao(total_segundos / max(1, workers_execucao))}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Lista empresas e inventaria os PDFs da pasta raiz.")
+    parser.add_argument("--pasta", default=PASTA_RAIZ, help="Pasta raiz com Empresa/Ano/*.pdf")
+    parser.add_argument("--apenas-empresas", action="store_true", help="Só lista as empresas (sem inventário)")
+    parser.add_argument("--sem-cache", action="store_true", help="Ignora e não atualiza o cache de metadados")
+    parser.add_argument("--workers", type=int, default=MAX_WORKERS_INVENTARIO, help="Threads para stat/contagem de páginas")
+    parser.add_argument("--workers-execucao", type=int, default=1, help="Workers da execução real (para a estimativa)")
+    args = parser.parse_args()
+
+    pasta = Path(args.pasta)
+
+    if not pasta.exists():
+        print(f"❌ Pasta não encontrada: {args.pasta}")
+        print("\nPor favor, crie a pasta e organize os PDFs na estrutura:")
+        print("  pdfs/")
+        print("    ├── Empresa1/")
+        print("    │   ├── 2023/")
+        print("    │   ├── 2024/")
+        print("    │   └── 2025/")
+        print("    └── Empresa2/")
+        print("        └── ...")
+        return
+
+    empresas = [d.name for d in pasta.iterdir() if d.is_dir()]
+    if not empresas:
+        print(f"⚠️  Pasta existe mas não há subpastas (empresas) em: {args.pasta}")
+        return
+
+    print(f"✅ Empresas encontradas em {args.pasta}:")
+    for i, empresa in enumerate(empresas, 1):
+        print(f"  {i}. {empresa}")
+    print(f"\nPara processar apenas uma empresa, edite analisar_pdfs.py e defina:")
+    print(f"  EMPRESA_FILTRO = \"{empresas[0]}\"")
+
+    if not args.apenas_empresas:
+        imprimir_inventario(args.pasta, args.workers, not args.sem_cache, args.workers_execucao)
+
+
+if __name__ == "__main__":
+    main()
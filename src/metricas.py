@@ -0,0 +1,214 @@
+"""
+Métricas da execução no formato texto do Prometheus, servidas em localhost.
+
+Com PORTA_METRICAS definida em analisar_pdfs.py, varrer_pastas sobe um servidor HTTP
+(http.server da biblioteca padrão, numa thread) em http://127.0.0.1:<porta>/metrics
+enquanto os PDFs são processados. Expõe:
+- documentos concluídos por status (ok, erro, timeout), páginas e bytes processados
+  (contadores) e a vazão média desde o início (páginas/s e bytes/s);
+- profundidade das filas (trabalhos despachados, retidos por memória, PDFs restantes);
+- histogramas de latência por etapa (pré-leitura, extração, análise, PDF inteiro);
+- memória reservada pelo controle de admissão e RSS dos workers;
+- consultas e taxa de acerto dos caches (pré-leitura, metadados do inventário, diário).
+As métricas são coletadas no processo principal, a partir do que os workers devolvem.
+"""
+
+import time
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+
+# ============================================================================
+# CONFIGURAÇÕES
+# ============================================================================
+
+ENDERECO_METRICAS = "127.0.0.1"  # Só localhost: as métricas não ficam expostas na rede
+PREFIXO_METRICAS = "iaindex"
+# Limites (segundos) dos buckets dos histogramas de latência por etapa
+BUCKETS_SEGUNDOS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600, 1800)
+
+# Descrição (HELP) e tipo de cada métrica (sem o prefixo)
+_DESCRICOES = {
+    "documentos_total": ("counter", "PDFs concluídos por status (ok, erro, timeout)."),
+    "paginas_total": ("counter", "Páginas dos PDFs concluídos."),
+    "bytes_total": ("counter", "Bytes dos PDFs concluídos."),
+    "paginas_por_segundo": ("gauge", "Vazão média de páginas desde o início da varredura."),
+    "bytes_por_segundo": ("gauge", "Vazão média de bytes desde o início da varredura."),
+    "fila_trabalhos": ("gauge", "Trabalhos por fila (despachados, retidos por memória, PDFs restantes)."),
+    "memoria_reservada_mb": ("gauge", "Memória estimada reservada pelos trabalhos em execução."),
+    "rss_workers_mb": ("gauge", "RSS somado dos processos que processam PDFs."),
+    "etapa_segundos": ("histogram", "Latência por etapa do processamento."),
+    "cache_consultas_total": ("counter", "Consultas a cada cache por resultado (acerto, falta)."),
+    "cache_taxa_acerto": ("gauge", "Fração de acertos de cada cache."),
+    "inicio_timestamp_segundos": ("gauge", "Início da varredura (epoch)."),
+}
+
+# ============================================================================
+# COLETA
+# ============================================================================
+
+def _escapar(valor) -> str:
+    return str(valor).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+def _rotulos(rotulos: Tuple[Tuple[str, str], ...]) -> str:
+    if not rotulos:
+        return ""
+    return "{" + ",".join(f'{nome}="{_escapar(valor)}"' for nome, valor in rotulos) + "}"
+
+def _numero(valor: float) -> str:
+    if valor == float("inf"):
+        return "+Inf"
+    return repr(float(valor)) if isinstance(valor, float) else str(valor)
+
+class MetricasExecucao:
+    """
+    Contadores, medidores e histogramas de uma varredura (seguro entre threads: o
+    servidor HTTP lê enquanto o laço principal escreve).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.inicio = time.time()
+        self._contadores: Dict[Tuple[str, tuple], float] = {}
+        self._medidores: Dict[Tuple[str, tuple], float] = {}
+        self._histogramas: Dict[str, Dict] = {}  # etapa -> {"buckets": [...], "soma": s, "n": n}
+
+    def incrementar(self, nome: str, valor: float = 1, **rotulos):
+        chave = (nome, tuple(sorted(rotulos.items())))
+        with self._lock:
+            self._contadores[chave] = self._contadores.get(chave, 0) + valor
+
+    def definir(self, nome: str, valor: float, **rotulos):
+        chave = (nome, tuple(sorted(rotulos.items())))
+        with self._lock:
+            self._medidores[chave] = valor
+
+    def observar(self, etapa: str, segundos: float):
+        """Registra a latência de uma etapa no histograma."""
+        with self._lock:
+            histograma = self._histogramas.get(etapa)
+            if histograma is None:
+                histograma = self._histogramas[etapa] = {"buckets": [0] * len(BUCKETS_SEGUNDOS), "soma": 0.0, "n": 0}
+            for i, limite in enumerate(BUCKETS_SEGUNDOS):
+                if segundos <= limite:
+                    histograma["buckets"][i] += 1
+            histograma["soma"] += segundos
+            histograma["n"] += 1
+
+    def registrar_cache(self, cache: str, acerto: bool):
+        self.incrementar("cache_consultas_total", cache=cache, resultado="acerto" if acerto else "falta")
+
+    def registrar_documento(self, status: str, paginas: Optional[int] = None, tamanho_bytes: Optional[int] = None):
+        """PDF concluído com `status` ("ok", "erro" ou "timeout")."""
+        self.incrementar("documentos_total", status=status)
+        if paginas:
+            self.incrementar("paginas_total", paginas)
+        if tamanho_bytes:
+            self.incrementar("bytes_total", tamanho_bytes)
+
+    def texto(self) -> str:
+        """Todas as métricas no formato de exposição texto do Prometheus."""
+        with self._lock:
+            contadores = dict(self._contadores)
+            medidores = dict(self._medidores)
+            histogramas = {e: {"buckets": list(h["buckets"]), "soma": h["soma"], "n": h["n"]} for e, h in self._histogramas.items()}
+
+        decorrido = max(time.time() - self.inicio, 1e-9)
+        medidores[("paginas_por_segundo", ())] = contadores.get(("paginas_total", ()), 0) / decorrido
+        medidores[("bytes_por_segundo", ())] = contadores.get(("bytes_total", ()), 0) / decorrido
+        medidores[("inicio_timestamp_segundos", ())] = self.inicio
+        consultas: Dict[str, List[float]] = {}
+        for (nome, rotulos), valor in contadores.items():
+            if nome == "cache_consultas_total":
+                rotulos = dict(rotulos)
+                par = consultas.setdefault(rotulos["cache"], [0, 0])
+                par[0 if rotulos["resultado"] == "acerto" else 1] += valor
+        for cache, (acertos, faltas) in consultas.items():
+            medidores[("cache_taxa_acerto", (("cache", cache),))] = acertos / (acertos + faltas) if acertos + faltas else 0.0
+
+        amostras: Dict[str, List[str]] = {}
+        for (nome, rotulos), valor in list(contadores.items()) + list(medidores.items()):
+            amostras.setdefault(nome, []).append(f"{PREFIXO_METRICAS}_{nome}{_rotulos(rotulos)} {_numero(valor)}")
+        for etapa, histograma in sorted(histogramas.items()):
+            linhas = amostras.setdefault("etapa_segundos", [])
+            nome = f"{PREFIXO_METRICAS}_etapa_segundos"
+            for limite, n in zip(BUCKETS_SEGUNDOS, histograma["buckets"]):
+                linhas.append(f'{nome}_bucket{_rotulos((("etapa", etapa), ("le", _numero(float(limite)))))} {n}')
+            linhas.append(f'{nome}_bucket{_rotulos((("etapa", etapa), ("le", "+Inf")))} {histograma["n"]}')
+            linhas.append(f'{nome}_sum{_rotulos((("etapa", etapa),))} {_numero(histograma["soma"])}')
+            linhas.append(f'{nome}_count{_rotulos((("etapa", etapa),))} {histograma["n"]}')
+
+        saida = []
+        for nome in sorted(amostras):
+            tipo, descricao = _DESCRICOES.get(nome, ("untyped", nome))
+            saida.append(f"# HELP {PREFIXO_METRICAS}_{nome} {descricao}")
+            saida.append(f"# TYPE {PREFIXO_METRICAS}_{nome} {tipo}")
+            saida.extend(sorted(amostras[nome]) if tipo != "histogram" else amostras[nome])
+        return "\n".join(saida) + "\n"
+
+# ============================================================================
+# SERVIDOR HTTP
+# ============================================================================
+
+class ServidorMetricas:
+    """
+    Serve `metricas` em http://ENDERECO_METRICAS:<porta>/metrics numa thread daemon. Uso:
+        with ServidorMetricas(metricas, porta):
+            ...  # varredura
+    Se a porta não puder ser aberta, avisa e segue sem servidor.
+    """
+
+    def __init__(self, metricas: MetricasExecucao, porta: int, endereco: Optional[str] = None):
+        self.metricas = metricas
+        self.porta = porta
+        self.endereco = endereco or ENDERECO_METRICAS
+        self._servidor: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def _manipulador(self):
+        metricas = self.metricas
+
+        class _Manipulador(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] not in ("/metrics", "/"):
+                    self.send_error(404)
+                    return
+                corpo = metricas.texto().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(corpo)))
+                self.end_headers()
+                self.wfile.write(corpo)
+
+            def log_message(self, *args):
+                pass  # Sem log por requisição no console da varredura
+
+        return _Manipulador
+
+    def iniciar(self):
+        try:
+            self._servidor = ThreadingHTTPServer((self.endereco, self.porta), self._manipulador())
+        except OSError as e:
+            print(f"AVISO: não foi possível abrir o servidor de métricas em {self.endereco}:{self.porta}: {e}")
+            return
+        self._servidor.daemon_threads = True
+        self._thread = threading.Thread(target=self._servidor.serve_forever, daemon=True)
+        self._thread.start()
+        print(f"Métricas em http://{self.endereco}:{self._servidor.server_address[1]}/metrics")
+
+    def encerrar(self):
+        if self._servidor is None:
+            return
+        self._servidor.shutdown()
+        self._servidor.server_close()
+        self._thread.join(timeout=5)
+        self._servidor = None
+        self._thread = None
+
+    def __enter__(self):
+        self.iniciar()
+        return self
+
+    def __exit__(self, *exc):
+        self.encerrar()
+        return False
@@ -0,0 +1,174 @@
+"""
+Observação contínua da pasta de PDFs (modo --observar de analisar_pdfs.py).
+
+Com o pacote `watchdog` instalado, eventos do sistema de arquivos (inotify, FSEvents,
+ReadDirectoryChangesW) acordam a verificação na hora; sem ele, a pasta é relida a cada
+INTERVALO_POLLING_SEGUNDOS. Em ambos os casos um PDF novo ou alterado só é entregue depois
+de passar ESPERA_ESTABILIDADE_SEGUNDOS com tamanho e mtime iguais e de poder ser aberto
+(debounce de cópias e downloads ainda em andamento).
+"""
+
+import os
+import time
+import threading
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+    WATCHDOG_DISPONIVEL = True
+except ImportError:
+    WATCHDOG_DISPONIVEL = False
+
+# ============================================================================
+# CONFIGURAÇÕES
+# ============================================================================
+
+INTERVALO_POLLING_SEGUNDOS = 10  # Sem watchdog: intervalo entre releituras da pasta
+INTERVALO_SEGURANCA_SEGUNDOS = 300  # Com watchdog: releitura completa mesmo sem eventos (eventos perdidos)
+ESPERA_ESTABILIDADE_SEGUNDOS = 5  # Tempo sem mudar tamanho/mtime para o PDF ser considerado completo
+INTERVALO_DEBOUNCE_SEGUNDOS = 1  # Reverificação enquanto há PDFs aguardando estabilidade
+
+# ============================================================================
+# OBSERVADOR
+# ============================================================================
+
+def _estado_arquivo(caminho: str) -> Optional[Tuple[int, int]]:
+    """(tamanho, mtime_ns) do arquivo, ou None se não existir mais."""
+    try:
+        st = os.stat(caminho)
+    except OSError:
+        return None
+    return st.st_size, st.st_mtime_ns
+
+def _estado_pasta(pasta: str) -> Dict[str, Tuple[int, int]]:
+    """caminho -> (tamanho, mtime_ns) de todos os PDFs da pasta (recursivo)."""
+    estado = {}
+    for caminho in Path(pasta).rglob("*.pdf"):
+        atual = _estado_arquivo(str(caminho))
+        if atual is not None:
+            estado[str(caminho)] = atual
+    return estado
+
+def _pode_abrir(caminho: str) -> bool:
+    """No Windows, um arquivo ainda sendo copiado não pode ser aberto."""
+    try:
+        with open(caminho, "rb"):
+            return True
+    except OSError:
+        return False
+
+class ObservadorPasta:
+    """
+    Observa os PDFs de `pasta` e chama ao_mudar(caminhos) com os PDFs novos, alterados
+    ou removidos, já estáveis. O estado inicial é lido na criação: quem cria o observador
+    pode processar a pasta inteira antes de executar(), sem perder o que chegar nesse meio tempo.
+    """
+
+    def __init__(
+        self,
+        pasta: str,
+        ao_mudar: Callable[[List[str]], None],
+        espera_estabilidade: Optional[float] = None,
+        intervalo_polling: Optional[float] = None,
+    ):
+        self.pasta = pasta
+        self.ao_mudar = ao_mudar
+        self.espera = espera_estabilidade if espera_estabilidade is not None else ESPERA_ESTABILIDADE_SEGUNDOS
+        self.intervalo = intervalo_polling or (INTERVALO_SEGURANCA_SEGUNDOS if WATCHDOG_DISPONIVEL else INTERVALO_POLLING_SEGUNDOS)
+        self._conhecidos = _estado_pasta(pasta)
+        self._pendentes: Dict[str, Tuple[Optional[Tuple[int, int]], float]] = {}  # caminho -> (estado, desde)
+        self._lock = threading.Lock()
+        self._evento = threading.Event()
+        self._parar = threading.Event()
+
+    def instaveis(self) -> Set[str]:
+        """PDFs que mudaram e ainda não ficaram estáveis (não devem ser processados agora)."""
+        with self._lock:
+            return set(self._pendentes)
+
+    def _marcar(self, caminho: str):
+        """Evento do watchdog: o caminho mudou (verificado no próximo ciclo)."""
+        if caminho.lower().endswith(".pdf"):
+            with self._lock:
+                self._pendentes.setdefault(caminho, (None, time.monotonic()))
+            self._evento.set()
+
+    def _reler_pasta(self):
+        """Acrescenta aos pendentes os PDFs que diferem do último estado entregue."""
+        atual = _estado_pasta(self.pasta)
+        agora = time.monotonic()
+        with self._lock:
+            for caminho in set(atual) | set(self._conhecidos):
+                if atual.get(caminho) != self._conhecidos.get(caminho):
+                    self._pendentes.setdefault(caminho, (None, agora))
+
+    def _estaveis(self) -> List[str]:
+        """Tira dos pendentes os PDFs estáveis (ou removidos) e devolve seus caminhos."""
+        agora = time.monotonic()
+        estaveis = []
+        with self._lock:
+            for caminho, (anterior, desde) in list(self._pendentes.items()):
+                atual = _estado_arquivo(caminho)
+                if atual != anterior:
+                    self._pendentes[caminho] = (atual, agora)  # Ainda mudando: recomeça a espera
+                    continue
+                if agora - desde < self.espera:
+                    continue
+                if atual is not None and not _pode_abrir(caminho):
+                    continue
+                del self._pendentes[caminho]
+                if atual == self._conhecidos.get(caminho):
+                    continue  # Tocado, mas igual ao já processado
+                if atual is None:
+                    self._conhecidos.pop(caminho, None)
+                else:
+                    self._conhecidos[caminho] = atual
+                estaveis.append(caminho)
+        return sorted(estaveis)
+
+    def encerrar(self):
+        """Pede o fim do laço de executar() (pode ser chamado de outra thread)."""
+        self._parar.set()
+        self._evento.set()
+
+    def executar(self):
+        """Laço do observador (até encerrar() ou Ctrl+C)."""
+        observer = None
+        if WATCHDOG_DISPONIVEL:
+            observador = self
+
+            class _Manipulador(FileSystemEventHandler):
+                def on_any_event(self, evento):
+                    if not evento.is_directory:
+                        observador._marcar(evento.src_path)
+                        if getattr(evento, "dest_path", None):
+                            observador._marcar(evento.dest_path)
+            observer = Observer()
+            observer.schedule(_Manipulador(), self.pasta, recursive=True)
+            observer.start()
+        modo = "eventos do sistema de arquivos (watchdog)" if observer else f"releitura a cada {self.intervalo:.0f}s"
+        print(f"\nObservando {self.pasta} ({modo}). Ctrl+C para sair.")
+
+        ultima_leitura = time.monotonic()
+        try:
+            while not self._parar.is_set():
+                espera = INTERVALO_DEBOUNCE_SEGUNDOS if self.instaveis() else self.intervalo
+                acordou = self._evento.wait(espera)
+                self._evento.clear()
+                if self._parar.is_set():
+                    break
+                if not acordou and time.monotonic() - ultima_leitura >= self.intervalo:
+                    self._reler_pasta()
+                    ultima_leitura = time.monotonic()
+                mudaram = self._estaveis()
+                if mudaram:
+                    try:
+                        self.ao_mudar(mudaram)
+                    except Exception as e:
+                        print(f"\nERRO ao atualizar os resultados: {e}")
+        finally:
+            if observer is not None:
+                observer.stop()
+                observer.join(timeout=5)
@@ -0,0 +1,147 @@
+"""
+Páginas só-imagem (relatórios escaneados): detecção barata e faixa de OCR opcional.
+A detecção olha o content stream e os recursos da página, sem rodar o layout do pdfplumber.
+O OCR (tesseract via pytesseract) é opcional e limitado por um semáforo próprio e por um
+tempo máximo por PDF (TIMEOUT_OCR_PDF_SEGUNDOS), separado do timeout da extração.
+Na execução paralela, o OCR roda num pool próprio de MAX_OCR_SIMULTANEOS processos
+(ver _executar_em_paralelo em analisar_pdfs.py): os workers de contagem não esperam por ele.
+"""
+
+import io
+import re
+import time
+import threading
+from typing import List, Optional, Tuple
+
+from pdfminer.pdftypes import resolve1
+
+from cancelamento import ponto_de_parada
+
+try:
+    import pytesseract
+    OCR_DISPONIVEL = True
+except ImportError:
+    OCR_DISPONIVEL = False
+
+# ============================================================================
+# CONFIGURAÇÕES
+# ============================================================================
+
+MAX_OCR_SIMULTANEOS = 1  # OCR é caro em CPU: poucas páginas ao mesmo tempo, sem travar a faixa principal
+RESOLUCAO_OCR = 300  # DPI para renderizar a página antes do OCR
+IDIOMAS_OCR = "por+eng"
+TIMEOUT_OCR_PAGINA_SEGUNDOS = 60
+TIMEOUT_OCR_PDF_SEGUNDOS = 600  # Tempo máximo de OCR por PDF (espera pelo semáforo não conta)
+
+# ============================================================================
+# DETECÇÃO DE PÁGINAS SÓ-IMAGEM
+# ============================================================================
+
+PAGINA_TEXTO = "texto"
+PAGINA_IMAGEM = "imagem"
+PAGINA_VAZIA = "vazia"
+
+_RE_BLOCO_TEXTO = re.compile(rb'(?:^|[\s\]>)])BT(?=[\s/\[(<])')
+_RE_IMAGEM_INLINE = re.compile(rb'(?:^|\s)BI(?=\s)')
+
+def _dados_conteudo(page_obj) -> bytes:
+    """Junta os content streams (já descomprimidos) da página."""
+    contents = page_obj.contents or []
+    if not isinstance(contents, list):
+        contents = [contents]
+    partes = []
+    for stream in contents:
+        stream = resolve1(stream)
+        if stream is not None and hasattr(stream, "get_data"):
+            partes.append(stream.get_data())
+    return b"\n".join(partes)
+
+def classificar_pagina(pagina) -> str:
+    """
+    Classifica uma página do pdfplumber em "texto", "imagem" ou "vazia".
+    - texto: há operador BT no content stream, ou um Form XObject (pode conter texto)
+    - imagem: sem texto, mas com Image XObject ou imagem inline
+    Na dúvida (erro ao ler), retorna "texto" para seguir o caminho normal de extração.
+    """
+    try:
+        page_obj = pagina.page_obj
+        recursos = resolve1(page_obj.resources) or {}
+        xobjects = resolve1(recursos.get("XObject")) or {}
+
+        tem_imagem = False
+        for ref in xobjects.values():
+            xobj = resolve1(ref)
+            subtipo = getattr(xobj, "attrs", {}).get("Subtype")
+            nome = getattr(subtipo, "name", subtipo)
+            if nome == "Form":
+                return PAGINA_TEXTO  # Texto pode estar dentro do formulário
+            if nome == "Image":
+                tem_imagem = True
+
+        conteudo = _dados_conteudo(page_obj)
+        if _RE_BLOCO_TEXTO.search(conteudo):
+            return PAGINA_TEXTO  # Mesmo sem /Font declarada o pdfminer usa uma fonte padrão
+        if tem_imagem or _RE_IMAGEM_INLINE.search(conteudo):
+            return PAGINA_IMAGEM
+        return PAGINA_VAZIA
+    except Exception:
+        return PAGINA_TEXTO
+
+# ============================================================================
+# FAIXA DE OCR
+# ============================================================================
+
+_semaforo_ocr = threading.BoundedSemaphore(MAX_OCR_SIMULTANEOS)
+
+def configurar_semaforo_ocr(semaforo):
+    """
+    Substitui o semáforo do OCR. Usado como initializer do pool de processos para que
+    o limite MAX_OCR_SIMULTANEOS valha para todos os workers juntos.
+    """
+    global _semaforo_ocr
+    _semaforo_ocr = semaforo
+
+def ocr_paginas(
+    caminho_pdf: str,
+    indices: List[int],
+    dados: Optional[bytes] = None,
+    timeout_segundos: Optional[float] = None
+) -> List[Tuple[int, str]]:
+    """
+    Roda OCR nas páginas indicadas (índices a partir de 0). Retorna [(indice, texto)].
+    Se `dados` (bytes do PDF já em memória) for informado, não relê o arquivo.
+    Páginas que falharem no OCR são omitidas. Passado `timeout_segundos` (padrão
+    TIMEOUT_OCR_PDF_SEGUNDOS) de OCR, as páginas restantes também são omitidas, com aviso.
+    Entre páginas, respeita a pausa e o cancelamento da execução (ver cancelamento.py).
+    """
+    if not OCR_DISPONIVEL or not indices:
+        return []
+
+    import pdfplumber
+
+    restante = timeout_segundos if timeout_segundos is not None else TIMEOUT_OCR_PDF_SEGUNDOS
+    textos = []
+    with pdfplumber.open(io.BytesIO(dados) if dados is not None else caminho_pdf) as pdf:
+        for n, indice in enumerate(indices):
+            ponto_de_parada()
+            if restante <= 0:
+                print(
+                    f"\nAVISO: OCR interrompido por tempo em {caminho_pdf}: "
+                    f"{len(indices) - n} de {len(indices)} páginas escaneadas ficaram sem texto."
+                )
+                break
+            with _semaforo_ocr:
+                inicio = time.monotonic()
+                try:
+                    imagem = pdf.pages[indice].to_image(resolution=RESOLUCAO_OCR).original
+                    texto = pytesseract.image_to_string(
+                        imagem, lang=IDIOMAS_OCR, timeout=max(1.0, min(TIMEOUT_OCR_PAGINA_SEGUNDOS, restante))
+                    )
+                except Exception as e:
+                    print(f"\nAVISO: OCR falhou na página {indice + 1} de {caminho_pdf}: {e}")
+                    continue
+                finally:
+                    restante -= time.monotonic() - inicio
+            if texto and texto.strip():
+                textos.append((indice, texto))
+    return textos
@@ -0,0 +1,144 @@
+"""
+Contagens de ocorrências por página, guardadas nos resultados para consultas sem reabrir o PDF.
+
+Com CONTAGEM_POR_PAGINA em analisar_pdfs.py, a extração mantém a tabela de páginas
+(número da página -> posição onde ela começa no texto juntado) e cada ocorrência aceita
+é atribuída à sua página. Cada linha (PDF x grupo) ganha a coluna "ocorrencias_por_pagina":
+JSON esparso {termo: [[páginas], [contagens]]}, só com as páginas onde o termo aparece
+(páginas numeradas a partir de 1). Mapas de calor e "páginas que mais falam de IA" saem
+direto dessa coluna (ver mapa_calor e top_paginas).
+"""
+
+import json
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from coocorrencia import montar_ocorrencias
+
+# ============================================================================
+# CONFIGURAÇÕES
+# ============================================================================
+
+TOP_PAGINAS_POR_PDF = 5  # Páginas por PDF x grupo na aba top_paginas
+
+COLUNAS_TOP_PAGINAS = ["empresa", "ano", "pdf_nome", "grupo", "pagina", "ocorrencias", "termos"]
+
+# ============================================================================
+# CONTAGEM
+# ============================================================================
+
+def tabela_paginas(paginas_texto: List[Tuple[int, str]]) -> Tuple[List[int], List[int]]:
+    """
+    Tabela de páginas do texto juntado (páginas em ordem, separadas por "\\n"):
+    (números das páginas com texto, a partir de 1; posição onde cada uma começa).
+    """
+    numeros, inicios = [], []
+    pos = 0
+    for indice, texto in sorted(paginas_texto):
+        numeros.append(indice + 1)
+        inicios.append(pos)
+        pos += len(texto) + 1
+    return numeros, inicios
+
+def contar_por_pagina(
+    posicoes: Dict[str, Dict[str, Sequence[int]]],
+    eh_sigla: Dict[Tuple[str, str], bool],
+    texto_original: str,
+    texto_normalizado: str,
+    numeros_paginas: Sequence[int],
+    inicios_paginas: Sequence[int],
+) -> Dict[str, Dict[str, Tuple[List[int], List[int]]]]:
+    """
+    grupo -> termo -> ([páginas], [contagens]) a partir das posições aceitas de cada termo
+    (grupo -> termo -> posições, como em contar_grupos_no_texto).
+    """
+    posicoes_termos = {(grupo, t): p for grupo, do_grupo in posicoes.items() for t, p in do_grupo.items()}
+    _, termo, pagina, rotulos = montar_ocorrencias(
+        posicoes_termos, eh_sigla, texto_original, texto_normalizado, inicios_paginas
+    )
+    numeros = np.asarray(numeros_paginas or [1], dtype=np.int64)
+    resultado: Dict[str, Dict[str, Tuple[List[int], List[int]]]] = {grupo: {} for grupo in posicoes}
+    if not len(termo):
+        return resultado
+    # Pares (termo, página) únicos com contagem, numa passada
+    chaves, contagens = np.unique(termo.astype(np.int64) * len(numeros) + np.clip(pagina, 0, None), return_counts=True)
+    ids_termo, ids_pagina = np.divmod(chaves, len(numeros))
+    for id_termo in np.unique(ids_termo):
+        selecao = ids_termo == id_termo
+        grupo, t = rotulos[id_termo]
+        resultado[grupo][t] = (numeros[ids_pagina[selecao]].tolist(), contagens[selecao].tolist())
+    return resultado
+
+# ============================================================================
+# CONSULTAS
+# ============================================================================
+
+def ler_contagens(valor: Optional[str]) -> Dict[str, Dict[int, int]]:
+    """Coluna ocorrencias_por_pagina -> termo -> {página: contagem}."""
+    if not isinstance(valor, str) or not valor:
+        return {}
+    return {termo: dict(zip(paginas, contagens)) for termo, (paginas, contagens) in json.loads(valor).items()}
+
+def total_por_pagina(valor: Optional[str]) -> Dict[int, int]:
+    """Coluna ocorrencias_por_pagina -> {página: ocorrências de todos os termos do grupo}."""
+    totais: Dict[int, int] = {}
+    for por_pagina in ler_contagens(valor).values():
+        for pagina, n in por_pagina.items():
+            totais[pagina] = totais.get(pagina, 0) + n
+    return totais
+
+def mapa_calor(df: pd.DataFrame, pdf_nome: str, grupo: str) -> pd.DataFrame:
+    """
+    Matriz termo x página (1..total_paginas) com as contagens de um PDF e grupo, pronta
+    para um heatmap (zeros nas páginas sem ocorrência).
+    """
+    linhas = df[(df["pdf_nome"] == pdf_nome) & (df["grupo"] == grupo)]
+    if linhas.empty:
+        return pd.DataFrame()
+    linha = linhas.iloc[0]
+    contagens = ler_contagens(linha.get("ocorrencias_por_pagina"))
+    total_paginas = int(linha["total_paginas"] or 0) or max((max(p) for p in contagens.values() if p), default=0)
+    matriz = np.zeros((len(contagens), total_paginas), dtype=np.int64)
+    for i, por_pagina in enumerate(contagens.values()):
+        for pagina, n in por_pagina.items():
+            if 1 <= pagina <= total_paginas:
+                matriz[i, pagina - 1] = n
+    return pd.DataFrame(matriz, index=list(contagens), columns=range(1, total_paginas + 1))
+
+def _paginas_do_registro(registro, grupo: str) -> List[Tuple]:
+    """Linhas (empresa, ano, pdf, grupo, página, ocorrências, termos) de uma linha de resultado."""
+    valor = getattr(registro, "ocorrencias_por_pagina", None)
+    contagens = ler_contagens(valor)
+    return [
+        (registro.empresa, registro.ano, registro.pdf_nome, grupo, pagina, total,
+         ", ".join(t for t, por_pagina in contagens.items() if pagina in por_pagina))
+        for pagina, total in total_por_pagina(valor).items()
+    ]
+
+def _ordenar_top(linhas: List[Tuple], n: int) -> List[Tuple]:
+    return sorted(linhas, key=lambda linha: (-linha[5], linha[2], linha[4]))[:n]
+
+def top_paginas(
+    df: pd.DataFrame,
+    grupo: str,
+    n: int = 10,
+    pdf_nome: Optional[str] = None
+) -> pd.DataFrame:
+    """
+    As `n` páginas com mais ocorrências do grupo (no corpus ou só em `pdf_nome`), com os
+    termos de cada página.
+    """
+    selecao = df[df["grupo"] == grupo]
+    if pdf_nome is not None:
+        selecao = selecao[selecao["pdf_nome"] == pdf_nome]
+    linhas = [linha for registro in selecao.itertuples(index=False) for linha in _paginas_do_registro(registro, grupo)]
+    return pd.DataFrame(_ordenar_top(linhas, n), columns=COLUNAS_TOP_PAGINAS)
+
+def gerar_aba_top_paginas(df_completo: pd.DataFrame, n: int = TOP_PAGINAS_POR_PDF) -> pd.DataFrame:
+    """Aba top_paginas: as `n` páginas com mais ocorrências de cada PDF x grupo."""
+    linhas = []
+    for registro in df_completo.itertuples(index=False):
+        linhas.extend(_ordenar_top(_paginas_do_registro(registro, registro.grupo), n))
+    return pd.DataFrame(linhas, columns=COLUNAS_TOP_PAGINAS)
@@ -0,0 +1,137 @@
+"""
+Perfil de custo e seletividade do matcher, termo a termo.
+
+Para cada termo/sigla do dicionário acumula, ao longo do corpus:
+- tempo gasto (regras de contexto, regex dos termos fora da trie, busca de siglas e exemplos);
+- candidatos brutos (ocorrências que o padrão do termo encontra);
+- rejeições por regra (verificar_data_eh_data, verificar_bi_bilhoes, sufixo/boilerplate de IA, ...);
+- ocorrências aceitas.
+A varredura da trie é uma passada só por todos os termos: seu tempo fica na linha "(varredura)".
+
+Cada processo grava o próprio perfil acumulado em data/cache/perfil/<pid>.json depois de
+cada PDF; o processo principal junta os arquivos no fim da execução.
+"""
+
+import os
+import json
+from pathlib import Path
+from typing import Dict, Optional
+
+import pandas as pd
+
+# ============================================================================
+# CONFIGURAÇÕES
+# ============================================================================
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+PASTA_PERFIL = str(_PROJECT_ROOT / "data" / "cache" / "perfil")
+ARQUIVO_PERFIL_CSV = str(_PROJECT_ROOT / "data" / "perfil_termos.csv")
+TERMO_VARREDURA = "(varredura)"  # Tempo da passada única da trie (compartilhado por todos os termos)
+
+# ============================================================================
+# PERFIL
+# ============================================================================
+
+class PerfilMatcher:
+    """Estatísticas acumuladas por termo: termo -> {segundos, aceitos, rejeitados: {motivo: n}}."""
+
+    def __init__(self):
+        self.termos: Dict[str, Dict] = {}
+        self.documentos = 0
+
+    def _termo(self, termo: str) -> Dict:
+        estatisticas = self.termos.get(termo)
+        if estatisticas is None:
+            estatisticas = self.termos[termo] = {"segundos": 0.0, "aceitos": 0, "rejeitados": {}}
+        return estatisticas
+
+    def registrar(
+        self,
+        termo: str,
+        segundos: float = 0.0,
+        aceitos: int = 0,
+        rejeitados: Optional[Dict[str, int]] = None
+    ):
+        """Soma tempo, ocorrências aceitas e rejeições (motivo -> n) ao termo."""
+        estatisticas = self._termo(termo)
+        estatisticas["segundos"] += segundos
+        estatisticas["aceitos"] += aceitos
+        for motivo, n in (rejeitados or {}).items():
+            estatisticas["rejeitados"][motivo] = estatisticas["rejeitados"].get(motivo, 0) + n
+
+    def juntar(self, outro: "PerfilMatcher"):
+        """Acumula o perfil de outro processo."""
+        self.documentos += outro.documentos
+        for termo, estatisticas in outro.termos.items():
+            self.registrar(termo, estatisticas["segundos"], estatisticas["aceitos"], estatisticas["rejeitados"])
+
+    def gravar(self, pasta: Optional[str] = None):
+        """Grava (de forma atômica) o perfil deste processo em <pasta>/<pid>.json."""
+        pasta = pasta or PASTA_PERFIL
+        arquivo = os.path.join(pasta, f"{os.getpid()}.json")
+        try:
+            os.makedirs(pasta, exist_ok=True)
+            tmp = f"{arquivo}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"documentos": self.documentos, "termos": self.termos}, f, ensure_ascii=False)
+            os.replace(tmp, arquivo)
+        except OSError as e:
+            print(f"\nAVISO: não foi possível gravar o perfil do matcher em {arquivo}: {e}")
+
+    def para_dataframe(self) -> pd.DataFrame:
+        """Uma linha por termo, dos mais caros para os mais baratos."""
+        motivos = sorted({m for e in self.termos.values() for m in e["rejeitados"]})
+        linhas = []
+        for termo, estatisticas in self.termos.items():
+            rejeitados = sum(estatisticas["rejeitados"].values())
+            candidatos = estatisticas["aceitos"] + rejeitados
+            linha = {
+                "termo": termo,
+                "segundos": round(estatisticas["segundos"], 4),
+                "ms_por_documento": round(estatisticas["segundos"] * 1000 / max(self.documentos, 1), 3),
+                "candidatos": candidatos,
+                "aceitos": estatisticas["aceitos"],
+                "rejeitados": rejeitados,
+                "pct_aceitos": round(estatisticas["aceitos"] / candidatos * 100, 2) if candidatos else None,
+            }
+            for motivo in motivos:
+                linha[f"rejeitados_{motivo}"] = estatisticas["rejeitados"].get(motivo, 0)
+            linhas.append(linha)
+        colunas = ["termo", "segundos", "ms_por_documento", "candidatos", "aceitos", "rejeitados", "pct_aceitos"]
+        df = pd.DataFrame(linhas, columns=colunas + [f"rejeitados_{m}" for m in motivos])
+        return df.sort_values(["segundos", "candidatos"], ascending=False).reset_index(drop=True)
+
+def limpar_perfis(pasta: Optional[str] = None):
+    """Apaga os perfis de execuções anteriores (início de uma nova varredura)."""
+    pasta = pasta or PASTA_PERFIL
+    try:
+        nomes = os.listdir(pasta)
+    except OSError:
+        return
+    for nome in nomes:
+        try:
+            os.remove(os.path.join(pasta, nome))
+        except OSError:
+            continue
+
+def carregar_perfis(pasta: Optional[str] = None) -> PerfilMatcher:
+    """Junta os perfis gravados pelos processos da execução."""
+    pasta = pasta or PASTA_PERFIL
+    total = PerfilMatcher()
+    try:
+        nomes = os.listdir(pasta)
+    except OSError:
+        return total
+    for nome in nomes:
+        if not nome.endswith(".json"):
+            continue
+        try:
+            with open(os.path.join(pasta, nome), "r", encoding="utf-8") as f:
+                dados = json.load(f)
+        except (OSError, ValueError):
+            continue
+        parcial = PerfilMatcher()
+        parcial.documentos = dados.get("documentos", 0)
+        parcial.termos = dados.get("termos", {})
+        total.juntar(parcial)
+    return total
@@ -0,0 +1,160 @@
+"""
+Pré-leitura assíncrona de PDFs para pastas lentas (OneDrive, rede).
+Um loop asyncio em thread própria lê os próximos PDFs inteiros para a memória, na ordem
+em que serão processados e limitado por um orçamento de bytes, enquanto os workers
+fazem o trabalho de CPU. O pdfplumber então lê de um BytesIO, sem I/O aleatório no disco.
+"""
+
+import asyncio
+import os
+import threading
+from typing import Dict, List, Optional
+
+# ============================================================================
+# CONFIGURAÇÕES
+# ============================================================================
+
+ORCAMENTO_PREFETCH_MB = 256  # Máximo de bytes lidos à frente e ainda não consumidos (0 desativa)
+MAX_LEITURAS_SIMULTANEAS = 4  # Leituras em paralelo (ajuda em armazenamento de alta latência)
+
+
+def _ler_arquivo(caminho: str) -> bytes:
+    with open(caminho, "rb") as f:
+        return f.read()
+
+
+class PrefetcherPDF:
+    """
+    Lê os arquivos de `caminhos` à frente do consumo. Uso:
+        with PrefetcherPDF(caminhos) as prefetcher:
+            dados = prefetcher.obter(caminho)  # bytes, ou None se não couber no orçamento
+    obter() deve ser chamado na mesma ordem de `caminhos` (cada caminho uma vez);
+    o orçamento só é liberado quando o buffer é entregue.
+    Arquivos maiores que o orçamento não são pré-lidos (obter() retorna None e o
+    chamador lê do disco normalmente).
+    """
+
+    def __init__(
+        self,
+        caminhos: List[str],
+        orcamento_bytes: Optional[int] = None,
+        max_leituras: Optional[int] = None,
+    ):
+        self.caminhos = list(caminhos)
+        self.orcamento = orcamento_bytes if orcamento_bytes is not None else ORCAMENTO_PREFETCH_MB * 1024 * 1024
+        self.max_leituras = max_leituras or MAX_LEITURAS_SIMULTANEAS
+        self._buffers: Dict[str, Optional[bytes]] = {}
+        self._pronto = threading.Condition()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._em_uso = 0  # Bytes lidos e ainda não entregues
+        self._lock = threading.Lock()
+        self._liberou: Optional[asyncio.Event] = None
+        self._encerrar = False
+        self._terminou = False
+
+    # --- lado asyncio -------------------------------------------------------
+
+    def _rodar(self):
+        try:
+            self._loop.run_until_complete(self._executar())
+        finally:
+            with self._pronto:
+                self._terminou = True
+                self._pronto.notify_all()
+
+    async def _executar(self):
+        self._liberou = asyncio.Event()
+        leituras = asyncio.Semaphore(self.max_leituras)
+        tarefas = []
+        for caminho in self.caminhos:
+            try:
+                tamanho = os.path.getsize(caminho)
+            except OSError:
+                self._publicar(caminho, None)
+                continue
+            if tamanho > self.orcamento:
+                self._publicar(caminho, None)
+                continue
+            # Esperar o consumidor liberar orçamento (clear antes de checar: sem wakeup perdido)
+            while True:
+                self._liberou.clear()
+                with self._lock:
+                    cabe = self._em_uso + tamanho <= self.orcamento
+                    if cabe:
+                        self._em_uso += tamanho
+                if cabe or self._encerrar:
+                    break
+                await self._liberou.wait()
+            if self._encerrar:
+                break
+            await leituras.acquire()
+            tarefas.append(asyncio.ensure_future(self._ler(caminho, tamanho, leituras)))
+        if tarefas:
+            await asyncio.gather(*tarefas, return_exceptions=True)
+
+    async def _ler(self, caminho: str, tamanho: int, leituras: asyncio.Semaphore):
+        try:
+            dados = await asyncio.to_thread(_ler_arquivo, caminho)
+        except OSError:
+            dados = None
+        finally:
+            leituras.release()
+        if dados is None:
+            self._liberar(tamanho)
+        self._publicar(caminho, dados)
+
+    def _liberar(self, tamanho: int):
+        """Devolve bytes ao orçamento e acorda o loop (seguro a partir de qualquer thread)."""
+        with self._lock:
+            self._em_uso -= tamanho
+        self._acordar_loop()
+
+    def _acordar_loop(self):
+        try:
+            self._loop.call_soon_threadsafe(self._liberou.set)
+        except (RuntimeError, AttributeError):
+            pass  # Loop já terminou (ou ainda não criou o evento): nada a acordar
+
+    def _publicar(self, caminho: str, dados: Optional[bytes]):
+        with self._pronto:
+            self._buffers[caminho] = dados
+            self._pronto.notify_all()
+
+    # --- lado consumidor ----------------------------------------------------
+
+    def iniciar(self):
+        if self.orcamento <= 0:
+            return
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._rodar, daemon=True)
+        self._thread.start()
+
+    def obter(self, caminho: str) -> Optional[bytes]:
+        """Espera o buffer do caminho ficar pronto e o entrega (None = ler do disco)."""
+        if self._thread is None:
+            return None
+        with self._pronto:
+            self._pronto.wait_for(lambda: caminho in self._buffers or self._terminou)
+            dados = self._buffers.pop(caminho, None)
+        if dados is not None:
+            self._liberar(len(dados))
+        return dados
+
+    def encerrar(self):
+        if self._thread is None:
+            return
+        self._encerrar = True
+        self._acordar_loop()
+        self._thread.join(timeout=5)
+        if not self._thread.is_alive():
+            self._loop.close()
+        self._thread = None
+
+    def __enter__(self):
+        self.iniciar()
+        return self
+
+    def __exit__(self, *exc):
+        self.encerrar()
+        return False
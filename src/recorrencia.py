@@ -0,0 +1,141 @@
+"""
+Texto recorrente entre relatórios da mesma empresa (parágrafos reaproveitados de um ano
+para o outro).
+
+- O texto de cada PDF é dividido em parágrafos (quebra de linha após fim de frase, ou
+  linha em branco); cada parágrafo normalizado vira um hash.
+- As contagens por parágrafo ficam em data/cache/paragrafos/<dicionário>/<empresa>/,
+  um arquivo por PDF. Ao analisar outro relatório da empresa, parágrafos já conhecidos
+  reaproveitam a contagem guardada e só os parágrafos novos passam pelo matcher.
+- Cada linha de resultado guarda as menções por hash de parágrafo; na geração do Excel,
+  uma menção é "recorrente" se o mesmo parágrafo já apareceu num relatório de ano
+  anterior da mesma empresa (independe da ordem em que os PDFs foram processados).
+
+As contagens são feitas parágrafo a parágrafo: regras de contexto que olham caracteres
+além da fronteira do parágrafo podem, raramente, decidir diferente da contagem no texto inteiro.
+"""
+
+import os
+import re
+import json
+import hashlib
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+# ============================================================================
+# CONFIGURAÇÕES
+# ============================================================================
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+PASTA_CACHE_PARAGRAFOS = str(_PROJECT_ROOT / "data" / "cache" / "paragrafos")
+
+# Fim de parágrafo: quebra de linha depois de pontuação final, ou linha em branco
+_RE_FIM_PARAGRAFO = re.compile(r'(?<=[.!?:;])[ \t]*\n|\n[ \t]*\n')
+
+# ============================================================================
+# PARÁGRAFOS
+# ============================================================================
+
+def dividir_paragrafos(texto: str) -> List[str]:
+    """Parágrafos do texto extraído (sem os vazios)."""
+    return [p for p in _RE_FIM_PARAGRAFO.split(texto) if p.strip()]
+
+def hash_paragrafo(paragrafo_normalizado: str) -> str:
+    """Hash curto (64 bits) do parágrafo normalizado."""
+    return hashlib.blake2b(paragrafo_normalizado.encode("utf-8"), digest_size=8).hexdigest()
+
+class MemoriaParagrafos:
+    """
+    Contagens por parágrafo já calculadas para uma empresa: hash -> {grupo: {termo: n}}
+    (parágrafos sem menção guardam {}). Um arquivo por PDF, gravado só pelo processo que
+    analisou o PDF, então workers em paralelo não disputam o mesmo arquivo.
+    `versao` identifica dicionário + compilador (contagens de outra versão não valem).
+    """
+
+    def __init__(self, empresa: str, versao: str, pasta: Optional[str] = None):
+        self.pasta = os.path.join(pasta or PASTA_CACHE_PARAGRAFOS, versao, empresa)
+
+    def _arquivo(self, caminho_pdf: str) -> str:
+        nome = hashlib.blake2b(caminho_pdf.encode("utf-8"), digest_size=8).hexdigest()
+        return os.path.join(self.pasta, f"{nome}.json")
+
+    def carregar(self) -> Dict[str, Dict[str, Dict[str, int]]]:
+        """Une as contagens de todos os PDFs da empresa já analisados."""
+        conhecidos = {}
+        try:
+            nomes = os.listdir(self.pasta)
+        except OSError:
+            return conhecidos
+        for nome in nomes:
+            if not nome.endswith(".json"):
+                continue
+            try:
+                with open(os.path.join(self.pasta, nome), "r", encoding="utf-8") as f:
+                    conhecidos.update(json.load(f))
+            except (OSError, ValueError):
+                continue  # Arquivo sendo gravado ou corrompido: os parágrafos serão recontados
+        return conhecidos
+
+    def gravar(self, caminho_pdf: str, paragrafos: Dict[str, Dict[str, Dict[str, int]]]):
+        """Grava (de forma atômica) as contagens dos parágrafos de um PDF."""
+        arquivo = self._arquivo(caminho_pdf)
+        try:
+            os.makedirs(self.pasta, exist_ok=True)
+            tmp = f"{arquivo}.{os.getpid()}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(paragrafos, f, ensure_ascii=False, separators=(",", ":"))
+            os.replace(tmp, arquivo)
+        except OSError as e:
+            print(f"\nAVISO: não foi possível gravar o cache de parágrafos em {arquivo}: {e}")
+
+# ============================================================================
+# NOVO x RECORRENTE
+# ============================================================================
+
+def classificar_recorrencia(df_completo: pd.DataFrame) -> pd.DataFrame:
+    """
+    Acrescenta "ocorrencias_novas" e "ocorrencias_recorrentes" a cada linha (PDF x grupo),
+    a partir de "mencoes_por_paragrafo" (JSON hash -> menções). Recorrente = parágrafo que
+    teve menções do grupo num PDF de ano anterior da mesma empresa. Remove a coluna de hashes.
+    """
+    df = df_completo.copy()
+    novas = [None] * len(df)
+    recorrentes = [None] * len(df)
+
+    chaves = df[["empresa", "grupo", "ano", "mencoes_por_paragrafo"]].astype(object)
+    vistos_por_ano: Dict[tuple, Dict[str, set]] = {}
+    mencoes_linhas = []
+    for empresa, grupo, ano, mencoes in chaves.itertuples(index=False):
+        mencoes = json.loads(mencoes) if isinstance(mencoes, str) else None
+        mencoes_linhas.append(mencoes)
+        if mencoes:
+            vistos_por_ano.setdefault((empresa, grupo), {}).setdefault(str(ano), set()).update(mencoes)
+
+    for posicao, (empresa, grupo, ano, _) in enumerate(chaves.itertuples(index=False)):
+        mencoes = mencoes_linhas[posicao]
+        if mencoes is None:
+            continue  # Linha sem detecção de recorrência (ex.: diário de outra configuração)
+        anteriores = set()
+        for outro_ano, hashes in vistos_por_ano.get((empresa, grupo), {}).items():
+            if outro_ano < str(ano):
+                anteriores |= hashes
+        recorrentes[posicao] = sum(n for h, n in mencoes.items() if h in anteriores)
+        novas[posicao] = sum(mencoes.values()) - recorrentes[posicao]
+
+    df["ocorrencias_novas"] = novas
+    df["ocorrencias_recorrentes"] = recorrentes
+    return df.drop(columns="mencoes_por_paragrafo")
+
+def gerar_aba_recorrencia(df_classificado: pd.DataFrame) -> pd.DataFrame:
+    """Menções novas x recorrentes por empresa, ano e grupo."""
+    df = df_classificado.dropna(subset=["ocorrencias_novas"])
+    resumo = df.groupby(["empresa", "ano", "grupo"], observed=True).agg(
+        ocorrencias_total=("ocorrencias_total_grupo", "sum"),
+        ocorrencias_novas=("ocorrencias_novas", "sum"),
+        ocorrencias_recorrentes=("ocorrencias_recorrentes", "sum"),
+    ).reset_index()
+    total = resumo["ocorrencias_novas"] + resumo["ocorrencias_recorrentes"]
+    resumo["pct_novas"] = (resumo["ocorrencias_novas"] / total.where(total > 0) * 100).round(2).fillna(0)
+    return resumo.sort_values(["empresa", "ano", "grupo"])
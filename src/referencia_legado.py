@@ -0,0 +1,596 @@
+"""
+Implementação de referência (congelada) da contagem de termos, copiada da versão
+original de analisar_pdfs.py: criar_regex_termo, regras de contexto, busca de siglas e
+contar_termos_no_texto com um regex por termo.
+
+NÃO otimizar nem corrigir este arquivo: ele define as contagens publicadas. Motores
+novos são comparados contra ele em equivalencia.py. A única mudança em relação ao
+original é o parâmetro `verificacoes` de contar_termos_no_texto (o dicionário de termos
+agora vem de config/dicionario_termos.yaml, e suas regras são resolvidas por nome em
+REGRAS_CONTEXTO).
+"""
+
+import re
+import unicodedata
+from typing import Callable, Dict, List, Optional, Tuple
+
+# ============================================================================
+# FUNÇÕES AUXILIARES
+# ============================================================================
+
+def remover_acentos(texto: str) -> str:
+    """Remove acentos de uma string."""
+    nfkd = unicodedata.normalize('NFKD', texto)
+    return ''.join([c for c in nfkd if not unicodedata.combining(c)])
+
+def normalizar_texto(texto: str) -> str:
+    """
+    Normaliza texto: minúsculo, sem acento, espaços normalizados.
+    """
+    texto = texto.lower()
+    texto = remover_acentos(texto)
+    texto = re.sub(r'\s+', ' ', texto)  # Normaliza espaços
+    return texto.strip()
+
+def contar_palavras_aproximado(texto: str) -> int:
+    """Conta palavras aproximadas usando regex."""
+    palavras = re.findall(r'\b\w+\b', texto)
+    return len(palavras)
+
+def criar_regex_termo(termo: str, usar_word_boundary: bool = True) -> re.Pattern:
+    """
+    Cria regex para buscar um termo com word boundaries.
+    Aceita variações com espaço/hífen.
+    Para termos curtos (possíveis siglas), usa padrão mais rigoroso.
+    """
+    # Escapa caracteres especiais do regex
+    termo_escaped = re.escape(termo)
+    
+    # Permite espaço ou hífen entre palavras do termo composto
+    termo_escaped = termo_escaped.replace(r'\ ', r'[\s\-]+')
+    
+    # Termos muito curtos (2-3 letras, apenas letras) podem ser siglas
+    # Usar padrão mais rigoroso para evitar falsos positivos
+    termo_limpo = termo.replace(' ', '').replace('-', '')
+    is_sigla_curta = len(termo_limpo) <= 3 and termo_limpo.isalpha()
+    
+    if usar_word_boundary:
+        if is_sigla_curta:
+            # Para siglas curtas, usar delimitadores mais rigorosos
+            # Aceita: espaço, pontuação, início/fim de linha
+            delimitador_antes = r'(?:^|[\s([{.,;:!?\-])'
+            delimitador_depois = r'(?=[\s)\].,;:!?\-]|$)'
+            pattern = delimitador_antes + termo_escaped + delimitador_depois
+        else:
+            # Para termos longos, word boundary padrão é suficiente
+            pattern = r'\b' + termo_escaped + r'\b'
+    else:
+        pattern = termo_escaped
+    
+    return re.compile(pattern, re.IGNORECASE)
+
+def verificar_bi_bilhoes(pos_inicio_match: int, texto: str) -> bool:
+    """
+    Verifica se "BI" está em contexto de "Bilhões" (numérico/monetário).
+    Retorna True se deve rejeitar (é bilhões), False se deve aceitar (é Business Intelligence).
+    """
+    # Verificar contexto antes de "BI" (últimos 20 caracteres)
+    contexto_antes = texto[max(0, pos_inicio_match - 20):pos_inicio_match]
+    
+    # Padrões que indicam "Bilhões":
+    # - Números antes: "1,5 BI", "R$ 2 BI", "2.5 BI"
+    # - Símbolos monetários: "R$", "$", "€"
+    # - Palavras relacionadas: "milhões", "mil", "reais", "dólares"
+    
+    # Verificar se há números próximos antes (padrões: "1,5", "2.3", "R$ 1,5", "2.500")
+    # Buscar números com vírgula ou ponto, possivelmente precedidos por símbolo monetário
+    tem_numero_antes = bool(re.search(r'[\d]{1,3}(?:[.,]\d{3})*(?:[.,]\d+)?\s*$', contexto_antes))
+    
+    # Verificar se há símbolos monetários seguidos de números
+    tem_simbolo_monetario = bool(re.search(r'[R$€£]\s*[\d]{1,3}(?:[.,]\d{3})*(?:[.,]\d+)?\s*$', contexto_antes, re.IGNORECASE))
+    
+    # Verificar se há palavras relacionadas a valores
+    palavras_valores = ['milhões', 'mil', 'reais', 'dólares', 'euros', 'valor', 'total', 'receita', 
+                      'vendas', 'lucro', 'prejuízo', 'patrimônio', 'ativo', 'passivo']
+    tem_palavra_valor = any(palavra in contexto_antes.lower() for palavra in palavras_valores)
+    
+    # Verificar contexto depois (próximos 10 caracteres)
+    pos_fim_match = pos_inicio_match + 2  # "BI" tem 2 caracteres
+    contexto_depois = texto[pos_fim_match:min(len(texto), pos_fim_match + 10)]
+    
+    # Se há número antes OU símbolo monetário OU palavra de valor, provavelmente é "Bilhões"
+    if tem_numero_antes or tem_simbolo_monetario or tem_palavra_valor:
+        return True  # Rejeitar: é "Bilhões"
+    
+    # Verificar se está seguido de palavras que indicam valor
+    palavras_depois_valor = ['reais', 'dólares', 'euros', 'em', 'de', 'no', 'na']
+    if any(contexto_depois.lower().startswith(palavra) for palavra in palavras_depois_valor):
+        return True  # Rejeitar: provavelmente é "Bilhões"
+    
+    return False  # Aceitar: provavelmente é "Business Intelligence"
+
+def verificar_data_eh_data(pos_inicio: int, pos_fim: int, texto_norm: str) -> bool:
+    """
+    Verifica se "data" está em contexto de DATA (date) em relatórios OU se NÃO está em contexto de Big Data/Data Science.
+    Retorna True se deve REJEITAR:
+    - É date: "data do balanço", "data de divulgação"
+    - NÃO está em contexto de Big Data, Data Science, etc. (verifica 10 caracteres antes e depois)
+    """
+    tam = len(texto_norm)
+    # Verificar 10 caracteres antes e depois (conforme solicitado)
+    ctx_antes = texto_norm[max(0, pos_inicio - 10):pos_inicio]
+    ctx_depois = texto_norm[pos_fim:min(tam, pos_fim + 10)]
+    
+    # Primeiro: rejeitar se padrões típicos de "data" = date
+    antes_date = [
+        "em data", "a data", "ate data", "à data",
+        "dia data", "na data", "pela data", "por data", "ate a data",
+        "da data", "das data",
+    ]
+    depois_date = [
+        " do ", " da ", " de ", " do balanco", " base", " de divulgacao",
+        " de publicacao", " de referencia", " de corte", " de fechamento",
+        " limite", " valor", " vencimento",
+    ]
+    if any(p in ctx_antes for p in antes_date):
+        return True
+    if any(ctx_depois.startswith(p) for p in depois_date):
+        return True
+    # "data" seguido de " do/da/de balanço|divulgação|referência|..."
+    if re.match(r'\s+(do|da|de)\s+(balanco|divulgacao|referencia|corte|fechamento|valor|vencimento)\b', ctx_depois):
+        return True
+    
+    # Segundo: ACEITAR apenas se está em contexto de Big Data, Data Science, etc.
+    # Termos que indicam contexto de dados/ciência de dados
+    termos_contexto_dados = [
+        "big", "science", "scientist", "analytics", "analise", "análise",
+        "engineering", "engenharia", "warehouse", "lake", "pipeline",
+        "driven", "driven", "quality", "qualidade", "governance", "governanca",
+        "governança", "catalog", "catalogo", "catálogo", "lineage", "linhagem",
+        "visualization", "visualizacao", "visualização", "modeling", "modelagem",
+        "privacy", "privacidade", "integration", "integracao", "integração"
+    ]
+    
+    # Verificar se há algum termo de contexto nos 10 caracteres antes ou depois
+    contexto_completo = ctx_antes + " " + ctx_depois
+    contexto_lower = contexto_completo.lower()
+    
+    # Se NÃO encontrar nenhum termo de contexto, REJEITAR
+    if not any(termo in contexto_lower for termo in termos_contexto_dados):
+        return True  # Rejeitar: não está em contexto de dados/ciência de dados
+    
+    return False  # Aceitar: está em contexto de dados/ciência de dados
+
+def verificar_dados_em_contexto(pos_inicio: int, pos_fim: int, texto_norm: str) -> bool:
+    """
+    Verifica se "dados" está em contexto de Business Intelligence, Data Science, etc.
+    Retorna True se deve REJEITAR (não está em contexto relevante).
+    Verifica 10 caracteres antes e depois.
+    """
+    tam = len(texto_norm)
+    # Verificar 10 caracteres antes e depois (conforme solicitado)
+    ctx_antes = texto_norm[max(0, pos_inicio - 10):pos_inicio]
+    ctx_depois = texto_norm[pos_fim:min(tam, pos_fim + 10)]
+    
+    # Termos que indicam contexto de dados/BI
+    termos_contexto_dados = [
+        "big", "science", "scientist", "analytics", "analise", "análise",
+        "engineering", "engenharia", "warehouse", "lake", "pipeline",
+        "driven", "quality", "qualidade", "governance", "governanca",
+        "governança", "catalog", "catalogo", "catálogo", "lineage", "linhagem",
+        "visualization", "visualizacao", "visualização", "modeling", "modelagem",
+        "privacy", "privacidade", "integration", "integracao", "integração",
+        "business intelligence", "inteligencia", "inteligência", "bi ",
+        "cientista", "cientistas"
+    ]
+    
+    # Verificar se há algum termo de contexto nos 10 caracteres antes ou depois
+    contexto_completo = ctx_antes + " " + ctx_depois
+    contexto_lower = contexto_completo.lower()
+    
+    # Se NÃO encontrar nenhum termo de contexto, REJEITAR
+    if not any(termo in contexto_lower for termo in termos_contexto_dados):
+        return True  # Rejeitar: não está em contexto de dados/BI
+    
+    return False  # Aceitar: está em contexto de dados/BI
+
+# Termos que passam por verificação de contexto (evitar falsos positivos em relatórios)
+# Função recebe (pos_inicio, pos_fim, texto_normalizado) e retorna True para REJEITAR o match.
+# Ex.: "data" = date (data do balanço) vs data analytics.
+# "dados" e "data" isolados só são aceitos se estiverem em contexto de Big Data, Data Science, etc.
+VERIFICACOES_CONTEXTO = {
+    "data": verificar_data_eh_data,
+    "dados": verificar_dados_em_contexto,
+}
+
+# Mesmas regras, pelo nome usado na seção "verificacoes" do dicionário
+REGRAS_CONTEXTO = {
+    "verificar_data_eh_data": verificar_data_eh_data,
+    "verificar_dados_em_contexto": verificar_dados_em_contexto,
+}
+
+def buscar_sigla_no_texto_original(texto_original: str, sigla: str) -> Tuple[int, List[str]]:
+    """
+    Busca sigla curta no texto original com padrões rigorosos.
+    Aceita:
+    - Siglas totalmente maiúsculas: "IA", "LLM", "BI"
+    - Siglas com primeira minúscula (início de frase): "Ia generativa", "Bi é importante"
+    
+    Rejeita:
+    - Siglas minúsculas dentro de palavras: "eu ia", "via"
+    - Siglas entre hífens dentro de palavras: "DIA-IA-DIA", "DIA-IA", "IA-DIA"
+    - "IA" quando faz parte de "IAS" (International Accounting Standards)
+    - Siglas dentro de palavras maiores: "patrimoniais" (contém "IA" mas não deve contar)
+    
+    Exemplos:
+    - " IA " -> conta (espaço antes e depois, maiúsculo)
+    - "Ia generativa" -> conta (primeira minúscula, resto maiúsculo, seguido de espaço)
+    - "eu ia" -> NÃO conta (minúsculo)
+    - "via" -> NÃO conta (dentro de palavra)
+    - "patrimoniais" -> NÃO conta (IA está dentro de palavra maior)
+    - ".IA " -> conta (pontuação antes, espaço depois)
+    - "(IA)" -> conta (parênteses)
+    - "IAS 8" -> NÃO conta (IA faz parte de IAS - contabilidade)
+    - "DIA-IA-DIA" -> NÃO conta (entre hífens dentro de palavra)
+    - "-IA-" -> NÃO conta (entre hífens, pode ser parte de palavra composta)
+    """
+    sigla_escaped = re.escape(sigla)
+    
+    # Lista de padrões a rejeitar (siglas que contêm a sigla procurada)
+    # Exemplo: "IAS" contém "IA", então rejeitar "IA" quando está em "IAS"
+    padroes_rejeitar = {
+        "IA": ["IAS"],  # Rejeitar IA quando faz parte de IAS (International Accounting Standards)
+        "AI": ["AIS", "AID", "AIM"],  # Possíveis falsos positivos
+    }
+    
+    # "IA" como sufixo: tesourar-ia, econom-ia, etc. (quebra de linha pode gerar "tesourar IA ")
+    # Rejeitar quando a palavra antes é "tesourar" ou outros radicais que + "ia" formam palavra.
+    sufixos_ia_rejeitar = ("tesourar", "econom", "burgues", "demonstr", "secretar")
+    
+    # Contexto boilerplate: se "IA" ou "AI" aparecer perto desses termos, é metadata/logo/formato, não IA.
+    # Ex.: "Twitter X Logo PNG Vector (**AI**, EPS, PDF, SVG) Free Download" -> rejeitar
+    termos_boilerplate_ia_ai = (
+        "logo", "png", "vector", "eps", "svg", "download", "free", "twitter",
+        "facebook", "instagram", "linkedin", "icon", "image", "clip", "art"
+    )
+    
+    # Padrão unificado: aceita sigla totalmente maiúscula OU primeira minúscula + resto maiúsculo
+    # Delimitadores antes: espaço, início de linha, pontuação, parênteses
+    # Delimitadores depois: espaço, fim de linha, pontuação, parênteses
+    # NOTA: hífen será tratado separadamente para evitar falsos positivos
+    delimitador_antes = r'(?:^|[\s([{.,;:!?])'
+    delimitador_depois = r'(?=[\s)\].,;:!?]|$)'
+    
+    # Padrão 1: Sigla totalmente maiúscula
+    pattern1 = delimitador_antes + sigla_escaped + delimitador_depois
+    
+    # Padrão 2: Sigla com primeira minúscula (ex: "Ia", "Bi", "Llm")
+    if len(sigla) > 1:
+        sigla_primeira_minuscula = sigla[0].lower() + sigla[1:].upper()
+        sigla_primeira_minuscula_escaped = re.escape(sigla_primeira_minuscula)
+        pattern2 = delimitador_antes + sigla_primeira_minuscula_escaped + delimitador_depois
+    else:
+        pattern2 = None
+    
+    # Padrão 3: Sigla entre hífens (precisa verificação especial)
+    # Aceita apenas se NÃO estiver dentro de palavra composta
+    pattern3_hifen = r'[A-Za-z]*-' + sigla_escaped + r'-[A-Za-z]*'  # Entre hífens com letras antes e depois
+    
+    # Buscar todos os padrões
+    count = 0
+    exemplos = []  # Lista de até 3 exemplos de contexto
+    
+    # Buscar padrão 1 (totalmente maiúscula, sem hífen problemático)
+    for match in re.finditer(pattern1, texto_original, re.MULTILINE):
+        match_text = match.group(0)
+        sigla_match = re.search(sigla_escaped, match_text)
+        if sigla_match and sigla_match.group(0).isupper():
+            pos_inicio_match = match.start()
+            pos_fim_match = match.end()
+            
+            # Verificação especial para "BI" (Business Intelligence vs Bilhões)
+            if sigla == "BI":
+                if verificar_bi_bilhoes(pos_inicio_match, texto_original):
+                    continue  # Rejeitar: é "Bilhões", não "Business Intelligence"
+            
+            # Calcular posição exata da sigla no texto original
+            if sigla_match:
+                pos_sigla_inicio = match.start() + sigla_match.start()
+                pos_sigla_fim = match.start() + sigla_match.end()
+            else:
+                pos_sigla_inicio = pos_inicio_match
+                pos_sigla_fim = pos_fim_match
+            
+            # Verificação CRÍTICA: rejeitar se a sigla está dentro de uma palavra maior
+            # Exemplo: "patrimoniais" contém "IA" no meio, mas não deve ser contado
+            char_antes = texto_original[pos_sigla_inicio - 1] if pos_sigla_inicio > 0 else ''
+            char_depois = texto_original[pos_sigla_fim] if pos_sigla_fim < len(texto_original) else ''
+            
+            # Se há letras antes E depois, a sigla está dentro de uma palavra maior - REJEITAR
+            if char_antes.isalpha() and char_depois.isalpha():
+                continue  # Rejeitar: está dentro de palavra maior (ex: "patrimoniais", "economia", etc.)
+            
+            # Verificação adicional para "IA" e "AI": rejeitar quando há letras próximas antes e depois
+            # (ex.: "PATRIMONIAIS", "COMERCIAIS" com "AI" no meio por quebra de linha)
+            if sigla in ("IA", "AI"):
+                # Verificar contexto antes (até 10 caracteres) e depois (até 10 caracteres)
+                ctx_antes = texto_original[max(0, pos_sigla_inicio - 10):pos_sigla_inicio]
+                ctx_depois = texto_original[pos_sigla_fim:min(len(texto_original), pos_sigla_fim + 10)]
+                
+                # Extrair apenas letras (ignorar espaços, pontuação, números)
+                letras_antes = ''.join(c for c in ctx_antes if c.isalpha())
+                letras_depois = ''.join(c for c in ctx_depois if c.isalpha())
+                
+                # Se há pelo menos 3 letras antes E 2 letras depois, provavelmente é parte de palavra maior
+                # Ex.: "PATRIMON" + "IA" + "IS" -> "PATRIMONIAIS"; "COMERC" + "AI" + "S" -> "COMERCIAIS"
+                if len(letras_antes) >= 3 and len(letras_depois) >= 2:
+                    texto_entre = texto_original[max(0, pos_sigla_inicio - 5):min(len(texto_original), pos_sigla_fim + 5)]
+                    delimitadores_entre = re.sub(r'[A-Za-z]', '', texto_entre)
+                    if len(delimitadores_entre.strip()) <= 3:
+                        continue  # Rejeitar: parte de palavra maior (patrimoniais, comerciais, etc.)
+            
+            # "IA" como sufixo (ex.: "tesouraria" → "tesourar IA " por quebra de linha)
+            if sigla == "IA":
+                ctx_antes = texto_original[max(0, pos_sigla_inicio - 15):pos_sigla_inicio]
+                ctx_limpo = ctx_antes.rstrip().lower()
+                if any(ctx_limpo.endswith(r) for r in sufixos_ia_rejeitar):
+                    continue  # Rejeitar: é sufixo ("tesourar**ia**", "econom**ia**", etc.)
+            
+            # Rejeitar "IA"/"AI" em contexto boilerplate (logo, PNG, Vector, EPS, PDF, SVG, Download, etc.)
+            if sigla in ("IA", "AI"):
+                ctx_amplo = texto_original[max(0, pos_sigla_inicio - 25):pos_sigla_fim + 25].lower()
+                if any(termo in ctx_amplo for termo in termos_boilerplate_ia_ai):
+                    continue  # Rejeitar: contexto de logo/formato/metadata, não IA de verdade
+            
+            # Verificar se não faz parte de um padrão a rejeitar (ex: "IA" em "IAS")
+            if sigla in padroes_rejeitar:
+                deve_rejeitar = False
+                for padrao_rejeitar in padroes_rejeitar[sigla]:
+                    # Usar posição exata do fim da sigla (não do match completo com delimitadores)
+                    if sigla_match:
+                        pos_sigla_fim = match.start() + sigla_match.end()
+                    else:
+                        pos_sigla_fim = pos_fim_match
+                    
+                    # Verificar se após a sigla vem o restante do padrão (ex: "S" após "IA" = "IAS")
+                    if pos_sigla_fim < len(texto_original):
+                        resto_padrao = padrao_rejeitar[len(sigla):]  # Ex: "S" para "IAS"
+                        if len(resto_padrao) > 0:
+                            # Verificar se o texto após a sigla forma o padrão completo
+                            texto_apos = texto_original[pos_sigla_fim:pos_sigla_fim + len(resto_padrao)]
+                            if texto_apos.upper() == resto_padrao.upper():
+                                # Verificar se o padrão completo está isolado (não é parte de palavra maior)
+                                pos_apos_padrao = pos_sigla_fim + len(resto_padrao)
+                                if pos_apos_padrao < len(texto_original):
+                                    char_apos_padrao = texto_original[pos_apos_padrao]
+                                    # Se não é letra, o padrão está isolado - REJEITAR
+                                    if not char_apos_padrao.isalpha():
+                                        deve_rejeitar = True
+                                        break
+                
+                if deve_rejeitar:
+                    continue  # Rejeitar: faz parte de padrão maior (ex: "IAS")
+            
+            count += 1
+            # Capturar exemplo de contexto (até 3)
+            if len(exemplos) < 3:
+                ctx_antes = texto_original[max(0, pos_sigla_inicio - 30):pos_sigla_inicio]
+                ctx_depois = texto_original[pos_sigla_fim:min(len(texto_original), pos_sigla_fim + 30)]
+                sigla_encontrada = texto_original[pos_sigla_inicio:pos_sigla_fim]
+                exemplo = f"...{ctx_antes}**{sigla_encontrada}**{ctx_depois}..."
+                exemplos.append(exemplo)
+    
+    # Buscar padrão 2 (primeira minúscula)
+    if pattern2:
+        for match in re.finditer(pattern2, texto_original, re.MULTILINE):
+            match_text = match.group(0)
+            sigla_match = re.search(sigla_primeira_minuscula_escaped, match_text)
+            if sigla_match:
+                sigla_encontrada = sigla_match.group(0)
+                if len(sigla_encontrada) > 1 and sigla_encontrada[0].islower() and sigla_encontrada[1:].isupper():
+                    pos_inicio_match = match.start()
+                    pos_fim_match = match.end()
+                    
+                    # Verificação especial para "BI" (Business Intelligence vs Bilhões)
+                    if sigla == "BI":
+                        if verificar_bi_bilhoes(pos_inicio_match, texto_original):
+                            continue  # Rejeitar: é "Bilhões", não "Business Intelligence"
+                    
+                    # Calcular posição exata da sigla no texto original
+                    if sigla_match:
+                        pos_sigla_inicio = match.start() + sigla_match.start()
+                        pos_sigla_fim = match.start() + sigla_match.end()
+                    else:
+                        pos_sigla_inicio = pos_inicio_match
+                        pos_sigla_fim = pos_fim_match
+                    
+                    # Verificação CRÍTICA: rejeitar se a sigla está dentro de uma palavra maior
+                    # Exemplo: "patrimoniais" contém "IA" no meio, mas não deve ser contado
+                    char_antes = texto_original[pos_sigla_inicio - 1] if pos_sigla_inicio > 0 else ''
+                    char_depois = texto_original[pos_sigla_fim] if pos_sigla_fim < len(texto_original) else ''
+                    
+                    # Se há letras antes E depois, a sigla está dentro de uma palavra maior - REJEITAR
+                    if char_antes.isalpha() and char_depois.isalpha():
+                        continue  # Rejeitar: está dentro de palavra maior (ex: "patrimoniais", "economia", etc.)
+                    
+                    # Verificação adicional para "IA" e "AI": rejeitar quando há letras próximas antes e depois
+                    if sigla in ("IA", "AI"):
+                        ctx_antes = texto_original[max(0, pos_sigla_inicio - 10):pos_sigla_inicio]
+                        ctx_depois = texto_original[pos_sigla_fim:min(len(texto_original), pos_sigla_fim + 10)]
+                        letras_antes = ''.join(c for c in ctx_antes if c.isalpha())
+                        letras_depois = ''.join(c for c in ctx_depois if c.isalpha())
+                        if len(letras_antes) >= 3 and len(letras_depois) >= 2:
+                            texto_entre = texto_original[max(0, pos_sigla_inicio - 5):min(len(texto_original), pos_sigla_fim + 5)]
+                            delimitadores_entre = re.sub(r'[A-Za-z]', '', texto_entre)
+                            if len(delimitadores_entre.strip()) <= 3:
+                                continue
+                    
+                    # "IA" como sufixo
+                    if sigla == "IA":
+                        ctx_antes = texto_original[max(0, pos_sigla_inicio - 15):pos_sigla_inicio]
+                        ctx_limpo = ctx_antes.rstrip().lower()
+                        if any(ctx_limpo.endswith(r) for r in sufixos_ia_rejeitar):
+                            continue  # Rejeitar: é sufixo
+                    
+                    # Rejeitar "IA"/"AI" em contexto boilerplate
+                    if sigla in ("IA", "AI"):
+                        ctx_amplo = texto_original[max(0, pos_sigla_inicio - 25):pos_sigla_fim + 25].lower()
+                        if any(termo in ctx_amplo for termo in termos_boilerplate_ia_ai):
+                            continue
+                    
+                    # Verificar se não faz parte de um padrão a rejeitar (similar ao padrão 1)
+                    if sigla in padroes_rejeitar:
+                        deve_rejeitar = False
+                        for padrao_rejeitar in padroes_rejeitar[sigla]:
+                            # Usar posição exata do fim da sigla
+                            if sigla_match:
+                                pos_sigla_fim = match.start() + sigla_match.end()
+                            else:
+                                pos_sigla_fim = pos_fim_match
+                            
+                            resto_padrao = padrao_rejeitar[len(sigla):]
+                            if len(resto_padrao) > 0 and pos_sigla_fim < len(texto_original):
+                                texto_apos = texto_original[pos_sigla_fim:pos_sigla_fim + len(resto_padrao)]
+                                if texto_apos.upper() == resto_padrao.upper():
+                                    pos_apos_padrao = pos_sigla_fim + len(resto_padrao)
+                                    if pos_apos_padrao < len(texto_original):
+                                        char_apos_padrao = texto_original[pos_apos_padrao]
+                                        if not char_apos_padrao.isalpha():
+                                            deve_rejeitar = True
+                                            break
+                    
+                    if deve_rejeitar:
+                        continue  # Rejeitar: faz parte de padrão maior
+                    
+                    count += 1
+                    # Capturar exemplo de contexto (até 3)
+                    if len(exemplos) < 3:
+                        ctx_antes = texto_original[max(0, pos_sigla_inicio - 30):pos_sigla_inicio]
+                        ctx_depois = texto_original[pos_sigla_fim:min(len(texto_original), pos_sigla_fim + 30)]
+                        sigla_encontrada = texto_original[pos_sigla_inicio:pos_sigla_fim]
+                        exemplo = f"...{ctx_antes}**{sigla_encontrada}**{ctx_depois}..."
+                        exemplos.append(exemplo)
+    
+    # Buscar padrão 3 (entre hífens) - mas rejeitar se está dentro de palavra composta
+    # Exemplo: "DIA-IA-DIA" -> NÃO conta (IA está dentro de palavra composta)
+    # Exemplo: "-IA-" no início/fim -> pode contar se não estiver em palavra composta
+    matches_hifen = list(re.finditer(r'-' + sigla_escaped + r'-', texto_original, re.IGNORECASE))
+    for match_hifen in matches_hifen:
+        pos_inicio = match_hifen.start()  # Posição do primeiro hífen
+        pos_fim = match_hifen.end()  # Posição após o segundo hífen
+        
+        # Verificar contexto: há letras antes do primeiro hífen E depois do segundo hífen?
+        char_antes_hifen1 = texto_original[pos_inicio - 1] if pos_inicio > 0 else ''
+        char_depois_hifen2 = texto_original[pos_fim] if pos_fim < len(texto_original) else ''
+        
+        # Se há letras antes E depois, é palavra composta - REJEITAR
+        # Exemplo: "DIA-IA-DIA" -> char_antes_hifen1='A', char_depois_hifen2='D'
+        if char_antes_hifen1.isalpha() and char_depois_hifen2.isalpha():
+            continue  # Rejeitar: está dentro de palavra composta como "DIA-IA-DIA"
+        
+        # Se não há letras antes OU depois, pode ser sigla isolada
+        # Verificar se a sigla está em maiúsculo (ou primeira minúscula + resto maiúsculo)
+        sigla_no_match = texto_original[pos_inicio + 1:pos_fim - 1]  # Extrair sigla entre hífens
+        
+        # Verificação especial para "BI" (Business Intelligence vs Bilhões)
+        if sigla == "BI":
+            if verificar_bi_bilhoes(pos_inicio + 1, texto_original):  # +1 para posição da sigla (após o hífen)
+                continue  # Rejeitar: é "Bilhões", não "Business Intelligence"
+        
+        # Rejeitar "IA"/"AI" em contexto boilerplate (logo, PNG, Vector, etc.)
+        if sigla in ("IA", "AI"):
+            pos_sigla = pos_inicio + 1
+            ctx_amplo = texto_original[max(0, pos_sigla - 25):pos_fim - 1 + 25].lower()
+            if any(termo in ctx_amplo for termo in termos_boilerplate_ia_ai):
+                continue
+        
+        # Aceitar se totalmente maiúscula OU primeira minúscula + resto maiúsculo
+        if sigla_no_match.isupper():
+            count += 1
+            # Capturar exemplo (até 3)
+            if len(exemplos) < 3:
+                ctx_antes = texto_original[max(0, pos_inicio - 20):pos_inicio + 1]
+                ctx_depois = texto_original[pos_fim - 1:min(len(texto_original), pos_fim + 20)]
+                exemplo = f"...{ctx_antes}**{sigla_no_match}**{ctx_depois}..."
+                exemplos.append(exemplo)
+        elif len(sigla_no_match) > 1 and sigla_no_match[0].islower() and sigla_no_match[1:].isupper():
+            count += 1
+            # Capturar exemplo (até 3)
+            if len(exemplos) < 3:
+                ctx_antes = texto_original[max(0, pos_inicio - 20):pos_inicio + 1]
+                ctx_depois = texto_original[pos_fim - 1:min(len(texto_original), pos_fim + 20)]
+                exemplo = f"...{ctx_antes}**{sigla_no_match}**{ctx_depois}..."
+                exemplos.append(exemplo)
+    
+    return count, exemplos
+
+def contar_termos_no_texto(
+    texto_original: str,
+    texto_normalizado: str,
+    termos: List[str],
+    siglas_sensiveis: List[str],
+    verificacoes: Optional[Dict[str, Callable[[int, int, str], bool]]] = None
+) -> Tuple[Dict[str, int], List[str], Dict[str, List[str]]]:
+    """
+    Conta ocorrências de termos no texto e captura exemplos de contexto.
+    Retorna: (dicionário termo -> contagem, lista de termos encontrados, exemplos_contexto)
+    Termos em VERIFICACOES_CONTEXTO (ou em `verificacoes`, se informado) usam finditer e checagem de contexto.
+    """
+    if verificacoes is None:
+        verificacoes = VERIFICACOES_CONTEXTO
+    ocorrencias = {}
+    termos_encontrados = []
+    exemplos_contexto = {}  # termo -> lista de até 3 exemplos
+    
+    # Conta termos normais (no texto normalizado)
+    for termo in termos:
+        regex = criar_regex_termo(termo, usar_word_boundary=True)
+        verificar = verificacoes.get(termo)
+        exemplos = []
+        
+        if verificar is None:
+            matches = regex.findall(texto_normalizado)
+            count = len(matches)
+            # Capturar exemplos do texto original (para mostrar contexto real)
+            # Buscar diretamente no texto original com regex case-insensitive
+            regex_original = criar_regex_termo(termo, usar_word_boundary=True)
+            for i, m_orig in enumerate(regex_original.finditer(texto_original)):
+                if i >= 3:
+                    break
+                ctx_antes = texto_original[max(0, m_orig.start() - 30):m_orig.start()]
+                ctx_depois = texto_original[m_orig.end():min(len(texto_original), m_orig.end() + 30)]
+                termo_real = m_orig.group()
+                exemplo = f"...{ctx_antes}**{termo_real}**{ctx_depois}..."
+                exemplos.append(exemplo)
+        else:
+            count = 0
+            for m in regex.finditer(texto_normalizado):
+                if not verificar(m.start(), m.end(), texto_normalizado):
+                    count += 1
+                    # Capturar exemplos do texto original (primeiros 3)
+                    if len(exemplos) < 3:
+                        # Buscar no texto original usando regex
+                        regex_original = criar_regex_termo(termo, usar_word_boundary=True)
+                        encontrados_orig = list(regex_original.finditer(texto_original))
+                        if len(encontrados_orig) > len(exemplos):
+                            m_orig = encontrados_orig[len(exemplos)]
+                            ctx_antes = texto_original[max(0, m_orig.start() - 30):m_orig.start()]
+                            ctx_depois = texto_original[m_orig.end():min(len(texto_original), m_orig.end() + 30)]
+                            termo_real = m_orig.group()
+                            exemplo = f"...{ctx_antes}**{termo_real}**{ctx_depois}..."
+                            exemplos.append(exemplo)
+        
+        if count > 0:
+            ocorrencias[termo] = count
+            termos_encontrados.append(termo)
+            exemplos_contexto[termo] = exemplos
+    
+    # Conta siglas sensíveis (no texto original, apenas maiúsculas)
+    for sigla in siglas_sensiveis:
+        count, exemplos_sigla = buscar_sigla_no_texto_original(texto_original, sigla)
+        if count > 0:
+            ocorrencias[sigla] = count
+            termos_encontrados.append(sigla)
+            exemplos_contexto[sigla] = exemplos_sigla
+    
+    return ocorrencias, termos_encontrados, exemplos_contexto
@@ -0,0 +1,134 @@
+"""
+Armazenamento compacto dos resultados (uma linha por PDF x grupo), em colunas.
+
+Em vez de um dicionário por linha, cada coluna é guardada uma vez:
+- chaves repetidas (empresa, ano, grupo, PDF) viram códigos inteiros + lista de valores
+  únicos (categóricas no pandas);
+- contagens ficam em arrays de inteiros de 64 bits, expostos ao pandas sem cópia;
+- textos (JSON por termo, exemplos) ficam numa lista, sem duplicar as strings.
+Colunas ausentes em algumas linhas (ex.: diário de uma versão anterior) ficam vazias.
+"""
+
+from array import array
+from typing import Dict, Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+
+COLUNAS_CATEGORICAS = ("ano", "empresa", "pdf_nome", "pdf_caminho", "grupo", "idioma")
+COLUNAS_INTEIRAS = (
+    "total_paginas", "total_palavras_pdf", "paginas_sem_texto", "paginas_ocr", "ocorrencias_total_grupo",
+)
+
+
+class TabelaResultados:
+    """
+    Resultados em colunas. Uso:
+        tabela.adicionar(linhas_do_pdf, ordem=indice)  # em qualquer ordem de conclusão
+        tabela.ordenar()                               # ordem do rglob
+        df = tabela.para_dataframe()                   # categóricas + inteiros sem cópia
+    Iterar na tabela devolve dicionários (compatível com o formato antigo de lista).
+    """
+
+    def __init__(self):
+        self._colunas: List[str] = []  # Na ordem em que aparecem nas linhas
+        self._valores: Dict[str, Dict[str, int]] = {}  # Coluna categórica -> valor -> código
+        self._codigos: Dict[str, array] = {}
+        self._inteiros: Dict[str, array] = {}
+        self._textos: Dict[str, list] = {}
+        self._ordem = array("q")
+        self._n = 0
+
+    def __len__(self) -> int:
+        return self._n
+
+    def _nova_coluna(self, coluna: str):
+        self._colunas.append(coluna)
+        if coluna in COLUNAS_CATEGORICAS:
+            self._valores[coluna] = {}
+            self._codigos[coluna] = array("i", [-1]) * self._n
+        elif coluna in COLUNAS_INTEIRAS and self._n == 0:
+            self._inteiros[coluna] = array("q")
+        else:
+            self._textos[coluna] = [None] * self._n
+
+    def _rebaixar_para_texto(self, coluna: str):
+        """Coluna inteira com valor ausente/não inteiro passa a ser guardada como objeto."""
+        self._textos[coluna] = self._inteiros.pop(coluna).tolist()
+
+    def adicionar(self, linhas: List[Dict], ordem: int = 0):
+        """Acrescenta as linhas de um PDF; `ordem` define a posição após ordenar()."""
+        for linha in linhas:
+            for coluna in linha:
+                if coluna not in self._valores and coluna not in self._inteiros and coluna not in self._textos:
+                    self._nova_coluna(coluna)
+            for coluna in self._colunas:
+                valor = linha.get(coluna)
+                if coluna in self._codigos:
+                    if valor is None:
+                        self._codigos[coluna].append(-1)
+                    else:
+                        valores = self._valores[coluna]
+                        self._codigos[coluna].append(valores.setdefault(valor, len(valores)))
+                    continue
+                if coluna in self._inteiros:
+                    if isinstance(valor, int) and not isinstance(valor, bool):
+                        self._inteiros[coluna].append(valor)
+                        continue
+                    self._rebaixar_para_texto(coluna)
+                self._textos[coluna].append(valor)
+            self._ordem.append(ordem)
+            self._n += 1
+
+    def ordenar(self):
+        """Reordena as linhas pela `ordem` (estável: linhas do mesmo PDF mantêm a ordem)."""
+        permutacao = np.argsort(np.frombuffer(self._ordem, dtype=np.int64), kind="stable")
+        if np.array_equal(permutacao, np.arange(self._n)):
+            return
+        for colunas, tipo in ((self._codigos, "i"), (self._inteiros, "q")):
+            for coluna, valores in colunas.items():
+                colunas[coluna] = array(tipo, np.frombuffer(valores, dtype=valores.typecode).take(permutacao).tobytes())
+        for coluna, valores in self._textos.items():
+            self._textos[coluna] = [valores[i] for i in permutacao]
+        self._ordem = array("q", np.frombuffer(self._ordem, dtype=np.int64).take(permutacao).tobytes())
+
+    def _categorica(self, coluna: str) -> pd.Categorical:
+        # Categorias em ordem alfabética, para sort_values/groupby seguirem a ordem dos textos
+        valores = self._valores[coluna]
+        categorias = sorted(valores)
+        novo_codigo = np.empty(len(valores) + 1, dtype=np.int32)
+        novo_codigo[-1] = -1  # Código -1 (ausente) continua -1
+        for posicao, valor in enumerate(categorias):
+            novo_codigo[valores[valor]] = posicao
+        codigos = novo_codigo[np.frombuffer(self._codigos[coluna], dtype=np.int32)]
+        return pd.Categorical.from_codes(codigos, categories=categorias)
+
+    def para_dataframe(self) -> pd.DataFrame:
+        """
+        DataFrame com as chaves como categóricas e as contagens como int64 (sem cópia).
+        Não acrescente linhas enquanto o DataFrame estiver em uso (os arrays são compartilhados).
+        """
+        dados = {}
+        for coluna in self._colunas:
+            if coluna in self._codigos:
+                dados[coluna] = self._categorica(coluna)
+            elif coluna in self._inteiros:
+                dados[coluna] = np.frombuffer(self._inteiros[coluna], dtype=np.int64)
+            else:
+                dados[coluna] = pd.Series(self._textos[coluna], dtype=object)
+        return pd.DataFrame(dados, copy=False)
+
+    def __iter__(self) -> Iterator[Dict]:
+        valores_por_codigo = {c: list(v) for c, v in self._valores.items()}
+        for i in range(self._n):
+            linha = {}
+            for coluna in self._colunas:
+                if coluna in self._codigos:
+                    codigo = self._codigos[coluna][i]
+                    valor: Optional[object] = valores_por_codigo[coluna][codigo] if codigo >= 0 else None
+                elif coluna in self._inteiros:
+                    valor = self._inteiros[coluna][i]
+                else:
+                    valor = self._textos[coluna][i]
+                linha[coluna] = valor
+            yield linha
@@ -0,0 +1,287 @@
+"""
+Serviço HTTP local de análise sob demanda: um relatório por requisição, sem pagar a cada
+chamada a importação, a compilação do dicionário e a subida dos processos.
+
+O dicionário e o matcher são carregados uma vez; um pool de processos fica aquecido
+(cada worker já com o matcher carregado) e as requisições são atendidas em paralelo
+(uma thread por conexão, o trabalho pesado no pool). Cada requisição tem timeout próprio;
+quando ele estoura, o pool é recriado, porque o trabalho (e a thread de extração) continuaria
+rodando no worker.
+
+Uso:
+    python src/servico.py --porta 8765 --workers 4
+
+API (JSON, só em 127.0.0.1):
+    GET  /saude                      -> {"status": "ok", "workers": 4, "hash_dicionario": "..."}
+    POST /analisar  {"caminho": "C:\\...\\relatorio.pdf", "empresa": "...", "ano": "2024", "timeout": 120}
+    POST /analisar?nome=rel.pdf&empresa=...&ano=2024&timeout=120   (corpo = bytes do PDF, Content-Type: application/pdf)
+Resposta: {"pdf": nome, "segundos": s, "resultados": [...]} com as mesmas linhas (grupo, contagens,
+exemplos) de processar_pdf. Erros: 400 requisição inválida, 404 arquivo inexistente, 413 PDF
+grande demais, 422 PDF ilegível, 504 timeout.
+Sem empresa/ano, eles são deduzidos do caminho quando o PDF está dentro de PASTA_RAIZ.
+"""
+
+import os
+import sys
+import json
+import math
+import argparse
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FuturesTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+import analisar_pdfs as analise
+from inventario import identificar_empresa_ano
+from ocr import MAX_OCR_SIMULTANEOS, configurar_semaforo_ocr
+
+# ============================================================================
+# CONFIGURAÇÕES
+# ============================================================================
+
+ENDERECO_SERVICO = "127.0.0.1"  # Só localhost
+PORTA_SERVICO = 8765
+NUM_WORKERS_SERVICO = max(1, (os.cpu_count() or 2) - 1)
+TIMEOUT_REQUISICAO_SEGUNDOS = 300  # Padrão por requisição (o cliente pode pedir menos com "timeout")
+TAMANHO_MAXIMO_UPLOAD_MB = 200
+FOLGA_TIMEOUT_SEGUNDOS = 5  # Além do timeout da extração, para a análise e o retorno do worker
+
+# ============================================================================
+# POOL AQUECIDO
+# ============================================================================
+
+def _aquecer_worker(semaforo_ocr):
+    """Initializer dos workers: semáforo do OCR e matcher carregado antes da primeira requisição."""
+    configurar_semaforo_ocr(semaforo_ocr)
+    analise.obter_taxonomia()
+
+def _pronto() -> bool:
+    return True
+
+class PoolAnalise:
+    """
+    Pool de processos aquecido; recriado se um worker morrer (BrokenProcessPool) ou se uma
+    requisição estourar o timeout (o worker seguiria ocupado com ela).
+    """
+
+    def __init__(self, num_workers: int):
+        self.num_workers = num_workers
+        self._lock = threading.Lock()
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._criar()
+
+    def _criar(self):
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.num_workers,
+            initializer=_aquecer_worker,
+            initargs=(multiprocessing.BoundedSemaphore(MAX_OCR_SIMULTANEOS),),
+        )
+        # Força a subida de todos os workers agora (o pool cria processos sob demanda)
+        for futuro in [self._executor.submit(_pronto) for _ in range(self.num_workers)]:
+            futuro.result()
+
+    def analisar(
+        self,
+        caminho: str,
+        empresa: str,
+        ano: str,
+        dados: Optional[bytes],
+        timeout: float
+    ) -> Tuple[Optional[list], float, Dict]:
+        """
+        Roda _processar_tarefa num worker; TimeoutError se passar de `timeout` (+ folga).
+        Em timeout (da requisição ou da extração) o pool é recriado; as outras requisições
+        em andamento recebem BrokenProcessPool.
+        """
+        with self._lock:
+            executor = self._executor
+        try:
+            futuro = executor.submit(analise._processar_tarefa, caminho, empresa, ano, dados, timeout)
+            resultado, segundos, etapas = futuro.result(timeout=timeout + FOLGA_TIMEOUT_SEGUNDOS)
+        except BrokenProcessPool:
+            self._reciclar(executor, "um worker do serviço morreu")
+            raise
+        except FuturesTimeoutError:
+            self._reciclar(executor, f"timeout em {os.path.basename(caminho)}")
+            raise
+        if etapas.get("timeout"):
+            # A thread de extração que estourou o tempo continua rodando dentro do worker
+            self._reciclar(executor, f"timeout na extração de {os.path.basename(caminho)}")
+        return resultado, segundos, etapas
+
+    def _reciclar(self, executor: ProcessPoolExecutor, motivo: str):
+        """Encerra os processos de `executor` e sobe um pool novo (se ainda for o atual)."""
+        with self._lock:
+            if self._executor is not executor:
+                return  # Outra requisição já recriou
+            print(f"AVISO: {motivo}; recriando o pool.")
+            for processo in list((getattr(executor, "_processes", None) or {}).values()):
+                processo.terminate()
+            executor.shutdown(wait=False, cancel_futures=True)
+            self._criar()
+
+    def encerrar(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+# ============================================================================
+# HTTP
+# ============================================================================
+
+class _ErroRequisicao(Exception):
+    def __init__(self, status: int, mensagem: str):
+        super().__init__(mensagem)
+        self.status = status
+
+def _empresa_ano(caminho: str, empresa: Optional[str], ano: Optional[str]) -> Tuple[str, str]:
+    """Empresa/ano informados ou, se faltarem, deduzidos da estrutura de PASTA_RAIZ."""
+    if not (empresa and ano):
+        try:
+            identificacao = identificar_empresa_ano(Path(caminho), Path(analise.PASTA_RAIZ))
+        except ValueError:
+            identificacao = None  # Fora de PASTA_RAIZ
+        if identificacao is not None:
+            empresa = empresa or identificacao[0]
+            ano = ano or identificacao[1]
+    return empresa or "", str(ano or "")
+
+def _ler_timeout(valor) -> float:
+    """Timeout pedido pelo cliente (segundos > 0), limitado a TIMEOUT_REQUISICAO_SEGUNDOS."""
+    if valor is None or valor == "":
+        return TIMEOUT_REQUISICAO_SEGUNDOS
+    if isinstance(valor, bool) or not isinstance(valor, (int, float, str)):
+        raise _ErroRequisicao(400, "timeout inválido: informe um número de segundos")
+    try:
+        timeout = float(valor)
+    except ValueError:
+        raise _ErroRequisicao(400, "timeout inválido: informe um número de segundos")
+    if not math.isfinite(timeout) or timeout <= 0:
+        raise _ErroRequisicao(400, "timeout inválido: deve ser maior que zero")
+    return min(timeout, TIMEOUT_REQUISICAO_SEGUNDOS)
+
+def criar_manipulador(pool: PoolAnalise, hash_dicionario: str):
+    class _Manipulador(BaseHTTPRequestHandler):
+        def _responder(self, status: int, corpo: Dict):
+            dados = json.dumps(corpo, ensure_ascii=False, default=str).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(dados)))
+            self.end_headers()
+            self.wfile.write(dados)
+
+        def do_GET(self):
+            if urlparse(self.path).path != "/saude":
+                self._responder(404, {"erro": "rota inexistente"})
+                return
+            self._responder(200, {"status": "ok", "workers": pool.num_workers, "hash_dicionario": hash_dicionario})
+
+        def do_POST(self):
+            url = urlparse(self.path)
+            if url.path != "/analisar":
+                self._responder(404, {"erro": "rota inexistente"})
+                return
+            try:
+                self._responder(200, self._analisar(url))
+            except _ErroRequisicao as e:
+                self._responder(e.status, {"erro": str(e)})
+            except FuturesTimeoutError:
+                self._responder(504, {"erro": "timeout da requisição"})
+            except BrokenProcessPool:
+                self._responder(500, {"erro": "worker encerrado inesperadamente; tente de novo"})
+            except Exception as e:
+                # Nenhuma requisição fica sem resposta
+                print(f"ERRO ao atender {self.path}: {e}")
+                self._responder(500, {"erro": f"erro interno: {e}"})
+
+        def _analisar(self, url) -> Dict:
+            parametros = {k: v[-1] for k, v in parse_qs(url.query).items()}
+            try:
+                tamanho = int(self.headers.get("Content-Length") or 0)
+            except ValueError:
+                raise _ErroRequisicao(400, "Content-Length inválido")
+            if tamanho < 0:
+                raise _ErroRequisicao(400, "Content-Length inválido")
+            if tamanho > TAMANHO_MAXIMO_UPLOAD_MB * 1024 * 1024:
+                raise _ErroRequisicao(413, f"corpo maior que {TAMANHO_MAXIMO_UPLOAD_MB} MB")
+            corpo = self.rfile.read(tamanho) if tamanho else b""
+
+            dados = None
+            if (self.headers.get("Content-Type") or "").startswith("application/json"):
+                try:
+                    json_corpo = json.loads(corpo or b"{}")
+                except ValueError:
+                    raise _ErroRequisicao(400, "JSON inválido")
+                if not isinstance(json_corpo, dict):
+                    raise _ErroRequisicao(400, "o JSON deve ser um objeto, ex.: {\"caminho\": \"...\"}")
+                parametros.update(json_corpo)
+                caminho = parametros.get("caminho")
+                if not caminho:
+                    raise _ErroRequisicao(400, "informe 'caminho' ou envie o PDF no corpo")
+                if not isinstance(caminho, str):
+                    raise _ErroRequisicao(400, "'caminho' deve ser um texto")
+                if not os.path.isfile(caminho):
+                    raise _ErroRequisicao(404, f"arquivo não encontrado: {caminho}")
+            else:
+                if not corpo:
+                    raise _ErroRequisicao(400, "corpo vazio: envie o PDF ou um JSON com 'caminho'")
+                dados = corpo
+                caminho = parametros.get("nome") or "upload.pdf"
+
+            timeout = _ler_timeout(parametros.get("timeout"))
+            empresa, ano = _empresa_ano(caminho, parametros.get("empresa"), parametros.get("ano"))
+            resultado, segundos, etapas = pool.analisar(caminho, empresa, ano, dados, timeout)
+            if resultado is None:
+                if etapas.get("timeout"):
+                    raise FuturesTimeoutError()
+                raise _ErroRequisicao(422, "não foi possível extrair o texto do PDF")
+            return {"pdf": os.path.basename(caminho), "segundos": round(segundos, 3), "resultados": resultado}
+
+        def log_message(self, formato, *args):
+            print(f"[{self.log_date_time_string()}] {formato % args}")
+
+    return _Manipulador
+
+# ============================================================================
+# MAIN
+# ============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="Serviço HTTP local de análise de PDFs (pool de workers aquecido).")
+    parser.add_argument("--porta", type=int, default=PORTA_SERVICO, help="Porta em 127.0.0.1")
+    parser.add_argument("--workers", type=int, default=NUM_WORKERS_SERVICO, help="Processos de extração/contagem")
+    args = parser.parse_args()
+
+    try:
+        _, hash_dic = analise.obter_dicionario()
+        analise.obter_taxonomia()  # Compila/grava o cache antes dos workers subirem
+    except (OSError, ValueError) as e:
+        print(f"Erro ao carregar o dicionário de termos: {e}")
+        sys.exit(2)
+
+    print(f"Aquecendo {args.workers} workers...")
+    pool = PoolAnalise(args.workers)
+    try:
+        servidor = ThreadingHTTPServer((ENDERECO_SERVICO, args.porta), criar_manipulador(pool, hash_dic))
+    except OSError as e:
+        print(f"Erro ao abrir {ENDERECO_SERVICO}:{args.porta}: {e}")
+        pool.encerrar()
+        sys.exit(2)
+    servidor.daemon_threads = True
+    print(f"Serviço em http://{ENDERECO_SERVICO}:{args.porta} (POST /analisar, GET /saude). Ctrl+C para sair.")
+    try:
+        servidor.serve_forever()
+    except KeyboardInterrupt:
+        print("\nServiço encerrado.")
+    finally:
+        servidor.server_close()
+        pool.encerrar()
+
+
+if __name__ == "__main__":
+    main()
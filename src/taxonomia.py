@@ -0,0 +1,213 @@
+"""
+Taxonomia de termos com varredura única do texto.
+
+Qualquer número de grupos (cloud, automação, cibersegurança, ...) é compilado numa só
+trie de tokens (\\w+) com os termos únicos de todos os grupos; um termo que pertence a
+vários grupos é procurado uma vez. O texto normalizado é tokenizado e percorrido uma
+única vez, e as contagens por grupo saem do mesmo fluxo de ocorrências.
+
+A trie reproduz a semântica de criar_regex_termo (ocorrências não sobrepostas por termo):
+- termos longos: \\b no início e no fim (= fronteiras de token);
+- siglas curtas (até 3 letras): delimitadores explícitos antes/depois; a posição da
+  ocorrência inclui o delimitador consumido antes, como no regex;
+- espaço no termo aceita qualquer sequência de espaços/hífens; outros separadores
+  (ex.: "data-driven") precisam aparecer literalmente.
+Termos que não cabem nesse modelo continuam sendo procurados pelo regex do termo.
+"""
+
+import re
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+_RE_TOKEN = re.compile(r'\w+')
+_RE_SEPARADOR_FLEXIVEL = re.compile(r'[\s\-]+')
+
+# Mesmos delimitadores de criar_regex_termo para siglas curtas (além de espaços, \s)
+_DELIMITADORES_ANTES = set("([{.,;:!?-")
+_DELIMITADORES_DEPOIS = set(")].,;:!?-")
+
+_FLEXIVEL = None  # Chave de separador "espaço ou hífen" na trie
+
+
+def eh_sigla_curta(termo: str) -> bool:
+    """Mesma regra de criar_regex_termo: 2-3 letras (sem espaços/hífens) usam delimitadores rigorosos."""
+    termo_limpo = termo.replace(' ', '').replace('-', '')
+    return len(termo_limpo) <= 3 and termo_limpo.isalpha()
+
+
+def _tokenizar_termo(termo: str) -> Optional[List[Tuple[Optional[str], str]]]:
+    """
+    Quebra o termo em [(separador_antes, token)], com separador _FLEXIVEL para espaço.
+    Retorna None se o termo não puder ser representado na trie.
+    """
+    partes = []
+    pos = 0
+    for m in _RE_TOKEN.finditer(termo):
+        separador = termo[pos:m.start()]
+        if not partes:
+            if separador:
+                return None  # Termo começando com não-\w
+        elif separador == " ":
+            separador = _FLEXIVEL
+        elif not separador or any(c.isspace() for c in separador):
+            return None
+        partes.append((separador, m.group().lower()))
+        pos = m.end()
+    if not partes or pos != len(termo):
+        return None
+    return partes
+
+
+class Taxonomia:
+    """
+    Grupos de termos compilados para varredura única.
+    `grupos`: nome do grupo -> {"termos": [...], "siglas": [...]} (siglas são contadas no
+    texto original por quem usa a taxonomia).
+    `verificacoes`: termo -> função(pos_inicio, pos_fim, texto_normalizado) que retorna True
+    para rejeitar a ocorrência (como VERIFICACOES_CONTEXTO).
+    `criar_regex`: função termo -> regex, usada para termos fora do modelo da trie.
+    """
+
+    def __init__(
+        self,
+        grupos: Dict[str, Dict[str, List[str]]],
+        criar_regex: Callable[[str], "re.Pattern"],
+        verificacoes: Optional[Dict[str, Callable[[int, int, str], bool]]] = None,
+    ):
+        self.grupos = {
+            nome: {"termos": list(g.get("termos", [])), "siglas": list(g.get("siglas", []))}
+            for nome, g in grupos.items()
+        }
+        self.verificacoes = verificacoes or {}
+        self.termos_unicos: List[str] = list(dict.fromkeys(
+            t for g in self.grupos.values() for t in g["termos"]
+        ))
+        self.siglas_unicas: List[str] = list(dict.fromkeys(
+            s for g in self.grupos.values() for s in g["siglas"]
+        ))
+        self._trie: Dict = {}
+        self._por_regex: Dict[str, "re.Pattern"] = {}
+        for termo in self.termos_unicos:
+            partes = _tokenizar_termo(termo)
+            if partes is None:
+                self._por_regex[termo] = criar_regex(termo)
+                continue
+            no = self._trie.setdefault(partes[0][1], {"filhos": {}, "termos": []})
+            for separador, token in partes[1:]:
+                no = no["filhos"].setdefault((separador, token), {"filhos": {}, "termos": []})
+            no["termos"].append((termo, eh_sigla_curta(termo)))
+
+    def __getstate__(self):
+        # Regras de contexto são funções do chamador: não vão para o pickle (ver dicionario.py)
+        estado = self.__dict__.copy()
+        estado["verificacoes"] = {}
+        return estado
+
+    def grupos_do_termo(self, termo: str) -> List[str]:
+        """Grupos aos quais o termo (ou sigla) pertence."""
+        return [
+            nome for nome, g in self.grupos.items()
+            if termo in g["termos"] or termo in g["siglas"]
+        ]
+
+    def varrer(
+        self,
+        texto_normalizado: str,
+        perfil: Optional[Dict[str, Dict]] = None
+    ) -> Dict[str, List[Tuple[int, int]]]:
+        """
+        Percorre o texto uma vez e retorna termo -> [(inicio, fim)] das ocorrências aceitas
+        (posições no texto normalizado, iguais a m.start()/m.end() do regex do termo).
+        Se `perfil` for um dicionário, recebe termo -> {"segundos": tempo das regras de contexto
+        e do regex (termos fora da trie), "rejeitados": {regra: ocorrências rejeitadas}}.
+        """
+        texto = texto_normalizado
+        tamanho = len(texto)
+        inicios, fins, tokens = [], [], []
+        for m in _RE_TOKEN.finditer(texto):
+            inicios.append(m.start())
+            fins.append(m.end())
+            tokens.append(m.group().lower())
+        n = len(tokens)
+
+        encontrados: Dict[str, List[Tuple[int, int]]] = {}
+        ultimo_fim: Dict[str, int] = {}  # Fim do último match (aceito ou não) de cada termo
+        raiz = self._trie
+        for i in range(n):
+            no = raiz.get(tokens[i])
+            if no is None:
+                continue
+            pilha = [(no, i)]
+            while pilha:
+                no, j = pilha.pop()
+                for termo, curta in no["termos"]:
+                    inicio, fim = inicios[i], fins[j]
+                    if curta:
+                        if inicio > 0:
+                            antes = texto[inicio - 1]
+                            if antes not in _DELIMITADORES_ANTES and not antes.isspace():
+                                continue
+                            inicio -= 1  # O regex consome o delimitador
+                        if fim < tamanho and texto[fim] not in _DELIMITADORES_DEPOIS and not texto[fim].isspace():
+                            continue
+                    if inicio < ultimo_fim.get(termo, 0):
+                        continue
+                    ultimo_fim[termo] = fim
+                    verificar = self.verificacoes.get(termo)
+                    if verificar is not None:
+                        if perfil is not None:
+                            if self._verificar_com_perfil(termo, verificar, inicio, fim, texto, perfil):
+                                continue
+                        elif verificar(inicio, fim, texto):
+                            continue
+                    encontrados.setdefault(termo, []).append((inicio, fim))
+                if no["filhos"] and j + 1 < n:
+                    separador = texto[fins[j]:inicios[j + 1]]
+                    proximo = tokens[j + 1]
+                    filho = no["filhos"].get((separador, proximo))
+                    if filho is not None:
+                        pilha.append((filho, j + 1))
+                    if _RE_SEPARADOR_FLEXIVEL.fullmatch(separador):
+                        filho = no["filhos"].get((_FLEXIVEL, proximo))
+                        if filho is not None:
+                            pilha.append((filho, j + 1))
+
+        for termo, regex in self._por_regex.items():
+            verificar = self.verificacoes.get(termo)
+            if perfil is not None:
+                inicio_termo = time.perf_counter()
+                aceitos = [
+                    (m.start(), m.end()) for m in regex.finditer(texto)
+                    if verificar is None or not self._verificar_com_perfil(termo, verificar, m.start(), m.end(), texto, perfil)
+                ]
+                estatisticas = perfil.setdefault(termo, {"segundos": 0.0, "rejeitados": {}})
+                estatisticas["segundos"] += time.perf_counter() - inicio_termo
+            else:
+                aceitos = [
+                    (m.start(), m.end()) for m in regex.finditer(texto)
+                    if verificar is None or not verificar(m.start(), m.end(), texto)
+                ]
+            if aceitos:
+                encontrados[termo] = aceitos
+        return encontrados
+
+    @staticmethod
+    def _verificar_com_perfil(
+        termo: str,
+        verificar: Callable[[int, int, str], bool],
+        inicio: int,
+        fim: int,
+        texto: str,
+        perfil: Dict[str, Dict]
+    ) -> bool:
+        """Aplica a regra de contexto medindo o tempo e contando a rejeição no `perfil`."""
+        estatisticas = perfil.get(termo)
+        if estatisticas is None:
+            estatisticas = perfil[termo] = {"segundos": 0.0, "rejeitados": {}}
+        inicio_regra = time.perf_counter()
+        rejeitar = verificar(inicio, fim, texto)
+        estatisticas["segundos"] += time.perf_counter() - inicio_regra
+        if rejeitar:
+            regra = getattr(verificar, "__name__", "regra_contexto")
+            estatisticas["rejeitados"][regra] = estatisticas["rejeitados"].get(regra, 0) + 1
+        return rejeitar
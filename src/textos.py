@@ -0,0 +1,215 @@
+"""
+Análise de documentos já em texto (exportações HTML/TXT da CVM e dos sites de RI), sem
+passar pela extração do pdfplumber.
+
+Os textos seguem o mesmo caminho dos PDFs depois da extração (analisar_paginas):
+normalização, contagem por grupo, exemplos, recorrência/coocorrência conforme as
+configurações de analisar_pdfs.py. As linhas de resultado têm as mesmas colunas
+(pdf_nome/pdf_caminho recebem o identificador do documento; o documento inteiro conta
+como uma página).
+
+Uso como biblioteca:
+    for documento_id, linhas in analisar_textos([(empresa, ano, documento_id, texto), ...]):
+        ...
+    for documento_id, linhas in analisar_textos(documentos_da_pasta(pasta), num_workers=4):
+        ...
+Pela linha de comando:
+    python src/textos.py --pasta "C:\\...\\exportacoes" --saida data/analise_textos.xlsx
+"""
+
+import os
+import argparse
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from html.parser import HTMLParser
+from itertools import islice
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+import analisar_pdfs as analise
+from inventario import identificar_empresa_ano
+from resultados import TabelaResultados
+
+# ============================================================================
+# CONFIGURAÇÕES
+# ============================================================================
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+ARQUIVO_EXCEL_TEXTOS = str(_PROJECT_ROOT / "data" / "analise_textos.xlsx")
+EXTENSOES_TEXTO = (".txt", ".htm", ".html")
+TAMANHO_LOTE_TEXTOS = 32  # Documentos por tarefa enviada a um worker (amortiza o envio entre processos)
+ENCODINGS_TEXTO = ("utf-8-sig", "cp1252")  # Exportações antigas da CVM costumam vir em Windows-1252
+
+# Tags cujo conteúdo não é texto do relatório
+_TAGS_IGNORADAS = {"script", "style", "noscript", "head", "template", "svg"}
+# Tags que separam blocos de texto (viram quebra de linha, como fim de parágrafo)
+_TAGS_BLOCO = {
+    "p", "div", "br", "li", "tr", "td", "th", "table", "section", "article", "h1", "h2", "h3",
+    "h4", "h5", "h6", "ul", "ol", "blockquote", "pre", "hr", "header", "footer",
+}
+
+Documento = Tuple[str, str, str, str]  # (empresa, ano, documento_id, texto)
+
+# ============================================================================
+# LEITURA DE ARQUIVOS
+# ============================================================================
+
+class _ExtratorHTML(HTMLParser):
+    """Texto visível de um HTML, com quebra de linha entre blocos."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.partes: List[str] = []
+        self._ignorando = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in _TAGS_IGNORADAS:
+            self._ignorando += 1
+        elif tag in _TAGS_BLOCO:
+            self.partes.append("\n")
+
+    def handle_endtag(self, tag):
+        if tag in _TAGS_IGNORADAS:
+            self._ignorando = max(0, self._ignorando - 1)
+        elif tag in _TAGS_BLOCO:
+            self.partes.append("\n")
+
+    def handle_data(self, data):
+        if not self._ignorando:
+            self.partes.append(data)
+
+def texto_de_html(html: str) -> str:
+    """Texto visível do HTML (sem scripts, estilos e cabeçalho)."""
+    extrator = _ExtratorHTML()
+    extrator.feed(html)
+    extrator.close()
+    linhas = (" ".join(linha.split()) for linha in "".join(extrator.partes).split("\n"))
+    return "\n".join(linha for linha in linhas if linha)
+
+def _decodificar(dados: bytes) -> str:
+    for encoding in ENCODINGS_TEXTO:
+        try:
+            return dados.decode(encoding)
+        except UnicodeDecodeError:
+            continue
+    return dados.decode("utf-8", errors="replace")
+
+def ler_arquivo_texto(caminho: str) -> str:
+    """Texto de um arquivo .txt ou .htm/.html."""
+    with open(caminho, "rb") as f:
+        conteudo = _decodificar(f.read())
+    if caminho.lower().endswith((".htm", ".html")):
+        return texto_de_html(conteudo)
+    return conteudo
+
+def documentos_da_pasta(pasta: str) -> Iterator[Documento]:
+    """
+    Documentos .txt/.htm/.html da pasta, com empresa e ano deduzidos da estrutura
+    Empresa/[.../]Ano/arquivo (como os PDFs). Lidos sob demanda.
+    """
+    raiz = Path(pasta)
+    for caminho in sorted(raiz.rglob("*")):
+        if not caminho.is_file() or caminho.suffix.lower() not in EXTENSOES_TEXTO:
+            continue
+        identificacao = identificar_empresa_ano(caminho, raiz)
+        if identificacao is None:
+            print(f"AVISO: documento fora da estrutura esperada: {caminho}")
+            continue
+        try:
+            texto = ler_arquivo_texto(str(caminho))
+        except OSError as e:
+            print(f"\nERRO ao ler {caminho}: {e}")
+            continue
+        empresa, ano = identificacao
+        yield empresa, ano, str(caminho), texto
+
+# ============================================================================
+# ANÁLISE
+# ============================================================================
+
+def analisar_texto(empresa: str, ano: str, documento_id: str, texto: str) -> Optional[List[Dict]]:
+    """Linhas de resultado (uma por grupo) de um documento em texto; None se houver erro."""
+    try:
+        return analise.analisar_paginas([(0, texto)], 1, [], documento_id, empresa, ano)
+    except Exception as e:
+        print(f"\nERRO ao processar {documento_id}: {e}")
+        return None
+
+def _analisar_lote(lote: List[Documento]) -> List[Tuple[str, Optional[List[Dict]]]]:
+    """Analisa um lote de documentos (executado nos workers)."""
+    return [(documento_id, analisar_texto(empresa, ano, documento_id, texto)) for empresa, ano, documento_id, texto in lote]
+
+def _em_lotes(documentos: Iterable[Documento], tamanho: int) -> Iterator[List[Documento]]:
+    iterador = iter(documentos)
+    while True:
+        lote = list(islice(iterador, tamanho))
+        if not lote:
+            return
+        yield lote
+
+def analisar_textos(
+    documentos: Iterable[Documento],
+    num_workers: int = 1,
+    tamanho_lote: Optional[int] = None
+) -> Iterator[Tuple[str, Optional[List[Dict]]]]:
+    """
+    Analisa documentos (empresa, ano, documento_id, texto) em lotes e devolve, na ordem de
+    entrada, (documento_id, linhas de resultado ou None). `documentos` é consumido sob
+    demanda: com num_workers > 1, no máximo 2 x num_workers lotes ficam em memória.
+    """
+    tamanho_lote = tamanho_lote or TAMANHO_LOTE_TEXTOS
+    analise.obter_taxonomia()  # Carregado antes dos workers (que herdam ou leem do cache)
+    lotes = _em_lotes(documentos, tamanho_lote)
+    if num_workers <= 1:
+        for lote in lotes:
+            yield from _analisar_lote(lote)
+        return
+    with ProcessPoolExecutor(max_workers=num_workers) as executor:
+        fila = deque()
+        for lote in lotes:
+            fila.append(executor.submit(_analisar_lote, lote))
+            if len(fila) >= 2 * num_workers:
+                yield from fila.popleft().result()
+        while fila:
+            yield from fila.popleft().result()
+
+def analisar_arquivos_texto(
+    pasta: str,
+    num_workers: int = 1,
+    tamanho_lote: Optional[int] = None
+) -> TabelaResultados:
+    """Analisa os .txt/.htm/.html da pasta e junta as linhas numa TabelaResultados (para gerar_excel)."""
+    tabela = TabelaResultados()
+    processados = erros = 0
+    for ordem, (documento_id, linhas) in enumerate(analisar_textos(documentos_da_pasta(pasta), num_workers, tamanho_lote)):
+        if linhas is None:
+            erros += 1
+            continue
+        processados += 1
+        tabela.adicionar(linhas, ordem)
+    print(f"{processados} documentos em texto analisados ({erros} com erro).")
+    tabela.ordenar()
+    return tabela
+
+# ============================================================================
+# MAIN
+# ============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="Conta termos em exportações HTML/TXT (sem extração de PDF) e gera o Excel.")
+    parser.add_argument("--pasta", required=True, help="Pasta com Empresa/Ano/arquivo.(txt|htm|html)")
+    parser.add_argument("--saida", default=ARQUIVO_EXCEL_TEXTOS, help="Excel de saída")
+    parser.add_argument("--workers", type=int, default=analise.NUM_WORKERS_PDF, help="Processos de contagem")
+    parser.add_argument("--lote", type=int, default=TAMANHO_LOTE_TEXTOS, help="Documentos por lote")
+    args = parser.parse_args()
+
+    tabela = analisar_arquivos_texto(args.pasta, args.workers, args.lote)
+    if tabela:
+        os.makedirs(os.path.dirname(os.path.abspath(args.saida)), exist_ok=True)
+        analise.gerar_excel(tabela, args.saida)
+    else:
+        print("\nNenhum resultado encontrado.")
+
+
+if __name__ == "__main__":
+    main()